@@ -2,24 +2,36 @@
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Mapping
+from typing import AsyncIterator, Callable, Deque, Dict, Iterable, List, Mapping, Tuple
+import asyncio
+import hashlib
 import json
 import os
 import re
+import time
 import uuid
 
 from kubernetes import client as k8s_client, config as k8s_config
 
-from fastapi import APIRouter, Body, FastAPI, HTTPException, Query
+from fastapi import APIRouter, Body, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, model_validator
 
 DATA_FILE = Path(__file__).with_name("fleet-state.json")
 PORT = int(os.environ.get("PORT", "4006"))
 API_BASE_PATH = os.environ.get("FLEET_API_BASE_PATH", "/api/fleet")
 UNIVERSE_NAMESPACE = os.environ.get("UNIVERSE_NAMESPACE", "vastaya")
+ORDERS_MAX_WAIT_SECONDS = 60.0
+ORDERS_STREAM_HEARTBEAT_SECONDS = 15.0
+RENDER_CACHE_LIMIT = 256
+TELEMETRY_SAMPLES = int(os.environ.get("FLEET_TELEMETRY_SAMPLES", "360"))
+TELEMETRY_COARSE_SAMPLES = int(os.environ.get("FLEET_TELEMETRY_COARSE_SAMPLES", "360"))
+TELEMETRY_DOWNSAMPLE_FACTOR = int(os.environ.get("FLEET_TELEMETRY_DOWNSAMPLE_FACTOR", "12"))
+TELEMETRY_SUMMARY_SECONDS = 60.0
 
 
 def iso_now() -> str:
@@ -54,6 +66,18 @@ class MissionEndpoint(BaseModel):
         raise ValueError("Mission endpoint must be a string id or an object with at least an id.")
 
 
+class ClientPolicy(BaseModel):
+    """Retry and hedging policy the dispatching planet applies to a mission's docking requests."""
+
+    maxRetries: int | None = Field(default=None, ge=0, le=10, description="Retries after the first attempt.")
+    retryBudgetPercent: float | None = Field(
+        default=None, ge=0, le=100, description="Retries and hedges allowed, as a percent of the mission rps."
+    )
+    hedgePercentile: float | None = Field(
+        default=None, ge=0, lt=100, description="Hedge after this percentile of first-attempt latency; 0 disables."
+    )
+
+
 class MissionBase(BaseModel):
     """Common mission fields."""
 
@@ -62,6 +86,9 @@ class MissionBase(BaseModel):
     source: MissionEndpoint
     destination: MissionEndpoint
     escortEnabled: bool = Field(default=True, description="Flag that toggles companion traffic.")
+    seed: int | None = Field(default=None, description="Seeds pacing, cargo and docking timings for reproducible runs.")
+    replayOf: str | None = Field(default=None, description="Mission id whose recorded schedule the planet re-emits.")
+    clientPolicy: ClientPolicy | None = Field(default=None, description="Overrides the planet's retry/hedge defaults.")
 
     @model_validator(mode="after")
     def validate_route(self) -> "MissionBase":
@@ -85,6 +112,7 @@ class MissionCreate(MissionBase):
 
 class MissionList(BaseModel):
     missions: List[Mission]
+    revision: int | None = None
 
 
 class FleetState(BaseModel):
@@ -92,6 +120,116 @@ class FleetState(BaseModel):
 
     missions: List[Mission] = Field(default_factory=list)
     lastUpdatedAt: str
+    revision: int = Field(default=0, description="Monotonic counter bumped on every change.")
+
+
+class TelemetrySample(BaseModel):
+    """One planet's dispatch summary for a mission over a reporting window."""
+
+    missionId: str = Field(..., min_length=1)
+    destinationId: str | None = None
+    planetId: str | None = None
+    windowSeconds: float = Field(..., gt=0)
+    sent: int = Field(default=0, ge=0)
+    succeeded: int = Field(default=0, ge=0)
+    failed: int = Field(default=0, ge=0)
+    errors: Dict[str, int] = Field(default_factory=dict)
+    shed: int = Field(default=0, ge=0)
+    achievedRps: float = Field(default=0.0, ge=0)
+    latencyP50Ms: float = Field(default=0.0, ge=0)
+    latencyP95Ms: float = Field(default=0.0, ge=0)
+    latencyP99Ms: float = Field(default=0.0, ge=0)
+    latencyMaxMs: float = Field(default=0.0, ge=0)
+    endedAt: float | None = Field(default=None, description="Epoch seconds the window closed (set by the fleet).")
+
+
+class TelemetryBatch(BaseModel):
+    """Samples pushed by a planet in one request."""
+
+    planetId: str | None = None
+    samples: List[TelemetrySample] = Field(default_factory=list)
+
+
+class MissionTelemetry(BaseModel):
+    missionId: str
+    status: str
+    targetRps: int
+    lastReportAt: float | None = None
+    summary: TelemetrySample | None = None
+    samples: List[TelemetrySample] = Field(default_factory=list)
+    coarse: List[TelemetrySample] = Field(default_factory=list)
+
+
+def merge_samples(samples: List[TelemetrySample]) -> TelemetrySample:
+    """Fold samples into one spanning their combined window.
+
+    Counts add up and rps is recomputed over the wall-clock span, so samples
+    from several planets or destinations in the same window are not double
+    counted. p50 is the request-weighted mean; the tail percentiles keep the
+    worst value, which is conservative but never hides a spike.
+    """
+    first = samples[0]
+    started = min(sample.endedAt - sample.windowSeconds for sample in samples)
+    ended = max(sample.endedAt for sample in samples)
+    span = max(ended - started, max(sample.windowSeconds for sample in samples))
+    sent = sum(sample.sent for sample in samples)
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        for error_class, count in sample.errors.items():
+            errors[error_class] = errors.get(error_class, 0) + count
+    weight = sum(sample.sent for sample in samples if sample.sent)
+    p50 = (
+        sum(sample.latencyP50Ms * sample.sent for sample in samples) / weight
+        if weight
+        else max(sample.latencyP50Ms for sample in samples)
+    )
+    return TelemetrySample(
+        missionId=first.missionId,
+        destinationId=first.destinationId if all(s.destinationId == first.destinationId for s in samples) else None,
+        planetId=first.planetId if all(s.planetId == first.planetId for s in samples) else None,
+        windowSeconds=round(span, 3),
+        sent=sent,
+        succeeded=sum(sample.succeeded for sample in samples),
+        failed=sum(sample.failed for sample in samples),
+        errors=errors,
+        shed=sum(sample.shed for sample in samples),
+        achievedRps=round(sent / span, 3),
+        latencyP50Ms=round(p50, 3),
+        latencyP95Ms=max(sample.latencyP95Ms for sample in samples),
+        latencyP99Ms=max(sample.latencyP99Ms for sample in samples),
+        latencyMaxMs=max(sample.latencyMaxMs for sample in samples),
+        endedAt=ended,
+    )
+
+
+class TelemetryRing:
+    """Fixed-size sample history for one mission.
+
+    The newest ``size`` samples are kept as received. Samples falling off the
+    end are merged ``factor`` at a time into a second, equally bounded ring,
+    so memory stays constant while older history survives at lower
+    resolution.
+    """
+
+    def __init__(self, size: int, coarse_size: int, factor: int) -> None:
+        self.size = max(1, size)
+        self.factor = max(1, factor)
+        self.samples: Deque[TelemetrySample] = deque()
+        self.coarse: Deque[TelemetrySample] = deque(maxlen=max(1, coarse_size))
+        self._evicted: List[TelemetrySample] = []
+        self.last_report_at: float | None = None
+
+    def append(self, sample: TelemetrySample) -> None:
+        if len(self.samples) >= self.size:
+            self._evicted.append(self.samples.popleft())
+            if len(self._evicted) >= self.factor:
+                self.coarse.append(merge_samples(self._evicted))
+                self._evicted = []
+        self.samples.append(sample)
+        self.last_report_at = sample.endedAt
+
+    def recent(self, since: float) -> List[TelemetrySample]:
+        return [sample for sample in self.samples if sample.endedAt is not None and sample.endedAt > since]
 
 
 def load_state() -> FleetState:
@@ -113,14 +251,71 @@ def persist_state(state: FleetState) -> None:
 
 
 def replace_state(missions: List[Mission]) -> FleetState:
-    """Replace stored missions and persist."""
-    global fleet_state
-    fleet_state = FleetState(missions=missions, lastUpdatedAt=iso_now())
+    """Replace stored missions, bump the revision, persist and wake watchers."""
+    global fleet_state, revision_changed
+    fleet_state = FleetState(missions=missions, lastUpdatedAt=iso_now(), revision=fleet_state.revision + 1)
     persist_state(fleet_state)
+    revision_changed.set()
+    revision_changed = asyncio.Event()
     return fleet_state
 
 
+async def wait_for_revision(since: int, timeout: float) -> bool:
+    """Wait until the fleet revision differs from ``since``; False on timeout.
+
+    A ``since`` ahead of the current revision means the fleet restarted with a
+    reset state, so it counts as a change and returns at once.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while fleet_state.revision == since:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        try:
+            await asyncio.wait_for(revision_changed.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            return False
+    return True
+
+
+def render_cached(key: Tuple[str, str | None], build: Callable[[], BaseModel]) -> Tuple[str, bytes]:
+    """Serialize a read model once per revision and return ``(etag, body)``."""
+    cached = rendered_payloads.get(key)
+    if cached and cached[0] == fleet_state.revision:
+        return cached[1], cached[2]
+    body = build().model_dump_json().encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    if len(rendered_payloads) >= RENDER_CACHE_LIMIT:
+        rendered_payloads.clear()
+    rendered_payloads[key] = (fleet_state.revision, etag, body)
+    return etag, body
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Evaluate ``If-None-Match`` against a strong ETag (weak comparison, per RFC 9110)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [value.strip().removeprefix("W/") for value in header.split(",")]
+    return etag in candidates
+
+
+def conditional_json(request: Request, key: Tuple[str, str | None], build: Callable[[], BaseModel]) -> Response:
+    """Return the cached JSON body, or an empty 304 when the client already has it."""
+    etag, body = render_cached(key, build)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Fleet-Revision": str(fleet_state.revision)}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 fleet_state = load_state()
+revision_changed = asyncio.Event()
+rendered_payloads: Dict[Tuple[str, str | None], Tuple[int, str, bytes]] = {}
+telemetry_rings: Dict[str, TelemetryRing] = {}
 
 app = FastAPI(title="Fleet Mission Service")
 app.add_middleware(
@@ -141,9 +336,13 @@ def _get_mission(mission_id: str) -> Mission:
 
 
 @router.get("/missions", response_model=MissionList)
-async def list_missions() -> MissionList:
-    """Return all missions, newest first."""
-    return MissionList(missions=fleet_state.missions)
+async def list_missions(request: Request) -> Response:
+    """Return all missions, newest first (supports ``If-None-Match``)."""
+    return conditional_json(
+        request,
+        ("missions", None),
+        lambda: MissionList(missions=fleet_state.missions, revision=fleet_state.revision),
+    )
 
 
 @router.post("/missions", response_model=Mission, status_code=201)
@@ -177,6 +376,83 @@ async def terminate_mission(mission_id: str) -> Mission:
     return updated
 
 
+def _mission_telemetry(mission: Mission, since: float | None = None, history: bool = True) -> MissionTelemetry:
+    ring = telemetry_rings.get(mission.id)
+    if ring is None:
+        return MissionTelemetry(missionId=mission.id, status=mission.status, targetRps=mission.rps)
+    recent = ring.recent(time.time() - TELEMETRY_SUMMARY_SECONDS)
+    samples: Iterable[TelemetrySample] = ring.samples
+    coarse: Iterable[TelemetrySample] = ring.coarse
+    if since is not None:
+        samples = [sample for sample in samples if sample.endedAt is not None and sample.endedAt > since]
+        coarse = [sample for sample in coarse if sample.endedAt is not None and sample.endedAt > since]
+    return MissionTelemetry(
+        missionId=mission.id,
+        status=mission.status,
+        targetRps=mission.rps,
+        lastReportAt=ring.last_report_at,
+        summary=merge_samples(recent) if recent else None,
+        samples=list(samples) if history else [],
+        coarse=list(coarse) if history else [],
+    )
+
+
+@router.post("/telemetry", status_code=202)
+async def ingest_telemetry(batch: TelemetryBatch = Body(...)) -> dict:
+    """Store per-mission samples pushed by a planet and mark reporting missions as running."""
+    known = {mission.id: mission for mission in fleet_state.missions}
+    received_at = time.time()
+    accepted = 0
+    started: set[str] = set()
+    for sample in batch.samples:
+        mission = known.get(sample.missionId)
+        if mission is None:
+            continue
+        sample.endedAt = received_at
+        if sample.planetId is None:
+            sample.planetId = batch.planetId
+        ring = telemetry_rings.get(mission.id)
+        if ring is None:
+            ring = telemetry_rings[mission.id] = TelemetryRing(
+                TELEMETRY_SAMPLES, TELEMETRY_COARSE_SAMPLES, TELEMETRY_DOWNSAMPLE_FACTOR
+            )
+        ring.append(sample)
+        accepted += 1
+        if mission.status == "scheduled" and sample.sent > 0:
+            started.add(mission.id)
+    if started:
+        # Only the status flip bumps the revision; routine samples must not wake order watchers.
+        updated_at = iso_now()
+        replace_state([
+            mission.model_copy(update={"status": "running", "updatedAt": updated_at})
+            if mission.id in started
+            else mission
+            for mission in fleet_state.missions
+        ])
+    return {"accepted": accepted, "ignored": len(batch.samples) - accepted, "started": sorted(started)}
+
+
+@router.get("/telemetry")
+async def list_telemetry() -> dict:
+    """Latest summary for every mission that has reported."""
+    return {
+        "missions": [
+            _mission_telemetry(mission, history=False)
+            for mission in fleet_state.missions
+            if mission.id in telemetry_rings
+        ],
+    }
+
+
+@router.get("/missions/{mission_id}/telemetry", response_model=MissionTelemetry)
+async def get_mission_telemetry(
+    mission_id: str,
+    since: float | None = Query(default=None, description="Only samples that ended after this epoch second."),
+) -> MissionTelemetry:
+    """Return a mission's recent summary plus its raw and downsampled sample history."""
+    return _mission_telemetry(_get_mission(mission_id), since=since)
+
+
 def _planet_slug(planet_id: str) -> str:
     """Convert a planet id to a Kubernetes-safe label value (mirrors universe/kubernetes.py)."""
     slug = re.sub(r"[^a-z0-9]+", "-", planet_id.lower()).strip("-")
@@ -227,13 +503,8 @@ async def get_mission_logs(mission_id: str) -> dict:
     return {"lines": lines, "missionId": mission_id}
 
 
-@router.get("/orders", response_model=MissionList)
-async def fetch_orders(planet_id: str | None = Query(default=None, alias="planetId")) -> MissionList:
-    """
-    Provide the current set of actionable missions.
-
-    Planets poll this endpoint to determine which routes they should service.
-    """
+def _actionable_orders(planet_id: str | None) -> MissionList:
+    """Missions a planet should service at the current revision."""
     actionable = [mission for mission in fleet_state.missions if mission.status in {"scheduled", "running"}]
     if planet_id:
         actionable = [
@@ -241,7 +512,59 @@ async def fetch_orders(planet_id: str | None = Query(default=None, alias="planet
             for mission in actionable
             if mission.source.id == planet_id or mission.destination.id == planet_id
         ]
-    return MissionList(missions=actionable)
+    return MissionList(missions=actionable, revision=fleet_state.revision)
+
+
+@router.get("/orders", response_model=MissionList)
+async def fetch_orders(
+    request: Request,
+    planet_id: str | None = Query(default=None, alias="planetId"),
+    since_revision: int | None = Query(default=None, alias="sinceRevision", ge=0),
+    wait_seconds: float = Query(default=25.0, alias="waitSeconds", ge=0.0),
+) -> Response:
+    """
+    Provide the current set of actionable missions.
+
+    Planets poll this endpoint to determine which routes they should service.
+    With ``sinceRevision`` the call long-polls: it returns as soon as the fleet
+    revision moves past that value (or is found behind it, after a fleet
+    restart reset the state), or after ``waitSeconds`` with the
+    unchanged orders. Responses carry a strong ``ETag``; a matching
+    ``If-None-Match`` gets an empty 304 instead of the full mission list.
+    """
+    if since_revision is not None:
+        await wait_for_revision(since_revision, min(wait_seconds, ORDERS_MAX_WAIT_SECONDS))
+    return conditional_json(request, ("orders", planet_id), lambda: _actionable_orders(planet_id))
+
+
+async def _order_events(request: Request, planet_id: str | None, since: int | None) -> AsyncIterator[str]:
+    """Yield an SSE ``orders`` event per revision change, with heartbeats in between."""
+    last = since
+    while not await request.is_disconnected():
+        # A revision behind ``last`` means the fleet restarted; resend the orders.
+        if last is None or fleet_state.revision != last:
+            last = fleet_state.revision
+            _, body = render_cached(("orders", planet_id), lambda: _actionable_orders(planet_id))
+            yield f"id: {last}\nevent: orders\ndata: {body.decode('utf-8')}\n\n"
+        elif not await wait_for_revision(last, ORDERS_STREAM_HEARTBEAT_SECONDS):
+            yield ": keep-alive\n\n"
+
+
+@router.get("/orders/stream")
+async def stream_orders(
+    request: Request,
+    planet_id: str | None = Query(default=None, alias="planetId"),
+    since_revision: int | None = Query(default=None, alias="sinceRevision", ge=0),
+) -> StreamingResponse:
+    """Server-sent events stream of actionable missions, one event per fleet revision."""
+    last_event_id = request.headers.get("last-event-id")
+    if since_revision is None and last_event_id and last_event_id.isdigit():
+        since_revision = int(last_event_id)
+    return StreamingResponse(
+        _order_events(request, planet_id, since_revision),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 app.include_router(router)
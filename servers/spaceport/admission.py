@@ -0,0 +1,139 @@
+"""Admission control for inbound ``/dock`` requests.
+
+Without a cap every docking request is accepted, so under overload all of
+them slow down together until clients time out. The controller admits at most
+``max_concurrent`` docks, parks a bounded number of extra requests in a FIFO
+wait queue for up to ``queue_timeout_seconds`` and rejects everything else
+immediately, so the planet degrades by shedding instead of collapsing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import sys
+from typing import Any, Dict, List
+
+from metrics import LatencyHistogram, render_histogram
+from slots import SlotQueue
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed by the admission controller."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass
+class AdmissionStats:
+    admitted: int = 0
+    queued: int = 0
+    shed: Dict[str, int] = field(default_factory=dict)
+    wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class AdmissionController(SlotQueue):
+    """Fixed concurrency cap with a bounded, time-limited wait queue.
+
+    ``max_concurrent`` of 0 disables admission control entirely.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout_seconds: float) -> None:
+        super().__init__()
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.stats = AdmissionStats()
+
+    def configure(self, max_concurrent: int, max_queue: int, queue_timeout_seconds: float) -> None:
+        """Change the capacity model in place; waiters are admitted if room opened up."""
+
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.wake()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_concurrent > 0
+
+    @property
+    def capacity(self) -> int:
+        # Disabling admission lets every parked request through.
+        return self.max_concurrent if self.enabled else sys.maxsize
+
+    @property
+    def depth(self) -> int:
+        return self.queued
+
+    def _shed(self, reason: str) -> AdmissionRejected:
+        self.stats.shed[reason] = self.stats.shed.get(reason, 0) + 1
+        return AdmissionRejected(reason)
+
+    async def acquire(self) -> None:
+        """Take a docking slot or raise ``AdmissionRejected``."""
+
+        if not self.enabled:
+            self.in_flight += 1
+            return
+        if self.try_take():
+            self.stats.admitted += 1
+            self.stats.wait.record(0.0)
+            return
+        if self.queued >= self.max_queue:
+            raise self._shed("queue_full")
+        loop = asyncio.get_running_loop()
+        self.stats.queued += 1
+        started_at = loop.time()
+        try:
+            admitted = await self.wait_for_slot(self.queue_timeout_seconds)
+        finally:
+            self.stats.wait.record(loop.time() - started_at)
+        if not admitted:
+            raise self._shed("queue_timeout")
+        self.stats.admitted += 1
+
+    def release(self) -> None:
+        self.release_slot()
+
+    def describe(self) -> Dict[str, Any]:
+        stats = self.stats
+        return {
+            "enabled": self.enabled,
+            "maxConcurrent": self.max_concurrent,
+            "maxQueue": self.max_queue,
+            "queueTimeoutSeconds": self.queue_timeout_seconds,
+            "inFlight": self.in_flight,
+            "queued": self.depth,
+            "admitted": stats.admitted,
+            "delayed": stats.queued,
+            "shed": dict(stats.shed),
+            "waitP50Seconds": stats.wait.quantile(0.5),
+            "waitP99Seconds": stats.wait.quantile(0.99),
+        }
+
+    def render(self) -> str:
+        """Render admission gauges, counters and the wait histogram in the Prometheus text format."""
+
+        stats = self.stats
+        lines: List[str] = [
+            "# HELP spaceport_dock_admission_limit Maximum concurrent docks admitted (0 means unlimited).",
+            "# TYPE spaceport_dock_admission_limit gauge",
+            f"spaceport_dock_admission_limit {self.max_concurrent}",
+            "# HELP spaceport_dock_admission_queue_depth Docking requests waiting for a slot.",
+            "# TYPE spaceport_dock_admission_queue_depth gauge",
+            f"spaceport_dock_admission_queue_depth {self.depth}",
+            "# HELP spaceport_dock_admission_admitted_total Docking requests admitted.",
+            "# TYPE spaceport_dock_admission_admitted_total counter",
+            f"spaceport_dock_admission_admitted_total {stats.admitted}",
+            "# HELP spaceport_dock_admission_shed_total Docking requests rejected with 429 by reason.",
+            "# TYPE spaceport_dock_admission_shed_total counter",
+        ]
+        for reason in ("queue_full", "queue_timeout"):
+            lines.append(f'spaceport_dock_admission_shed_total{{reason="{reason}"}} {stats.shed.get(reason, 0)}')
+        lines.append("# HELP spaceport_dock_admission_wait_seconds Time docking requests waited for a slot.")
+        lines.append("# TYPE spaceport_dock_admission_wait_seconds histogram")
+        render_histogram(lines, "spaceport_dock_admission_wait_seconds", stats.wait)
+        return "\n".join(lines) + "\n"
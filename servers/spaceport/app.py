@@ -4,25 +4,83 @@ The service exposes a FastAPI application that reflects the environment-based
 configuration used by the Spaceport UI:
 - NEBULA_*  variables introduce global request latency
 - CHAOS_*   variables inject random errors
+- Overrides from a watched file or ``PUT /config`` are swapped in at runtime
 - The fleet API is queried to surface the currently scheduled missions
 """
 
 from __future__ import annotations
 
 import asyncio
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+import itertools
 import logging
 import os
 import random
 import re
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
 import httpx
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+
+from admission import AdmissionController, AdmissionRejected
+from arrivals import ARRIVAL_PROCESSES, build_arrival_schedule
+from bandwidth import (
+    CARGO_CONTENT_TYPE,
+    COMPRESSION_CODECS,
+    MANIFEST_HEADER,
+    BodyCounters,
+    BodyTooLarge,
+    CorruptBody,
+    PayloadConfigError,
+    PayloadSizer,
+    available_codec,
+    consume_body,
+    decode_manifest_header,
+    encode_manifest_header,
+    stream_body,
+)
+from breaker import BreakerRegistry, BreakerSettings, CircuitBreaker, CircuitOpen
+from callgraph import (
+    GRAPH_MODES,
+    DownstreamFailed,
+    HopContext,
+    describe_call_graph,
+    downstream_planets,
+    hop_context,
+    parse_call_graph,
+    plan_hops,
+)
+from client_policy import ClientPolicy, ClientPolicySettings, is_retryable
+from deadlines import DEADLINE_HEADER, DeadlineStats, DockAbandoned, DockGuard, arrival_time, parse_deadline
+from drain import DockCancelled, DrainController
+from docking_queue import DockingQueueFull, DockingWorkQueue
+from escorts import ESCORT_KINDS, EscortStream, describe_escort_streams, parse_escort_streams
+from faults import LATENCY_DISTRIBUTIONS, FaultInjectionMiddleware, FaultPlan, FaultSettings
+from fleet_client import FleetResponseCache, poll_delay
+from limiter import (
+    TARGET_TIMEOUT_FRACTION,
+    AdaptiveConcurrencyLimiter,
+    LimiterRegistry,
+    LimiterSettings,
+    LoadShed,
+    is_overload_signal,
+)
+from live_config import ConfigFileWatcher, normalize_overrides
+from logs import DispatchFailureLog, install_queue_logging
+from metrics import DispatchStats, MetricsRegistry, classify_dispatch_error
+from payloads import JSON_HEADERS, DockingPayloadFactory
+from pools import CONNECTION_POLICIES, ConnectionPoolRegistry, PoolSettings
+from replay import ScheduleRecorder, load_schedule, mission_seed, schedule_path, seeded_rng
+from results import RESULT_FORMATS, RunResults, build_npz, iter_csv, iter_gzip
+from telemetry import MissionTelemetry
+from work_profiles import UNIT_SECONDS, WORK_EXECUTORS, WORK_PROFILES, DockWorkPool, WorkSettings
+from workers import LoadWorkerPool
 
 
 def iso_now() -> str:
@@ -31,19 +89,25 @@ def iso_now() -> str:
     return datetime.utcnow().isoformat()
 
 
-def env_bool(name: str, default: bool = False) -> bool:
+def env_bool(name: str, default: bool = False, environ: Optional[Mapping[str, str]] = None) -> bool:
     """Parse an environment variable into a boolean."""
 
-    value = os.environ.get(name)
+    value = (os.environ if environ is None else environ).get(name)
     if value is None:
         return default
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def env_int(name: str, default: int = 0, minimum: Optional[int] = None, maximum: Optional[int] = None) -> int:
+def env_int(
+    name: str,
+    default: int = 0,
+    minimum: Optional[int] = None,
+    maximum: Optional[int] = None,
+    environ: Optional[Mapping[str, str]] = None,
+) -> int:
     """Parse an environment variable into an integer within optional bounds."""
 
-    raw = os.environ.get(name)
+    raw = (os.environ if environ is None else environ).get(name)
     try:
         value = int(raw) if raw is not None else default
     except ValueError:
@@ -55,10 +119,16 @@ def env_int(name: str, default: int = 0, minimum: Optional[int] = None, maximum:
     return value
 
 
-def env_float(name: str, default: float = 0.0, minimum: Optional[float] = None, maximum: Optional[float] = None) -> float:
+def env_float(
+    name: str,
+    default: float = 0.0,
+    minimum: Optional[float] = None,
+    maximum: Optional[float] = None,
+    environ: Optional[Mapping[str, str]] = None,
+) -> float:
     """Parse an environment variable into a float within optional bounds."""
 
-    raw = os.environ.get(name)
+    raw = (os.environ if environ is None else environ).get(name)
     try:
         value = float(raw) if raw is not None else default
     except ValueError:
@@ -76,49 +146,367 @@ class UniverseConfig:
 
     cross_galaxy_enabled: bool = True
     cross_galaxy_mode: str = "gateway"
+    cross_galaxy_call_graph: str = ""
+    cross_galaxy_max_depth: int = 4
+    cross_galaxy_deadline_ms: int = 10000
     wormholes_enabled: bool = True
     wormhole_instability: int = 0
     nebula_enabled: bool = False
     nebula_density_ms: int = 0
+    nebula_distribution: str = "fixed"
+    nebula_spread_ms: int = 0
+    nebula_sigma: float = 0.5
+    nebula_pareto_alpha: float = 1.5
+    nebula_slow_density_ms: int = 0
+    nebula_slow_fraction: float = 0.05
+    nebula_max_density_ms: int = 60000
     shields_enabled: bool = True
     black_hole_enabled: bool = True
     chaos_experiments_enabled: bool = False
     chaos_failure_rate: float = 0.18
+    chaos_unavailable_rate: float = 0.0
+    chaos_reset_rate: float = 0.0
+    chaos_hang_rate: float = 0.0
+    chaos_trickle_rate: float = 0.0
+    chaos_truncated_rate: float = 0.0
+    chaos_large_rate: float = 0.0
+    chaos_retry_after_seconds: int = 1
+    chaos_hang_seconds: float = 300.0
+    chaos_trickle_byte_delay_ms: int = 50
+    chaos_large_bytes: int = 1048576
     fleet_api_base_url: str = "http://localhost:4006/api/fleet"
     fleet_timeout_seconds: float = 5.0
     planet_identifier: Optional[str] = None
     planet_service_template: str = "http://{planet}-service"
     mission_poll_interval_seconds: float = 5.0
     mission_dispatch_timeout_seconds: float = 5.0
+    mission_stop_timeout_seconds: float = 5.0
+    mission_scheduler_mode: str = "burst"
+    mission_arrival_process: str = "constant"
+    mission_pool_max_connections: int = 100
+    mission_pool_max_keepalive: int = 20
+    mission_pool_keepalive_expiry_seconds: float = 5.0
+    mission_pool_timeout_seconds: float = 5.0
+    mission_connection_policy: str = "keep-alive"
+    mission_worker_processes: int = 0
+    mission_worker_split_rps: int = 200
+    mission_payload_ring_size: int = 64
+    mission_limiter_enabled: bool = False
+    mission_limiter_initial_limit: int = 20
+    mission_limiter_min_limit: int = 1
+    mission_limiter_max_limit: int = 100
+    mission_limiter_latency_target_ms: int = 0
+    mission_limiter_max_queue: int = 100
+    mission_limiter_queue_timeout_seconds: float = 1.0
+    mission_breaker_enabled: bool = False
+    mission_breaker_error_rate: float = 0.5
+    mission_breaker_min_requests: int = 20
+    mission_breaker_window_seconds: int = 10
+    mission_breaker_consecutive_timeouts: int = 5
+    mission_breaker_open_seconds: float = 5.0
+    mission_breaker_half_open_percent: float = 10.0
+    mission_breaker_half_open_step: int = 10
+    mission_orders_watch: str = "long-poll"
+    mission_long_poll_seconds: float = 25.0
+    fleet_backoff_max_seconds: float = 60.0
+    fleet_poll_jitter: float = 0.2
+    fleet_stale_max_seconds: float = 300.0
+    dock_mode: str = "sync"
+    dock_queue_capacity: int = 1000
+    dock_queue_workers: int = 64
+    dock_ticket_retention: int = 10000
+    dock_max_concurrent: int = 0
+    dock_admission_max_waiters: int = 100
+    dock_admission_wait_seconds: float = 1.0
+    dock_retry_after_seconds: int = 1
+    dock_deadline_enforced: bool = True
+    drain_timeout_seconds: float = 20.0
+    dock_work_profile: str = "sleep"
+    dock_work_units: int = 50
+    dock_work_memory_bytes: int = 0
+    dock_work_executor: str = "process"
+    dock_work_workers: int = 0
+    log_queue_size: int = 10000
+    dispatch_failure_log_interval_seconds: float = 10.0
+    dock_log_sample_rate: float = 0.01
+    config_path: Optional[str] = None
+    config_watch_seconds: float = 1.0
+    mission_telemetry_interval_seconds: float = 5.0
+    results_retention_seconds: int = 3600
+    results_max_series: int = 256
+    mission_seed: Optional[int] = None
+    mission_record_dir: Optional[str] = None
+    mission_escort_streams: str = ""
+    escort_cargo_bytes: int = 65536
+    cargo_max_bytes: int = 16777216
+    mission_payload_size: str = ""
+    mission_payload_compression: str = "none"
+    mission_payload_chunk_bytes: int = 65536
+    mission_payload_max_bytes: int = 67108864
+    dock_max_body_bytes: int = 268435456
+    cargo_response_compression: str = "none"
+    mission_retry_max: int = 0
+    mission_retry_backoff_ms: int = 50
+    mission_retry_backoff_max_ms: int = 1000
+    mission_retry_budget_percent: float = 10.0
+    mission_hedge_percentile: float = 0.0
+    mission_hedge_min_delay_ms: int = 10
 
     @classmethod
-    def from_env(cls) -> "UniverseConfig":
-        """Build a config object from the current environment."""
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "UniverseConfig":
+        """Build a config object from the current environment (or ``environ``)."""
 
-        mode = os.environ.get("CROSS_GALAXY_MODE", "gateway").strip().lower() or "gateway"
-        if mode not in {"gateway", "mirrored", "federated"}:
+        environ = os.environ if environ is None else environ
+        mode = environ.get("CROSS_GALAXY_MODE", "gateway").strip().lower() or "gateway"
+        if mode not in GRAPH_MODES:
             mode = "gateway"
-        nebula_density_ms = env_int("NEBULA_DENSITY", default=0, minimum=0)
+        nebula_density_ms = env_int("NEBULA_DENSITY", default=0, minimum=0, environ=environ)
+        nebula_distribution = environ.get("NEBULA_DISTRIBUTION", "fixed").strip().lower() or "fixed"
+        if nebula_distribution not in LATENCY_DISTRIBUTIONS:
+            nebula_distribution = "fixed"
+        scheduler_mode = environ.get("MISSION_SCHEDULER_MODE", "burst").strip().lower() or "burst"
+        if scheduler_mode not in {"burst", "open-loop"}:
+            scheduler_mode = "burst"
+        arrival_process = environ.get("MISSION_ARRIVAL_PROCESS", "constant").strip().lower() or "constant"
+        if arrival_process not in ARRIVAL_PROCESSES:
+            arrival_process = "constant"
+        dock_mode = environ.get("DOCK_MODE", "sync").strip().lower() or "sync"
+        if dock_mode not in {"sync", "async"}:
+            dock_mode = "sync"
+        work_profile = environ.get("DOCK_WORK_PROFILE", "sleep").strip().lower() or "sleep"
+        if work_profile not in WORK_PROFILES:
+            work_profile = "sleep"
+        work_executor = environ.get("DOCK_WORK_EXECUTOR", "process").strip().lower() or "process"
+        if work_executor not in WORK_EXECUTORS:
+            work_executor = "process"
+        orders_watch = environ.get("MISSION_ORDERS_WATCH", "long-poll").strip().lower() or "long-poll"
+        if orders_watch not in {"poll", "long-poll"}:
+            orders_watch = "long-poll"
+        connection_policy = environ.get("MISSION_CONNECTION_POLICY", "keep-alive").strip().lower() or "keep-alive"
+        if connection_policy not in CONNECTION_POLICIES:
+            connection_policy = "keep-alive"
+        payload_size = environ.get("MISSION_PAYLOAD_SIZE", "").strip().lower()
+        if payload_size:
+            try:
+                PayloadSizer(payload_size, max_bytes=1)
+            except PayloadConfigError:
+                payload_size = ""
+        seed = environ.get("MISSION_SEED", "").strip()
+        try:
+            mission_seed: Optional[int] = int(seed) if seed else None
+        except ValueError:
+            mission_seed = None
         return cls(
-            cross_galaxy_enabled=env_bool("CROSS_GALAXY_ENABLED", default=True),
+            cross_galaxy_enabled=env_bool("CROSS_GALAXY_ENABLED", default=True, environ=environ),
             cross_galaxy_mode=mode,
-            wormholes_enabled=env_bool("WORMHOLES_ENABLED", default=True),
-            wormhole_instability=env_int("WORMHOLE_INSTABILITY", default=0, minimum=0, maximum=100),
-            nebula_enabled=env_bool("NEBULA_ENABLED", default=False),
+            cross_galaxy_call_graph=describe_call_graph(parse_call_graph(environ.get("CROSS_GALAXY_CALL_GRAPH", ""))),
+            cross_galaxy_max_depth=env_int("CROSS_GALAXY_MAX_DEPTH", default=4, minimum=0, maximum=32, environ=environ),
+            cross_galaxy_deadline_ms=env_int(
+                "CROSS_GALAXY_DEADLINE_MS", default=10000, minimum=1, maximum=600000, environ=environ
+            ),
+            wormholes_enabled=env_bool("WORMHOLES_ENABLED", default=True, environ=environ),
+            wormhole_instability=env_int("WORMHOLE_INSTABILITY", default=0, minimum=0, maximum=100, environ=environ),
+            nebula_enabled=env_bool("NEBULA_ENABLED", default=False, environ=environ),
             nebula_density_ms=nebula_density_ms,
-            shields_enabled=env_bool("SHIELDS_ENABLED", default=True),
-            black_hole_enabled=env_bool("BLACK_HOLE_ENABLED", default=False),
-            chaos_experiments_enabled=env_bool("CHAOS_EXPERIMENTS_ENABLED", default=False),
-            chaos_failure_rate=env_float("CHAOS_FAILURE_RATE", default=0.18, minimum=0.0, maximum=1.0),
-            fleet_api_base_url=os.environ.get("FLEET_API_BASE_URL", "http://localhost:4006/api/fleet"),
-            fleet_timeout_seconds=env_float("FLEET_API_TIMEOUT_SECONDS", default=5.0, minimum=0.1, maximum=30.0),
-            planet_identifier=os.environ.get("PLANET_ID"),
-            planet_service_template=os.environ.get("PLANET_SERVICE_TEMPLATE", "http://{planet}-service"),
+            nebula_distribution=nebula_distribution,
+            nebula_spread_ms=env_int("NEBULA_SPREAD", default=0, minimum=0, environ=environ),
+            nebula_sigma=env_float("NEBULA_SIGMA", default=0.5, minimum=0.0, maximum=5.0, environ=environ),
+            nebula_pareto_alpha=env_float(
+                "NEBULA_PARETO_ALPHA", default=1.5, minimum=0.1, maximum=10.0, environ=environ
+            ),
+            nebula_slow_density_ms=env_int("NEBULA_SLOW_DENSITY", default=0, minimum=0, environ=environ),
+            nebula_slow_fraction=env_float(
+                "NEBULA_SLOW_FRACTION", default=0.05, minimum=0.0, maximum=1.0, environ=environ
+            ),
+            nebula_max_density_ms=env_int("NEBULA_MAX_DENSITY", default=60000, minimum=0, environ=environ),
+            shields_enabled=env_bool("SHIELDS_ENABLED", default=True, environ=environ),
+            black_hole_enabled=env_bool("BLACK_HOLE_ENABLED", default=False, environ=environ),
+            chaos_experiments_enabled=env_bool("CHAOS_EXPERIMENTS_ENABLED", default=False, environ=environ),
+            chaos_failure_rate=env_float("CHAOS_FAILURE_RATE", default=0.18, minimum=0.0, maximum=1.0, environ=environ),
+            chaos_unavailable_rate=env_float(
+                "CHAOS_UNAVAILABLE_RATE", default=0.0, minimum=0.0, maximum=1.0, environ=environ
+            ),
+            chaos_reset_rate=env_float("CHAOS_RESET_RATE", default=0.0, minimum=0.0, maximum=1.0, environ=environ),
+            chaos_hang_rate=env_float("CHAOS_HANG_RATE", default=0.0, minimum=0.0, maximum=1.0, environ=environ),
+            chaos_trickle_rate=env_float("CHAOS_TRICKLE_RATE", default=0.0, minimum=0.0, maximum=1.0, environ=environ),
+            chaos_truncated_rate=env_float(
+                "CHAOS_TRUNCATED_RATE", default=0.0, minimum=0.0, maximum=1.0, environ=environ
+            ),
+            chaos_large_rate=env_float("CHAOS_LARGE_RATE", default=0.0, minimum=0.0, maximum=1.0, environ=environ),
+            chaos_retry_after_seconds=env_int(
+                "CHAOS_RETRY_AFTER_SECONDS", default=1, minimum=0, maximum=3600, environ=environ
+            ),
+            chaos_hang_seconds=env_float(
+                "CHAOS_HANG_SECONDS", default=300.0, minimum=0.0, maximum=3600.0, environ=environ
+            ),
+            chaos_trickle_byte_delay_ms=env_int(
+                "CHAOS_TRICKLE_BYTE_DELAY_MS", default=50, minimum=0, maximum=60000, environ=environ
+            ),
+            chaos_large_bytes=env_int(
+                "CHAOS_LARGE_BYTES", default=1048576, minimum=0, maximum=1073741824, environ=environ
+            ),
+            fleet_api_base_url=environ.get("FLEET_API_BASE_URL", "http://localhost:4006/api/fleet"),
+            fleet_timeout_seconds=env_float(
+                "FLEET_API_TIMEOUT_SECONDS", default=5.0, minimum=0.1, maximum=30.0, environ=environ
+            ),
+            planet_identifier=environ.get("PLANET_ID"),
+            planet_service_template=environ.get("PLANET_SERVICE_TEMPLATE", "http://{planet}-service"),
             mission_poll_interval_seconds=env_float(
-                "MISSION_POLL_INTERVAL_SECONDS", default=5.0, minimum=0.5, maximum=120.0
+                "MISSION_POLL_INTERVAL_SECONDS", default=5.0, minimum=0.5, maximum=120.0, environ=environ
             ),
             mission_dispatch_timeout_seconds=env_float(
-                "MISSION_DISPATCH_TIMEOUT_SECONDS", default=5.0, minimum=0.5, maximum=60.0
+                "MISSION_DISPATCH_TIMEOUT_SECONDS", default=5.0, minimum=0.5, maximum=60.0, environ=environ
+            ),
+            mission_stop_timeout_seconds=env_float(
+                "MISSION_STOP_TIMEOUT_SECONDS", default=5.0, minimum=0.0, maximum=300.0, environ=environ
+            ),
+            mission_scheduler_mode=scheduler_mode,
+            mission_arrival_process=arrival_process,
+            mission_pool_max_connections=env_int(
+                "MISSION_POOL_MAX_CONNECTIONS", default=100, minimum=1, maximum=10000, environ=environ
+            ),
+            mission_pool_max_keepalive=env_int(
+                "MISSION_POOL_MAX_KEEPALIVE", default=20, minimum=0, maximum=10000, environ=environ
+            ),
+            mission_pool_keepalive_expiry_seconds=env_float(
+                "MISSION_POOL_KEEPALIVE_EXPIRY_SECONDS", default=5.0, minimum=0.0, maximum=600.0, environ=environ
+            ),
+            mission_pool_timeout_seconds=env_float(
+                "MISSION_POOL_TIMEOUT_SECONDS", default=5.0, minimum=0.01, maximum=60.0, environ=environ
+            ),
+            mission_connection_policy=connection_policy,
+            mission_worker_processes=env_int(
+                "MISSION_WORKER_PROCESSES", default=0, minimum=0, maximum=64, environ=environ
+            ),
+            mission_worker_split_rps=env_int("MISSION_WORKER_SPLIT_RPS", default=200, minimum=1, environ=environ),
+            mission_payload_ring_size=env_int(
+                "MISSION_PAYLOAD_RING_SIZE", default=64, minimum=1, maximum=4096, environ=environ
+            ),
+            mission_limiter_enabled=env_bool("MISSION_LIMITER_ENABLED", default=False, environ=environ),
+            mission_limiter_initial_limit=env_int(
+                "MISSION_LIMITER_INITIAL_LIMIT", default=20, minimum=1, environ=environ
+            ),
+            mission_limiter_min_limit=env_int("MISSION_LIMITER_MIN_LIMIT", default=1, minimum=1, environ=environ),
+            mission_limiter_max_limit=env_int("MISSION_LIMITER_MAX_LIMIT", default=100, minimum=1, environ=environ),
+            mission_limiter_latency_target_ms=env_int(
+                "MISSION_LIMITER_LATENCY_TARGET_MS", default=0, minimum=0, environ=environ
+            ),
+            mission_limiter_max_queue=env_int("MISSION_LIMITER_MAX_QUEUE", default=100, minimum=0, environ=environ),
+            mission_limiter_queue_timeout_seconds=env_float(
+                "MISSION_LIMITER_QUEUE_TIMEOUT_SECONDS", default=1.0, minimum=0.0, maximum=60.0, environ=environ
+            ),
+            mission_breaker_enabled=env_bool("MISSION_BREAKER_ENABLED", default=False, environ=environ),
+            mission_breaker_error_rate=env_float(
+                "MISSION_BREAKER_ERROR_RATE", default=0.5, minimum=0.01, maximum=1.0, environ=environ
+            ),
+            mission_breaker_min_requests=env_int(
+                "MISSION_BREAKER_MIN_REQUESTS", default=20, minimum=1, maximum=100000, environ=environ
+            ),
+            mission_breaker_window_seconds=env_int(
+                "MISSION_BREAKER_WINDOW_SECONDS", default=10, minimum=1, maximum=600, environ=environ
+            ),
+            mission_breaker_consecutive_timeouts=env_int(
+                "MISSION_BREAKER_CONSECUTIVE_TIMEOUTS", default=5, minimum=0, maximum=10000, environ=environ
+            ),
+            mission_breaker_open_seconds=env_float(
+                "MISSION_BREAKER_OPEN_SECONDS", default=5.0, minimum=0.1, maximum=600.0, environ=environ
+            ),
+            mission_breaker_half_open_percent=env_float(
+                "MISSION_BREAKER_HALF_OPEN_PERCENT", default=10.0, minimum=1.0, maximum=100.0, environ=environ
+            ),
+            mission_breaker_half_open_step=env_int(
+                "MISSION_BREAKER_HALF_OPEN_STEP", default=10, minimum=1, maximum=10000, environ=environ
+            ),
+            mission_orders_watch=orders_watch,
+            mission_long_poll_seconds=env_float(
+                "MISSION_LONG_POLL_SECONDS", default=25.0, minimum=1.0, maximum=60.0, environ=environ
+            ),
+            fleet_backoff_max_seconds=env_float(
+                "FLEET_BACKOFF_MAX_SECONDS", default=60.0, minimum=0.5, maximum=600.0, environ=environ
+            ),
+            fleet_poll_jitter=env_float("FLEET_POLL_JITTER", default=0.2, minimum=0.0, maximum=1.0, environ=environ),
+            fleet_stale_max_seconds=env_float(
+                "FLEET_STALE_MAX_SECONDS", default=300.0, minimum=0.0, maximum=86400.0, environ=environ
+            ),
+            dock_mode=dock_mode,
+            dock_queue_capacity=env_int("DOCK_QUEUE_CAPACITY", default=1000, minimum=1, environ=environ),
+            dock_queue_workers=env_int("DOCK_QUEUE_WORKERS", default=64, minimum=1, maximum=10000, environ=environ),
+            dock_ticket_retention=env_int("DOCK_TICKET_RETENTION", default=10000, minimum=1, environ=environ),
+            dock_max_concurrent=env_int("DOCK_MAX_CONCURRENT", default=0, minimum=0, environ=environ),
+            dock_admission_max_waiters=env_int("DOCK_ADMISSION_MAX_WAITERS", default=100, minimum=0, environ=environ),
+            dock_admission_wait_seconds=env_float(
+                "DOCK_ADMISSION_WAIT_SECONDS", default=1.0, minimum=0.0, maximum=300.0, environ=environ
+            ),
+            dock_retry_after_seconds=env_int(
+                "DOCK_RETRY_AFTER_SECONDS", default=1, minimum=0, maximum=3600, environ=environ
+            ),
+            dock_deadline_enforced=env_bool("DOCK_DEADLINE_ENFORCED", default=True, environ=environ),
+            drain_timeout_seconds=env_float(
+                "DRAIN_TIMEOUT_SECONDS", default=20.0, minimum=0.0, maximum=3600.0, environ=environ
+            ),
+            dock_work_profile=work_profile,
+            dock_work_units=env_int("DOCK_WORK_UNITS", default=50, minimum=0, maximum=600000, environ=environ),
+            dock_work_memory_bytes=env_int(
+                "DOCK_WORK_MEMORY_BYTES", default=0, minimum=0, maximum=1 << 30, environ=environ
+            ),
+            dock_work_executor=work_executor,
+            dock_work_workers=env_int("DOCK_WORK_WORKERS", default=0, minimum=0, maximum=256, environ=environ),
+            log_queue_size=env_int("LOG_QUEUE_SIZE", default=10000, minimum=0, environ=environ),
+            dispatch_failure_log_interval_seconds=env_float(
+                "DISPATCH_FAILURE_LOG_INTERVAL_SECONDS", default=10.0, minimum=0.0, maximum=3600.0, environ=environ
+            ),
+            dock_log_sample_rate=env_float(
+                "DOCK_LOG_SAMPLE_RATE", default=0.01, minimum=0.0, maximum=1.0, environ=environ
+            ),
+            mission_telemetry_interval_seconds=env_float(
+                "MISSION_TELEMETRY_INTERVAL_SECONDS", default=5.0, minimum=0.0, maximum=300.0, environ=environ
+            ),
+            results_retention_seconds=env_int(
+                "RESULTS_RETENTION_SECONDS", default=3600, minimum=0, maximum=604800, environ=environ
+            ),
+            results_max_series=env_int("RESULTS_MAX_SERIES", default=256, minimum=1, maximum=100000, environ=environ),
+            mission_seed=mission_seed,
+            mission_record_dir=environ.get("MISSION_RECORD_DIR") or None,
+            mission_escort_streams=describe_escort_streams(
+                parse_escort_streams(environ.get("MISSION_ESCORT_STREAMS", ""))
+            ),
+            escort_cargo_bytes=env_int(
+                "ESCORT_CARGO_BYTES", default=65536, minimum=0, maximum=1073741824, environ=environ
+            ),
+            cargo_max_bytes=env_int(
+                "CARGO_MAX_BYTES", default=16777216, minimum=0, maximum=1073741824, environ=environ
+            ),
+            mission_payload_size=payload_size,
+            mission_payload_compression=available_codec(environ.get("MISSION_PAYLOAD_COMPRESSION", "none")),
+            mission_payload_chunk_bytes=env_int(
+                "MISSION_PAYLOAD_CHUNK_BYTES", default=65536, minimum=1024, maximum=16777216, environ=environ
+            ),
+            mission_payload_max_bytes=env_int(
+                "MISSION_PAYLOAD_MAX_BYTES", default=67108864, minimum=0, maximum=1073741824, environ=environ
+            ),
+            dock_max_body_bytes=env_int(
+                "DOCK_MAX_BODY_BYTES", default=268435456, minimum=0, maximum=17179869184, environ=environ
+            ),
+            cargo_response_compression=available_codec(environ.get("CARGO_RESPONSE_COMPRESSION", "none")),
+            mission_retry_max=env_int("MISSION_RETRY_MAX", default=0, minimum=0, maximum=10, environ=environ),
+            mission_retry_backoff_ms=env_int(
+                "MISSION_RETRY_BACKOFF_MS", default=50, minimum=0, maximum=60000, environ=environ
+            ),
+            mission_retry_backoff_max_ms=env_int(
+                "MISSION_RETRY_BACKOFF_MAX_MS", default=1000, minimum=0, maximum=600000, environ=environ
+            ),
+            mission_retry_budget_percent=env_float(
+                "MISSION_RETRY_BUDGET_PERCENT", default=10.0, minimum=0.0, maximum=100.0, environ=environ
+            ),
+            mission_hedge_percentile=env_float(
+                "MISSION_HEDGE_PERCENTILE", default=0.0, minimum=0.0, maximum=99.9, environ=environ
+            ),
+            mission_hedge_min_delay_ms=env_int(
+                "MISSION_HEDGE_MIN_DELAY_MS", default=10, minimum=0, maximum=60000, environ=environ
+            ),
+            config_path=environ.get("SPACEPORT_CONFIG_PATH") or None,
+            config_watch_seconds=env_float(
+                "SPACEPORT_CONFIG_WATCH_SECONDS", default=1.0, minimum=0.1, maximum=300.0, environ=environ
             ),
         )
 
@@ -129,37 +517,269 @@ class UniverseConfig:
         return {
             "crossGalaxyEnabled": data["cross_galaxy_enabled"],
             "crossGalaxyMode": data["cross_galaxy_mode"],
+            "crossGalaxyCallGraph": data["cross_galaxy_call_graph"] or None,
+            "crossGalaxyMaxDepth": data["cross_galaxy_max_depth"],
+            "crossGalaxyDeadlineMs": data["cross_galaxy_deadline_ms"],
             "wormholesEnabled": data["wormholes_enabled"],
             "wormholeInstability": data["wormhole_instability"],
             "nebulaEnabled": data["nebula_enabled"],
             "nebulaDensity": data["nebula_density_ms"],
+            "nebulaDistribution": data["nebula_distribution"],
+            "nebulaSpread": data["nebula_spread_ms"],
+            "nebulaSigma": data["nebula_sigma"],
+            "nebulaParetoAlpha": data["nebula_pareto_alpha"],
+            "nebulaSlowDensity": data["nebula_slow_density_ms"],
+            "nebulaSlowFraction": data["nebula_slow_fraction"],
+            "nebulaMaxDensity": data["nebula_max_density_ms"],
             "shieldsEnabled": data["shields_enabled"],
             "blackHoleEnabled": data["black_hole_enabled"],
             "chaosExperimentsEnabled": data["chaos_experiments_enabled"],
             "chaosFailureRate": data["chaos_failure_rate"],
+            "chaosUnavailableRate": data["chaos_unavailable_rate"],
+            "chaosResetRate": data["chaos_reset_rate"],
+            "chaosHangRate": data["chaos_hang_rate"],
+            "chaosTrickleRate": data["chaos_trickle_rate"],
+            "chaosTruncatedRate": data["chaos_truncated_rate"],
+            "chaosLargeRate": data["chaos_large_rate"],
+            "chaosRetryAfterSeconds": data["chaos_retry_after_seconds"],
+            "chaosHangSeconds": data["chaos_hang_seconds"],
+            "chaosTrickleByteDelayMs": data["chaos_trickle_byte_delay_ms"],
+            "chaosLargeBytes": data["chaos_large_bytes"],
             "fleetApiBaseUrl": data["fleet_api_base_url"],
             "fleetTimeoutSeconds": data["fleet_timeout_seconds"],
             "planetId": data["planet_identifier"],
             "planetServiceTemplate": data["planet_service_template"],
             "missionPollIntervalSeconds": data["mission_poll_interval_seconds"],
             "missionDispatchTimeoutSeconds": data["mission_dispatch_timeout_seconds"],
+            "missionStopTimeoutSeconds": data["mission_stop_timeout_seconds"],
+            "missionSchedulerMode": data["mission_scheduler_mode"],
+            "missionArrivalProcess": data["mission_arrival_process"],
+            "missionPoolMaxConnections": data["mission_pool_max_connections"],
+            "missionPoolMaxKeepalive": data["mission_pool_max_keepalive"],
+            "missionPoolKeepaliveExpirySeconds": data["mission_pool_keepalive_expiry_seconds"],
+            "missionPoolTimeoutSeconds": data["mission_pool_timeout_seconds"],
+            "missionConnectionPolicy": data["mission_connection_policy"],
+            "missionWorkerProcesses": data["mission_worker_processes"],
+            "missionWorkerSplitRps": data["mission_worker_split_rps"],
+            "missionPayloadRingSize": data["mission_payload_ring_size"],
+            "missionLimiterEnabled": data["mission_limiter_enabled"],
+            "missionLimiterInitialLimit": data["mission_limiter_initial_limit"],
+            "missionLimiterMinLimit": data["mission_limiter_min_limit"],
+            "missionLimiterMaxLimit": data["mission_limiter_max_limit"],
+            "missionLimiterLatencyTargetMs": data["mission_limiter_latency_target_ms"],
+            "missionLimiterMaxQueue": data["mission_limiter_max_queue"],
+            "missionLimiterQueueTimeoutSeconds": data["mission_limiter_queue_timeout_seconds"],
+            "missionBreakerEnabled": data["mission_breaker_enabled"],
+            "missionBreakerErrorRate": data["mission_breaker_error_rate"],
+            "missionBreakerMinRequests": data["mission_breaker_min_requests"],
+            "missionBreakerWindowSeconds": data["mission_breaker_window_seconds"],
+            "missionBreakerConsecutiveTimeouts": data["mission_breaker_consecutive_timeouts"],
+            "missionBreakerOpenSeconds": data["mission_breaker_open_seconds"],
+            "missionBreakerHalfOpenPercent": data["mission_breaker_half_open_percent"],
+            "missionBreakerHalfOpenStep": data["mission_breaker_half_open_step"],
+            "missionOrdersWatch": data["mission_orders_watch"],
+            "missionLongPollSeconds": data["mission_long_poll_seconds"],
+            "fleetBackoffMaxSeconds": data["fleet_backoff_max_seconds"],
+            "fleetPollJitter": data["fleet_poll_jitter"],
+            "fleetStaleMaxSeconds": data["fleet_stale_max_seconds"],
+            "dockMode": data["dock_mode"],
+            "dockQueueCapacity": data["dock_queue_capacity"],
+            "dockQueueWorkers": data["dock_queue_workers"],
+            "dockTicketRetention": data["dock_ticket_retention"],
+            "dockMaxConcurrent": data["dock_max_concurrent"],
+            "dockAdmissionMaxWaiters": data["dock_admission_max_waiters"],
+            "dockAdmissionWaitSeconds": data["dock_admission_wait_seconds"],
+            "dockRetryAfterSeconds": data["dock_retry_after_seconds"],
+            "dockDeadlineEnforced": data["dock_deadline_enforced"],
+            "drainTimeoutSeconds": data["drain_timeout_seconds"],
+            "dockWorkProfile": data["dock_work_profile"],
+            "dockWorkUnits": data["dock_work_units"],
+            "dockWorkMemoryBytes": data["dock_work_memory_bytes"],
+            "dockWorkExecutor": data["dock_work_executor"],
+            "dockWorkWorkers": data["dock_work_workers"],
+            "logQueueSize": data["log_queue_size"],
+            "dispatchFailureLogIntervalSeconds": data["dispatch_failure_log_interval_seconds"],
+            "dockLogSampleRate": data["dock_log_sample_rate"],
+            "configPath": data["config_path"],
+            "configWatchSeconds": data["config_watch_seconds"],
+            "missionTelemetryIntervalSeconds": data["mission_telemetry_interval_seconds"],
+            "resultsRetentionSeconds": data["results_retention_seconds"],
+            "resultsMaxSeries": data["results_max_series"],
+            "missionSeed": data["mission_seed"],
+            "missionRecordDir": data["mission_record_dir"],
+            "missionEscortStreams": data["mission_escort_streams"],
+            "escortCargoBytes": data["escort_cargo_bytes"],
+            "cargoMaxBytes": data["cargo_max_bytes"],
+            "missionPayloadSize": data["mission_payload_size"] or None,
+            "missionPayloadCompression": data["mission_payload_compression"],
+            "missionPayloadChunkBytes": data["mission_payload_chunk_bytes"],
+            "missionPayloadMaxBytes": data["mission_payload_max_bytes"],
+            "dockMaxBodyBytes": data["dock_max_body_bytes"],
+            "cargoResponseCompression": data["cargo_response_compression"],
+            "missionRetryMax": data["mission_retry_max"],
+            "missionRetryBackoffMs": data["mission_retry_backoff_ms"],
+            "missionRetryBackoffMaxMs": data["mission_retry_backoff_max_ms"],
+            "missionRetryBudgetPercent": data["mission_retry_budget_percent"],
+            "missionHedgePercentile": data["mission_hedge_percentile"],
+            "missionHedgeMinDelayMs": data["mission_hedge_min_delay_ms"],
         }
 
-    def nebula_delay_seconds(self) -> float:
-        """Return the nebula latency budget (in seconds)."""
+    def fault_settings(self) -> FaultSettings:
+        """Return the nebula latency and chaos settings for the fault middleware."""
+
+        return FaultSettings(
+            latency_enabled=self.nebula_enabled,
+            distribution=self.nebula_distribution,
+            base_ms=float(self.nebula_density_ms),
+            spread_ms=float(self.nebula_spread_ms),
+            sigma=self.nebula_sigma,
+            pareto_alpha=self.nebula_pareto_alpha,
+            slow_ms=float(self.nebula_slow_density_ms),
+            slow_fraction=self.nebula_slow_fraction,
+            max_ms=float(self.nebula_max_density_ms),
+            chaos_enabled=self.chaos_experiments_enabled,
+            chaos_failure_rate=self.chaos_failure_rate,
+            unavailable_rate=self.chaos_unavailable_rate,
+            reset_rate=self.chaos_reset_rate,
+            hang_rate=self.chaos_hang_rate,
+            trickle_rate=self.chaos_trickle_rate,
+            truncated_rate=self.chaos_truncated_rate,
+            large_rate=self.chaos_large_rate,
+            retry_after_seconds=self.chaos_retry_after_seconds,
+            hang_seconds=self.chaos_hang_seconds,
+            trickle_byte_delay_ms=float(self.chaos_trickle_byte_delay_ms),
+            large_bytes=self.chaos_large_bytes,
+        )
+
+    def pool_settings(self) -> PoolSettings:
+        """Return the connection-pool limits shared by all outbound clients."""
+
+        return PoolSettings(
+            max_connections=self.mission_pool_max_connections,
+            max_keepalive_connections=self.mission_pool_max_keepalive,
+            keepalive_expiry_seconds=self.mission_pool_keepalive_expiry_seconds,
+            pool_timeout_seconds=self.mission_pool_timeout_seconds,
+            connection_policy=self.mission_connection_policy,
+        )
+
+    def client_policy_settings(self) -> ClientPolicySettings:
+        """Return the default retry and hedging policy for mission streams."""
 
-        if not self.nebula_enabled:
-            return 0.0
-        return max(0.0, self.nebula_density_ms / 1000.0)
+        return ClientPolicySettings(
+            max_retries=self.mission_retry_max,
+            backoff_seconds=self.mission_retry_backoff_ms / 1000,
+            backoff_max_seconds=self.mission_retry_backoff_max_ms / 1000,
+            retry_budget_percent=self.mission_retry_budget_percent,
+            hedge_percentile=self.mission_hedge_percentile,
+            hedge_min_delay_seconds=self.mission_hedge_min_delay_ms / 1000,
+        )
+
+    def work_settings(self) -> WorkSettings:
+        """Return the docking compute profile and the shape of its executor."""
+
+        return WorkSettings(
+            profile=self.dock_work_profile,
+            units=self.dock_work_units,
+            memory_bytes=self.dock_work_memory_bytes,
+            executor=self.dock_work_executor,
+            workers=self.dock_work_workers,
+        )
+
+    def breaker_settings(self) -> BreakerSettings:
+        """Return the circuit-breaker thresholds shared by every destination breaker."""
+
+        return BreakerSettings(
+            error_rate=self.mission_breaker_error_rate,
+            min_requests=self.mission_breaker_min_requests,
+            window_seconds=self.mission_breaker_window_seconds,
+            consecutive_timeouts=self.mission_breaker_consecutive_timeouts,
+            open_seconds=self.mission_breaker_open_seconds,
+            half_open_percent=self.mission_breaker_half_open_percent,
+            half_open_step=self.mission_breaker_half_open_step,
+        )
+
+    def limiter_settings(self) -> LimiterSettings:
+        """Return the AIMD tuning shared by every destination limiter.
+
+        A latency target of 0 follows the dispatch timeout, so a stock ``/dock``
+        (about 3.8 s) is not treated as overload.
+        """
+
+        min_limit = self.mission_limiter_min_limit
+        if self.mission_limiter_latency_target_ms:
+            latency_target_seconds = self.mission_limiter_latency_target_ms / 1000.0
+        else:
+            latency_target_seconds = TARGET_TIMEOUT_FRACTION * self.mission_dispatch_timeout_seconds
+        max_limit = max(min_limit, self.mission_limiter_max_limit)
+        return LimiterSettings(
+            initial_limit=self.mission_limiter_initial_limit,
+            min_limit=min_limit,
+            max_limit=max_limit,
+            latency_target_seconds=latency_target_seconds,
+            max_queue=self.mission_limiter_max_queue,
+            queue_timeout_seconds=self.mission_limiter_queue_timeout_seconds,
+        )
 
 
 CONFIG = UniverseConfig.from_env()
+POOL_REGISTRY = ConnectionPoolRegistry(CONFIG.pool_settings())
+METRICS = MetricsRegistry()
+LIMITERS = LimiterRegistry(CONFIG.limiter_settings())
+BREAKERS = BreakerRegistry(CONFIG.breaker_settings())
+FLEET_CACHE = FleetResponseCache(CONFIG.fleet_stale_max_seconds)
+FAULTS = FaultPlan(CONFIG.fault_settings())
+DOCK_DEADLINES = DeadlineStats(CONFIG.dock_deadline_enforced)
+DRAIN = DrainController()
+DOCK_WORK = DockWorkPool(CONFIG.work_settings())
+TELEMETRY = MissionTelemetry(time.monotonic())
+RUN_RESULTS = RunResults(CONFIG.results_retention_seconds, CONFIG.results_max_series)
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logger = logging.getLogger("spaceport")
+LOG_HANDLER = None
 if not logger.handlers:
-    logging.basicConfig(level=LOG_LEVEL)
+    if CONFIG.log_queue_size > 0:
+        LOG_HANDLER = install_queue_logging(logger, CONFIG.log_queue_size)
+    else:
+        logging.basicConfig(level=LOG_LEVEL)
 logger.setLevel(LOG_LEVEL)
-PROTECTED_PATHS = {"/healthz", "/readyz", "/livez"}
+DISPATCH_FAILURES = DispatchFailureLog(logger, CONFIG.dispatch_failure_log_interval_seconds)
+PROTECTED_PATHS = {"/healthz", "/readyz", "/livez", "/metrics", "/config", "/results", "/drain"}
+# Settings baked into long-lived objects at startup; changing them needs a restart.
+RESTART_REQUIRED_KEYS = {
+    "planetId",
+    "missionPoolMaxConnections",
+    "missionPoolMaxKeepalive",
+    "missionPoolKeepaliveExpirySeconds",
+    "missionPoolTimeoutSeconds",
+    "missionConnectionPolicy",
+    "missionWorkerProcesses",
+    "missionWorkerSplitRps",
+    "dockQueueCapacity",
+    "dockQueueWorkers",
+    "dockTicketRetention",
+    "dockWorkExecutor",
+    "dockWorkWorkers",
+    "configPath",
+    "configWatchSeconds",
+    "logQueueSize",
+    "resultsRetentionSeconds",
+    "resultsMaxSeries",
+}
+# Settings a mission stream reads when it starts; running streams keep the old
+# value until the mission is restarted.
+NEW_STREAMS_ONLY_KEYS = {
+    "missionDispatchTimeoutSeconds",
+    "missionSchedulerMode",
+    "missionArrivalProcess",
+    "missionPayloadRingSize",
+    "missionSeed",
+    "missionRecordDir",
+    "missionEscortStreams",
+    "escortCargoBytes",
+}
+OPEN_LOOP_SHORT_SLEEP_SECONDS = 0.05
+# How often aggregated dispatch-failure windows are checked for expiry.
+DISPATCH_FAILURE_FLUSH_SECONDS = 1.0
 
 CARGO_ITEMS = [
     ("fusion cores", "crates"),
@@ -178,6 +798,8 @@ DOCK_OPERATIONS = [
     "Routing goods to storage rings",
     "Signing customs ledger",
 ]
+# Mean of the uniform(0.2, 1.5) step delay; DOCK_WORK_UNITS is the work of an average step.
+MEAN_DOCK_STEP_SECONDS = 0.85
 
 
 class DockingRequest(BaseModel):
@@ -189,6 +811,12 @@ class DockingRequest(BaseModel):
     escortEnabled: Optional[bool] = None
     cargo: List[Dict[str, Any]] = Field(default_factory=list)
     sentAt: Optional[str] = None
+    dockingSeed: Optional[int] = Field(default=None, description="Seeds the docking step timings of seeded missions.")
+    cargoBytes: int = Field(default=0, description="Decoded size of a streamed bulk cargo body, set by /dock.")
+
+
+class DockingStatusRequest(BaseModel):
+    tickets: List[str] = Field(default_factory=list, max_length=1000)
 
 
 @dataclass(frozen=True)
@@ -199,20 +827,20 @@ class SpeedProfile:
     burst_multiplier: tuple[float, float]
     cooldown_seconds: tuple[float, float]
 
-    def burst_size(self, rps: int) -> int:
-        multiplier = self._sample(self.burst_multiplier)
+    def burst_size(self, rps: int, rng: Any = random) -> int:
+        multiplier = self._sample(self.burst_multiplier, rng)
         return max(1, int(round(rps * multiplier)))
 
-    def cooldown(self) -> float:
-        duration = self._sample(self.cooldown_seconds)
+    def cooldown(self, rng: Any = random) -> float:
+        duration = self._sample(self.cooldown_seconds, rng)
         return max(0.05, duration)
 
     @staticmethod
-    def _sample(bounds: tuple[float, float]) -> float:
+    def _sample(bounds: tuple[float, float], rng: Any = random) -> float:
         lower, upper = bounds
         if upper <= lower:
             return lower
-        return random.uniform(lower, upper)
+        return rng.uniform(lower, upper)
 
 
 DEFAULT_SPEED_PROFILE = SpeedProfile("cruise", (1.0, 1.0), (1.0, 1.0))
@@ -265,13 +893,13 @@ def get_endpoint_id(endpoint: Optional[Mapping[str, Any]]) -> str:
     return str(value or "").strip()
 
 
-def build_cargo_manifest() -> List[Dict[str, Any]]:
-    items = random.sample(CARGO_ITEMS, k=random.randint(2, min(4, len(CARGO_ITEMS))))
+def build_cargo_manifest(rng: Any = random) -> List[Dict[str, Any]]:
+    items = rng.sample(CARGO_ITEMS, k=rng.randint(2, min(4, len(CARGO_ITEMS))))
     manifest: List[Dict[str, Any]] = []
     for label, unit in items:
         manifest.append({
             "item": label,
-            "quantity": random.randint(1, 12),
+            "quantity": rng.randint(1, 12),
             "unit": unit,
         })
     return manifest
@@ -283,54 +911,522 @@ def build_mission_signature(mission: Mapping[str, Any], destination_id: str) ->
     rps = max(1, int(mission.get("rps") or 1))
     speed = (mission.get("speed") or "cruise").strip().lower()
     escort = bool(mission.get("escortEnabled"))
-    return (destination_id, rps, speed, escort)
+    policy = tuple(sorted((mission.get("clientPolicy") or {}).items()))
+    return (destination_id, rps, speed, escort, mission.get("seed"), mission.get("replayOf"), policy)
 
 
-async def send_single_docking_request(
-    client: httpx.AsyncClient,
-    mission: Mapping[str, Any],
-    source_id: str,
-    destination_id: str,
-    url: str,
-) -> None:
-    payload = {
+@dataclass
+class MissionRoute:
+    """Everything a mission stream needs to emit docking requests."""
+
+    mission_id: str
+    source_id: str
+    destination_id: str
+    url: str
+    payloads: DockingPayloadFactory
+    headers: Mapping[str, str] = field(default_factory=lambda: dict(JSON_HEADERS))
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    breaker: Optional[CircuitBreaker] = None
+    rng: Any = random
+    recorder: Optional[ScheduleRecorder] = None
+    sizer: Optional[PayloadSizer] = None
+    policy: Optional[ClientPolicy] = None
+
+
+def build_mission_route(mission: Mapping[str, Any], destination_id: str, seed: Optional[int] = None) -> MissionRoute:
+    source_id = get_endpoint_id(mission.get("source")) or CONFIG.planet_identifier or "unknown"
+    base = {
         "missionId": mission.get("id"),
         "source": mission.get("source") or {"id": source_id},
         "destination": mission.get("destination") or {"id": destination_id},
         "rps": mission.get("rps"),
         "speed": mission.get("speed"),
         "escortEnabled": mission.get("escortEnabled"),
-        "cargo": build_cargo_manifest(),
-        "sentAt": iso_now(),
     }
-    response = await client.post(url, json=payload)
-    response.raise_for_status()
+    cargo_rng = seeded_rng(seed, "cargo")
+    payloads = DockingPayloadFactory(
+        base,
+        manifest_builder=lambda: build_cargo_manifest(cargo_rng),
+        clock=iso_now,
+        ring_size=CONFIG.mission_payload_ring_size,
+        seed_builder=(lambda: cargo_rng.getrandbits(32)) if seed is not None else None,
+    )
+    limiter = None
+    if CONFIG.mission_limiter_enabled:
+        limiter = LIMITERS.limiter(build_planet_service_base(destination_id))
+    policy = None
+    policy_settings = CONFIG.client_policy_settings().for_mission(mission.get("clientPolicy"))
+    if policy_settings.enabled:
+        rps = max(1, int(mission.get("rps") or 1))
+        policy = ClientPolicy(policy_settings, rps, asyncio.get_running_loop().time(), seeded_rng(seed, "retry"))
+    return MissionRoute(
+        mission_id=str(mission.get("id")),
+        source_id=source_id,
+        destination_id=destination_id,
+        url=build_docking_url(destination_id),
+        payloads=payloads,
+        # The destination gives up on the dock once our client timeout would have fired.
+        headers={**JSON_HEADERS, DEADLINE_HEADER: str(int(CONFIG.mission_dispatch_timeout_seconds * 1000))},
+        limiter=limiter,
+        breaker=BREAKERS.breaker(destination_id) if CONFIG.mission_breaker_enabled else None,
+        rng=seeded_rng(seed, "schedule"),
+        sizer=(
+            PayloadSizer(CONFIG.mission_payload_size, CONFIG.mission_payload_max_bytes, seeded_rng(seed, "payload"))
+            if CONFIG.mission_payload_size
+            else None
+        ),
+        policy=policy,
+    )
+
+
+async def post_bulk_cargo(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    manifest: bytes,
+    stats: DispatchStats,
+) -> httpx.Response:
+    """POST a bandwidth-mode dock: the manifest in a header, the cargo as a streamed body."""
+
+    assert route.sizer is not None
+    size = route.sizer.next_size()
+    codec = CONFIG.mission_payload_compression
+    headers = {
+        **route.headers,
+        "Content-Type": CARGO_CONTENT_TYPE,
+        MANIFEST_HEADER: encode_manifest_header(manifest),
+    }
+    if codec == "none":
+        # Known length: sent with Content-Length rather than chunked.
+        headers["Content-Length"] = str(size)
+    else:
+        headers["Content-Encoding"] = codec
+    counters = BodyCounters()
+    body = stream_body(size, CONFIG.mission_payload_chunk_bytes, codec, counters, route.sizer.rng)
+    try:
+        return await client.post(route.url, content=body, headers=headers)
+    finally:
+        stats.payload_bytes += counters.payload_bytes
+        stats.wire_bytes += counters.wire_bytes
+        stats.encode_seconds += counters.codec_seconds
+
+
+async def attempt_docking(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    body: bytes,
+    stats: DispatchStats,
+    admitted: bool = False,
+) -> httpx.Response:
+    """Send one attempt, asking the destination's breaker first unless it already admitted this one.
+
+    First attempts are admitted in ``send_single_docking_request`` before the
+    limiter; retries and hedges are checked here and raise ``CircuitOpen``.
+    """
+
+    breaker = route.breaker
+    if breaker and not admitted:
+        breaker.allow(asyncio.get_running_loop().time())
+    try:
+        if route.sizer is None:
+            response = await client.post(route.url, content=body, headers=route.headers)
+        else:
+            response = await post_bulk_cargo(client, route, body, stats)
+        response.raise_for_status()
+    except Exception as exc:
+        if breaker:
+            breaker.record(asyncio.get_running_loop().time(), exc)
+        raise
+    if breaker:
+        breaker.record(asyncio.get_running_loop().time())
+    return response
+
+
+async def tracked_attempt(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    body: bytes,
+    stats: DispatchStats,
+    kind: str,
+) -> httpx.Response:
+    """One attempt, counted under its kind (``first``, ``retry`` or ``hedge``) and outcome."""
+
+    try:
+        response = await attempt_docking(client, route, body, stats, admitted=kind == "first")
+    except asyncio.CancelledError:
+        stats.record_attempt(kind, "cancelled")
+        raise
+    except CircuitOpen:
+        stats.record_attempt(kind, "short_circuited")
+        raise
+    except Exception as exc:
+        stats.record_attempt(kind, classify_dispatch_error(exc))
+        raise
+    stats.record_attempt(kind, "ok")
+    return response
+
+
+async def hedged_attempt(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    policy: ClientPolicy,
+    body: bytes,
+    stats: DispatchStats,
+    kind: str,
+) -> httpx.Response:
+    """Run an attempt; if it outlives the hedge delay, race a second copy and cancel the loser."""
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    delay = policy.hedge_delay(started_at)
+    if delay is None:
+        response = await tracked_attempt(client, route, body, stats, kind)
+    else:
+        primary = asyncio.create_task(tracked_attempt(client, route, body, stats, kind))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            response = primary.result()
+        elif not policy.budget.try_spend(loop.time()):
+            stats.budget_denied["hedge"] = stats.budget_denied.get("hedge", 0) + 1
+            response = await primary
+        else:
+            hedge = asyncio.create_task(tracked_attempt(client, route, body, stats, "hedge"))
+            response = await first_success(primary, hedge)
+    if kind == "first":
+        # Hedged requests count with the winner's latency, so slow first attempts still shape the delay.
+        policy.observe(loop.time() - started_at)
+    return response
+
+
+async def first_success(*attempts: "asyncio.Task[httpx.Response]") -> httpx.Response:
+    """Return the first attempt to succeed and cancel the rest; raise the last error if all fail."""
+
+    pending = set(attempts)
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    assert error is not None
+    raise error
+
+
+async def send_with_policy(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    policy: ClientPolicy,
+    body: bytes,
+    stats: DispatchStats,
+) -> httpx.Response:
+    """Send with hedging and budgeted, jittered retries per the mission's client policy."""
+
+    loop = asyncio.get_running_loop()
+    kind = "first"
+    retry = 0
+    while True:
+        try:
+            return await hedged_attempt(client, route, policy, body, stats, kind)
+        except CircuitOpen:
+            # The circuit opened under us: retrying would only hit the dead destination.
+            raise
+        except Exception as exc:
+            if retry >= policy.settings.max_retries or not is_retryable(exc):
+                raise
+            if not policy.budget.try_spend(loop.time()):
+                stats.budget_denied["retry"] = stats.budget_denied.get("retry", 0) + 1
+                raise
+        await asyncio.sleep(policy.backoff(retry))
+        retry += 1
+        kind = "retry"
+
+
+async def send_single_docking_request(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    intended_at: Optional[float] = None,
+) -> None:
+    """Send one docking request; requests shed by the limiter or an open circuit return silently."""
+
+    stats = METRICS.dispatch_stats(route.mission_id, route.destination_id)
+    loop = asyncio.get_running_loop()
+    started_at = loop.time() if intended_at is None else intended_at
+    limiter = route.limiter
+    if limiter:
+        try:
+            if await limiter.acquire():
+                stats.delayed += 1
+        except LoadShed:
+            stats.shed += 1
+            return
+    if route.breaker:
+        # Ask only once a slot is held, so a half-open probe is never spent on a shed request.
+        try:
+            route.breaker.allow(loop.time())
+        except CircuitOpen:
+            if limiter:
+                limiter.release_slot()
+            stats.short_circuited += 1
+            return
+    body = route.payloads.next_body()
+    stats.sent += 1
+    stats.in_flight += 1
+    sent_at = loop.time()
+    overloaded = False
+    try:
+        if route.policy is None:
+            await attempt_docking(client, route, body, stats, admitted=True)
+        else:
+            await send_with_policy(client, route, route.policy, body, stats)
+    except CircuitOpen:
+        # A retry found the circuit open after earlier attempts failed; the request was sent, so it failed.
+        overloaded = True
+        stats.record_failure("circuit_open")
+    except Exception as exc:
+        overloaded = is_overload_signal(exc)
+        stats.record_failure(classify_dispatch_error(exc))
+        raise
+    else:
+        stats.succeeded += 1
+    finally:
+        now = loop.time()
+        stats.in_flight -= 1
+        stats.latency.record(now - started_at)
+        if limiter:
+            limiter.release(now - sent_at, overloaded)
 
 
 async def emit_mission_burst(
     client: httpx.AsyncClient,
-    mission: Mapping[str, Any],
-    source_id: str,
-    destination_id: str,
-    url: str,
+    route: MissionRoute,
     burst_size: int,
 ) -> None:
     if burst_size <= 0:
         return
-    mission_id = mission.get("id")
-    attempts = [
-        send_single_docking_request(client, mission, source_id, destination_id, url)
-        for _ in range(burst_size)
-    ]
+    attempts = [send_single_docking_request(client, route) for _ in range(burst_size)]
     results = await asyncio.gather(*attempts, return_exceptions=True)
     for outcome in results:
         if isinstance(outcome, Exception):
-            logger.warning(
-                "Mission %s dispatch to %s failed: %s",
-                mission_id,
-                destination_id,
-                outcome,
-            )
+            DISPATCH_FAILURES.record(route.mission_id, route.destination_id, classify_dispatch_error(outcome), outcome)
+
+
+async def run_burst_schedule(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    rps: int,
+    speed_profile: SpeedProfile,
+    stop_event: asyncio.Event,
+) -> None:
+    """Closed-loop burst-and-cooldown pacing (the legacy scheduler)."""
+
+    loop = asyncio.get_running_loop()
+    while not stop_event.is_set():
+        burst_size = speed_profile.burst_size(rps, route.rng)
+        if route.recorder:
+            route.recorder.record(loop.time(), burst_size, route.destination_id)
+        await emit_mission_burst(client, route, burst_size)
+        pause = speed_profile.cooldown(route.rng)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=pause)
+            break
+        except asyncio.TimeoutError:
+            continue
+
+
+async def dispatch_scheduled_request(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    intended_at: float,
+) -> None:
+    """Send one open-loop request, reporting latency from its intended send time."""
+
+    try:
+        await send_single_docking_request(client, route, intended_at)
+    except Exception as exc:
+        DISPATCH_FAILURES.record(route.mission_id, route.destination_id, classify_dispatch_error(exc), exc)
+
+
+async def sleep_until(deadline: float, stop_event: asyncio.Event) -> bool:
+    """Wait until loop time ``deadline``; returns False if the stream was stopped first."""
+
+    if stop_event.is_set():
+        return False
+    delay = deadline - asyncio.get_running_loop().time()
+    if delay <= 0:
+        # Behind schedule: still yield so in-flight requests make progress.
+        await asyncio.sleep(0)
+    elif delay <= OPEN_LOOP_SHORT_SLEEP_SECONDS:
+        # Plain sleeps keep high-rate streams cheap; stop is noticed on the next tick.
+        await asyncio.sleep(delay)
+    else:
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+    return not stop_event.is_set()
+
+
+def schedule_request(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    intended_at: float,
+    in_flight: set[asyncio.Task],
+) -> None:
+    """Fire one open-loop request without waiting for it."""
+
+    if route.limiter and route.limiter.saturated():
+        # Backpressure: shed at the scheduler so no coroutine is created at all.
+        route.limiter.shed += 1
+        METRICS.dispatch_stats(route.mission_id, route.destination_id).shed += 1
+        return
+    task = asyncio.create_task(dispatch_scheduled_request(client, route, intended_at))
+    in_flight.add(task)
+    task.add_done_callback(in_flight.discard)
+
+
+async def run_open_loop_schedule(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    rps: int,
+    speed_profile: SpeedProfile,
+    stop_event: asyncio.Event,
+) -> None:
+    """Emit requests on a monotonic timeline that ignores response times.
+
+    Intended send times are accumulated from the arrival schedule rather than
+    from the moment the previous request finished, so a slow destination cannot
+    silently lower the offered load (coordinated omission).
+    """
+
+    schedule = build_arrival_schedule(CONFIG.mission_arrival_process, rps, speed_profile, route.rng)
+    loop = asyncio.get_running_loop()
+    in_flight: set[asyncio.Task] = set()
+    next_send = loop.time()
+    max_lag = 0.0
+    try:
+        while await sleep_until(next_send, stop_event):
+            max_lag = max(max_lag, loop.time() - next_send)
+            if route.recorder:
+                route.recorder.record(next_send, 1, route.destination_id)
+            schedule_request(client, route, next_send, in_flight)
+            next_send += schedule.next_interval()
+    finally:
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        logger.info(
+            "Mission %s open-loop schedule drained (max send lag %.3fs)",
+            route.mission_id,
+            max_lag,
+        )
+
+
+def build_escort_url(destination_id: str, escort: EscortStream) -> str:
+    _, path = ESCORT_KINDS[escort.kind]
+    url = f"{build_planet_service_base(destination_id)}{path}"
+    if escort.kind == "cargo":
+        url = f"{url}?bytes={CONFIG.escort_cargo_bytes}"
+    return url
+
+
+async def send_escort_request(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    escort: EscortStream,
+    url: str,
+    intended_at: float,
+) -> None:
+    """Send one escort request and record it under its own stream."""
+
+    stats = METRICS.escort_stats(route.mission_id, route.destination_id, escort.kind)
+    if route.breaker and route.breaker.state != "closed":
+        # Escorts stay quiet until docking traffic has closed the circuit, and never use up half-open probes.
+        stats.short_circuited += 1
+        return
+    method, _ = ESCORT_KINDS[escort.kind]
+    loop = asyncio.get_running_loop()
+    stats.sent += 1
+    stats.in_flight += 1
+    try:
+        response = await client.request(method, url)
+        response.raise_for_status()
+    except Exception as exc:
+        error_class = classify_dispatch_error(exc)
+        stats.record_failure(error_class)
+        DISPATCH_FAILURES.record(route.mission_id, f"{route.destination_id}/{escort.kind}", error_class, exc)
+    else:
+        stats.succeeded += 1
+    finally:
+        stats.in_flight -= 1
+        stats.latency.record(loop.time() - intended_at)
+
+
+async def run_escort_stream(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    escort: EscortStream,
+    rps: int,
+    speed_profile: SpeedProfile,
+    rng: random.Random,
+    stop_event: asyncio.Event,
+) -> None:
+    """Open-loop companion stream at ``escort.ratio`` times the mission rps."""
+
+    schedule = build_arrival_schedule(CONFIG.mission_arrival_process, rps * escort.ratio, speed_profile, rng)
+    url = build_escort_url(route.destination_id, escort)
+    loop = asyncio.get_running_loop()
+    in_flight: set[asyncio.Task] = set()
+    next_send = loop.time() + schedule.next_interval()
+    try:
+        while await sleep_until(next_send, stop_event):
+            task = asyncio.create_task(send_escort_request(client, route, escort, url, next_send))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            next_send += schedule.next_interval()
+    finally:
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def run_replay_schedule(
+    client: httpx.AsyncClient,
+    route: MissionRoute,
+    events: List[Tuple[float, int, str]],
+    stop_event: asyncio.Event,
+) -> None:
+    """Re-emit a recorded schedule open-loop, at the recorded offsets from the stream start."""
+
+    loop = asyncio.get_running_loop()
+    in_flight: set[asyncio.Task] = set()
+    started_at = loop.time()
+    max_lag = 0.0
+    emitted = 0
+    try:
+        for offset, count, _ in events:
+            intended_at = started_at + offset
+            if not await sleep_until(intended_at, stop_event):
+                break
+            max_lag = max(max_lag, loop.time() - intended_at)
+            for _ in range(count):
+                schedule_request(client, route, intended_at, in_flight)
+            emitted += count
+        else:
+            logger.info("Mission %s replay finished (%s requests)", route.mission_id, emitted)
+    finally:
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        logger.info("Mission %s replay drained (max send lag %.3fs)", route.mission_id, max_lag)
+    # Hold the stream open so the reconciler does not restart a finished replay.
+    await stop_event.wait()
 
 
 async def stream_mission_load(
@@ -339,33 +1435,86 @@ async def stream_mission_load(
     stop_event: asyncio.Event,
 ) -> None:
     mission_id = mission.get("id")
-    source_id = get_endpoint_id(mission.get("source")) or CONFIG.planet_identifier or "unknown"
     rps = max(1, int(mission.get("rps") or 1))
     speed_profile = resolve_speed_profile(mission.get("speed"))
-    url = build_docking_url(destination_id)
-    logger.info(
-        "Mission %s streaming %srps (%s) toward %s",
-        mission_id,
-        rps,
-        speed_profile.key,
-        destination_id,
-    )
+    open_loop = CONFIG.mission_scheduler_mode == "open-loop"
+    runner = run_open_loop_schedule if open_loop else run_burst_schedule
+    seed = mission_seed(mission, CONFIG.mission_seed)
+    replay_of = mission.get("replayOf")
+    recorder: Optional[ScheduleRecorder] = None
+    escorts: List[asyncio.Task] = []
     try:
-        async with httpx.AsyncClient(timeout=CONFIG.mission_dispatch_timeout_seconds) as client:
-            while not stop_event.is_set():
-                burst_size = speed_profile.burst_size(rps)
-                await emit_mission_burst(client, mission, source_id, destination_id, url, burst_size)
-                pause = speed_profile.cooldown()
-                try:
-                    await asyncio.wait_for(stop_event.wait(), timeout=pause)
-                    break
-                except asyncio.TimeoutError:
-                    continue
+        events: Optional[List[Tuple[float, int, str]]] = None
+        if replay_of:
+            if not CONFIG.mission_record_dir:
+                raise RuntimeError("replayOf is set but MISSION_RECORD_DIR is not")
+            header, events = load_schedule(schedule_path(CONFIG.mission_record_dir, str(replay_of)))
+            if seed is None:
+                # Same seed as the recorded run, so cargo and docking timings match too.
+                seed = header.get("seed")
+        pacing = CONFIG.mission_arrival_process if open_loop else "burst"
+        logger.info(
+            "Mission %s streaming %srps (%s, %s, seed %s) toward %s",
+            mission_id,
+            rps,
+            speed_profile.key,
+            f"replay of {replay_of}" if events is not None else pacing,
+            seed,
+            destination_id,
+        )
+        route = build_mission_route(mission, destination_id, seed)
+        client = POOL_REGISTRY.client(
+            build_planet_service_base(destination_id),
+            CONFIG.mission_dispatch_timeout_seconds,
+        )
+        if mission.get("escortEnabled"):
+            # Companion streams share the docking client, so they contend for the same connections.
+            escorts = [
+                asyncio.create_task(
+                    run_escort_stream(
+                        client,
+                        route,
+                        escort,
+                        rps,
+                        speed_profile,
+                        seeded_rng(seed, f"escort:{escort.kind}"),
+                        stop_event,
+                    )
+                )
+                for escort in parse_escort_streams(CONFIG.mission_escort_streams)
+            ]
+        if events is not None:
+            await run_replay_schedule(client, route, events, stop_event)
+            return
+        if CONFIG.mission_record_dir:
+            recorder = route.recorder = ScheduleRecorder(
+                schedule_path(CONFIG.mission_record_dir, str(mission_id)),
+                {
+                    "missionId": mission_id,
+                    "destinationId": destination_id,
+                    "rps": rps,
+                    "speed": speed_profile.key,
+                    "seed": seed,
+                    "scheduler": pacing,
+                    "recordedAt": iso_now(),
+                },
+                origin=asyncio.get_running_loop().time(),
+            )
+        await runner(client, route, rps, speed_profile, stop_event)
     except asyncio.CancelledError:
         raise
     except Exception as exc:
         logger.warning("Mission %s load stream aborted: %s", mission_id, exc)
     finally:
+        if escorts:
+            if not stop_event.is_set():
+                for task in escorts:
+                    task.cancel()
+            await asyncio.gather(*escorts, return_exceptions=True)
+        if recorder:
+            recorder.close()
+            logger.info("Mission %s schedule recorded to %s (%s events)", mission_id, recorder.path, recorder.events)
+        DISPATCH_FAILURES.flush(mission_id)
         logger.info("Mission %s load stream stopped", mission_id)
 
 
@@ -377,6 +1526,8 @@ async def ensure_mission_stream(mission: Mapping[str, Any]) -> None:
     if not destination_id:
         logger.warning("Mission %s is missing a destination id", mission_id)
         return
+    if DRAIN.draining:
+        return
     signature = build_mission_signature(mission, destination_id)
     handle = MISSION_LOAD_STREAMS.get(mission_id)
     if handle and handle.task.done():
@@ -396,70 +1547,180 @@ async def ensure_mission_stream(mission: Mapping[str, Any]) -> None:
     )
 
 
-async def stop_mission_stream(mission_id: str) -> None:
-    handle = MISSION_LOAD_STREAMS.pop(mission_id, None)
-    if not handle:
+async def stop_mission_streams(mission_ids: Iterable[str]) -> None:
+    """Stop streams concurrently; any still busy after ``MISSION_STOP_TIMEOUT_SECONDS`` is cancelled."""
+
+    handles = [MISSION_LOAD_STREAMS.pop(mission_id, None) for mission_id in list(mission_ids)]
+    handles = [handle for handle in handles if handle]
+    if not handles:
         return
-    handle.stop_event.set()
-    try:
-        await handle.task
-    except asyncio.CancelledError:
-        pass
+    for handle in handles:
+        handle.stop_event.set()
+    tasks = [handle.task for handle in handles]
+    _, pending = await asyncio.wait(tasks, timeout=CONFIG.mission_stop_timeout_seconds)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if pending:
+        logger.warning(
+            "Cancelled %s of %s mission stream(s) still running after %.1fs",
+            len(pending),
+            len(tasks),
+            CONFIG.mission_stop_timeout_seconds,
+        )
+
+
+async def stop_mission_stream(mission_id: str) -> None:
+    await stop_mission_streams([mission_id])
 
 
 async def stop_all_mission_streams() -> None:
-    pending_ids = list(MISSION_LOAD_STREAMS.keys())
-    for mission_id in pending_ids:
-        await stop_mission_stream(mission_id)
+    await stop_mission_streams(list(MISSION_LOAD_STREAMS.keys()))
 
 
 async def sync_mission_streams(actionable: List[Mapping[str, Any]]) -> None:
-    seen_ids: set[str] = set()
-    for mission in actionable:
-        mission_id = mission.get("id")
-        if not mission_id:
-            continue
-        seen_ids.add(mission_id)
-        await ensure_mission_stream(mission)
-    for mission_id in list(MISSION_LOAD_STREAMS.keys()):
-        if mission_id not in seen_ids:
-            await stop_mission_stream(mission_id)
+    seen_ids = {mission.get("id") for mission in actionable if mission.get("id")}
+    await stop_mission_streams([mission_id for mission_id in MISSION_LOAD_STREAMS if mission_id not in seen_ids])
+    await asyncio.gather(*(ensure_mission_stream(mission) for mission in actionable if mission.get("id")))
 
 
 async def mission_dispatch_loop() -> None:
     if not CONFIG.planet_identifier:
         return
     interval = CONFIG.mission_poll_interval_seconds
+    long_poll = CONFIG.mission_orders_watch == "long-poll"
     logger.info(
-        "Mission dispatch loop active for %s (poll %.1fs)",
+        "Mission dispatch loop active for %s (%s, poll %.1fs)",
         CONFIG.planet_identifier,
+        CONFIG.mission_orders_watch,
         interval,
     )
+    revision: Optional[int] = None
+    failures = 0
     try:
         while True:
+            watching = False
             try:
-                result = await fetch_fleet_json("/orders", params={"planetId": CONFIG.planet_identifier})
+                params: Dict[str, Union[str, int, float]] = {"planetId": CONFIG.planet_identifier}
+                timeout: Optional[float] = None
+                if long_poll and revision is not None:
+                    # Park the request on the fleet until the orders change.
+                    params["sinceRevision"] = revision
+                    params["waitSeconds"] = CONFIG.mission_long_poll_seconds
+                    timeout = CONFIG.mission_long_poll_seconds + CONFIG.fleet_timeout_seconds
+                result = await fetch_fleet_json("/orders", params=params, timeout=timeout)
                 if not result.get("ok"):
+                    failures += 1
+                    revision = None
                     logger.warning("Failed to fetch fleet orders: %s", result.get("error"))
                 else:
-                    missions = result["data"].get("missions", [])
+                    data = result["data"]
+                    if result.get("stale"):
+                        # Fleet unreachable: keep serving the last good orders while backing off.
+                        failures += 1
+                        revision = None
+                        logger.warning("Fleet unreachable, using cached orders: %s", result.get("error"))
+                    else:
+                        failures = 0
+                        next_revision = data.get("revision")
+                        # Fleets without revision support fall back to interval polling.
+                        watching = long_poll and isinstance(next_revision, int)
+                        revision = next_revision if watching else None
+                    missions = data.get("missions", [])
                     actionable = [
                         mission
                         for mission in missions
                         if get_endpoint_id(mission.get("source")) == CONFIG.planet_identifier
                     ]
-                    await sync_mission_streams(actionable)
+                    ACTIVE_MISSION_IDS.clear()
+                    ACTIVE_MISSION_IDS.update(str(mission.get("id")) for mission in actionable if mission.get("id"))
+                    if worker_pool:
+                        worker_pool.sync([] if DRAIN.draining else actionable)
+                    else:
+                        await sync_mission_streams(actionable)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:  # pragma: no cover - defensive logging for dispatcher
                 logger.exception("Unexpected error while dispatching missions: %s", exc)
-            await asyncio.sleep(interval)
+            if not watching:
+                await asyncio.sleep(
+                    poll_delay(interval, failures, CONFIG.fleet_backoff_max_seconds, CONFIG.fleet_poll_jitter)
+                )
     finally:
         await stop_all_mission_streams()
 
 
+async def push_mission_telemetry() -> bool:
+    """Post one batch of per-mission samples to the fleet; returns True when accepted."""
+
+    registry = METRICS.combined(worker_pool.snapshots()) if worker_pool else METRICS
+    samples = TELEMETRY.collect(registry, time.monotonic(), active=ACTIVE_MISSION_IDS)
+    if not samples:
+        TELEMETRY.commit(pushed=False)
+        return True
+    result = await post_fleet_json("/telemetry", {"planetId": CONFIG.planet_identifier, "samples": samples})
+    if not result.get("ok"):
+        TELEMETRY.discard()
+        logger.debug("Failed to push mission telemetry: %s", result.get("error"))
+        return False
+    TELEMETRY.commit()
+    return True
+
+
+async def mission_telemetry_loop() -> None:
+    while True:
+        await asyncio.sleep(CONFIG.mission_telemetry_interval_seconds or CONFIG.mission_poll_interval_seconds)
+        if CONFIG.mission_telemetry_interval_seconds <= 0:
+            continue
+        try:
+            await push_mission_telemetry()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging for telemetry
+            logger.exception("Unexpected error while pushing mission telemetry: %s", exc)
+
+
+def record_run_results() -> None:
+    """Close the per-second row for the wall-clock second that just ended."""
+
+    registry = METRICS.combined(worker_pool.snapshots()) if worker_pool else METRICS
+    RUN_RESULTS.sample(registry, int(time.time()) - 1)
+
+
+async def run_results_loop() -> None:
+    while True:
+        # Wake just after each wall-clock second so rows line up with their timestamp.
+        await asyncio.sleep(1.0 - time.time() % 1.0 + 0.001)
+        try:
+            record_run_results()
+        except Exception as exc:  # pragma: no cover - defensive logging for results
+            logger.exception("Unexpected error while recording run results: %s", exc)
+
+
+async def dispatch_failure_flush_loop() -> None:
+    while True:
+        await asyncio.sleep(DISPATCH_FAILURE_FLUSH_SECONDS)
+        DISPATCH_FAILURES.flush_expired()
+
+
 mission_dispatch_task: Optional[asyncio.Task] = None
+dispatch_failure_flush_task: Optional[asyncio.Task] = None
+mission_telemetry_task: Optional[asyncio.Task] = None
+run_results_task: Optional[asyncio.Task] = None
+worker_pool: Optional[LoadWorkerPool] = None
+config_watcher: Optional[ConfigFileWatcher] = None
+# Each PUT /config or config-file change replaces the whole override set, so
+# the most recent source wins; removing the file withdraws its overrides.
+CONFIG_OVERRIDE_POLICY = "last-writer-wins"
+RUNTIME_CONFIG: Dict[str, Any] = {
+    "overrides": {},
+    "policy": CONFIG_OVERRIDE_POLICY,
+    "revision": 0,
+    "source": "environment",
+    "updatedAt": iso_now(),
+}
 MISSION_LOAD_STREAMS: Dict[str, "MissionLoadHandle"] = {}
+ACTIVE_MISSION_IDS: Set[str] = set()
 
 
 @dataclass
@@ -470,19 +1731,46 @@ class MissionLoadHandle:
     task: asyncio.Task
 
 
-async def perform_docking_operations(mission: DockingRequest) -> List[Dict[str, Any]]:
+async def perform_docking_operations(
+    mission: DockingRequest,
+    log_steps: bool = True,
+    guard: Optional[DockGuard] = None,
+) -> List[Dict[str, Any]]:
+    rng: Any = random.Random(mission.dockingSeed) if mission.dockingSeed is not None else random
     total_operations = len(DOCK_OPERATIONS)
     upper = max(3, total_operations)
-    selection = min(total_operations, random.randint(3, upper)) if total_operations else 0
-    steps = random.sample(DOCK_OPERATIONS, k=selection) if selection else []
+    selection = min(total_operations, rng.randint(3, upper)) if total_operations else 0
+    steps = rng.sample(DOCK_OPERATIONS, k=selection) if selection else []
+    plan = [(step, round(rng.uniform(0.2, 1.5), 2)) for step in steps]
     operations: List[Dict[str, Any]] = []
-    for step in steps:
-        delay = round(random.uniform(0.2, 1.5), 2)
-        logger.info("Mission %s: %s", mission.missionId, step)
-        await asyncio.sleep(delay)
+    loop = asyncio.get_running_loop()
+    work = DOCK_WORK if DOCK_WORK.enabled else None
+    # The seeded step delay weights each step's share of the compute.
+    units = [max(1, round(CONFIG.dock_work_units * planned / MEAN_DOCK_STEP_SECONDS)) for _, planned in plan]
+    for index, (step, delay) in enumerate(plan):
+        if log_steps:
+            logger.info("Mission %s: %s", mission.missionId, step)
+        duration = delay
+        if work is not None:
+            if guard is not None:
+                try:
+                    guard.check("docking")
+                except DockAbandoned as exc:
+                    exc.saved_seconds = sum(units[index:]) * UNIT_SECONDS
+                    raise
+            duration = round(await work.run(units[index]), 3)
+        elif guard is None:
+            await asyncio.sleep(delay)
+        else:
+            step_started = loop.time()
+            try:
+                await guard.sleep(delay, "docking")
+            except DockAbandoned as exc:
+                exc.saved_seconds = sum(planned for _, planned in plan[index:]) - (loop.time() - step_started)
+                raise
         operations.append({
             "action": step,
-            "durationSeconds": delay,
+            "durationSeconds": duration,
             "completedAt": iso_now(),
         })
     return operations
@@ -495,18 +1783,38 @@ def build_fleet_url(path: str) -> str:
 
 
 async def fetch_fleet_json(
-    path: str, params: Optional[Mapping[str, Union[str, int, float]]] = None
+    path: str,
+    params: Optional[Mapping[str, Union[str, int, float]]] = None,
+    timeout: Optional[float] = None,
 ) -> Dict[str, Any]:
-    """Fetch JSON from the Fleet API with graceful error handling."""
+    """Fetch JSON from the Fleet API with graceful error handling.
+
+    ``timeout`` overrides the fleet client timeout (used by long-polls).
+    Responses are revalidated with ``If-None-Match``; when the fleet is
+    unreachable the last good body is returned with ``stale`` set, for up to
+    ``FLEET_STALE_MAX_SECONDS``.
+    """
 
     url = build_fleet_url(path)
+    client = POOL_REGISTRY.client(CONFIG.fleet_api_base_url, CONFIG.fleet_timeout_seconds, policy="keep-alive")
+    cache_key = FLEET_CACHE.key(path, params)
+    cached = FLEET_CACHE.get(cache_key)
+    headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
     try:
-        async with httpx.AsyncClient(timeout=CONFIG.fleet_timeout_seconds) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
-            return {"ok": True, "data": payload, "source": url}
+        if timeout is not None:
+            response = await client.get(url, params=params, headers=headers, timeout=timeout)
+        else:
+            response = await client.get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            FLEET_CACHE.touch(cache_key)
+            return {"ok": True, "data": cached.data, "source": url, "cached": True}
+        response.raise_for_status()
+        payload = response.json()
+        FLEET_CACHE.store(cache_key, response.headers.get("etag"), payload)
+        return {"ok": True, "data": payload, "source": url}
     except httpx.HTTPError as exc:  # pragma: no cover - network/HTTP edge cases
+        if cached and FLEET_CACHE.servable_when_stale(cached):
+            return {"ok": True, "data": cached.data, "source": url, "stale": True, "error": str(exc)}
         return {
             "ok": False,
             "error": str(exc),
@@ -514,6 +1822,19 @@ async def fetch_fleet_json(
         }
 
 
+async def post_fleet_json(path: str, payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """POST JSON to the Fleet API; errors are returned, not raised."""
+
+    url = build_fleet_url(path)
+    client = POOL_REGISTRY.client(CONFIG.fleet_api_base_url, CONFIG.fleet_timeout_seconds, policy="keep-alive")
+    try:
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+        return {"ok": True, "data": response.json(), "source": url}
+    except httpx.HTTPError as exc:  # pragma: no cover - network/HTTP edge cases
+        return {"ok": False, "error": str(exc), "source": url}
+
+
 async def gather_fleet_snapshot() -> Dict[str, Any]:
     """Collect the overall missions plus optional planet-specific orders."""
 
@@ -541,20 +1862,112 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost layer: nebula latency and chaos apply to all non-health traffic.
+app.add_middleware(
+    FaultInjectionMiddleware, plan=FAULTS, protected_paths=PROTECTED_PATHS, deadlines=DOCK_DEADLINES
+)
+
+
+async def drain_planet() -> None:
+    """Stop taking docks and mission load, then finish or cancel in-flight docks within the drain timeout."""
+
+    loop = asyncio.get_running_loop()
+    if not DRAIN.begin(loop.time()):
+        await DRAIN.wait_drained()
+        return
+    logger.info("Draining: %s dock(s) in flight, %s queued", DRAIN.in_flight, DOCKING_QUEUE.depth)
+    if worker_pool:
+        worker_pool.sync([])
+    try:
+        await asyncio.gather(
+            DRAIN.settle(CONFIG.drain_timeout_seconds, lambda: DOCKING_QUEUE.depth == 0),
+            stop_all_mission_streams(),
+        )
+    finally:
+        DRAIN.finish(loop.time())
+    logger.info(
+        "Drained in %.2fs: %s dock(s) completed, %s cancelled",
+        DRAIN.duration_seconds,
+        DRAIN.completed,
+        DRAIN.cancelled,
+    )
+
+
+# Registered first: shutdown handlers run in order, and in-flight docks still need the pools and the queue.
+@app.on_event("shutdown")
+async def drain_on_shutdown() -> None:
+    await drain_planet()
+
+
+@app.on_event("startup")
+async def start_config_watcher() -> None:
+    global config_watcher
+    if CONFIG.config_path and config_watcher is None:
+        config_watcher = ConfigFileWatcher(
+            CONFIG.config_path,
+            CONFIG.config_watch_seconds,
+            lambda overrides: apply_config_overrides(overrides, source=f"file:{CONFIG.config_path}"),
+        )
+        config_watcher.poll()
+        config_watcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_config_watcher() -> None:
+    global config_watcher
+    if config_watcher:
+        await config_watcher.stop()
+        config_watcher = None
+
+
+@app.on_event("startup")
+async def start_dispatch_failure_flusher() -> None:
+    global dispatch_failure_flush_task
+    if dispatch_failure_flush_task is None:
+        dispatch_failure_flush_task = asyncio.create_task(dispatch_failure_flush_loop())
+
+
+@app.on_event("shutdown")
+async def stop_dispatch_failure_flusher() -> None:
+    global dispatch_failure_flush_task
+    if dispatch_failure_flush_task:
+        dispatch_failure_flush_task.cancel()
+        try:
+            await dispatch_failure_flush_task
+        except asyncio.CancelledError:
+            pass
+        dispatch_failure_flush_task = None
+    DISPATCH_FAILURES.flush()
 
 
 @app.on_event("startup")
 async def start_mission_dispatcher() -> None:
-    global mission_dispatch_task
+    global mission_dispatch_task, mission_telemetry_task, run_results_task, worker_pool
+    if worker_pool is None and CONFIG.planet_identifier and CONFIG.mission_worker_processes > 0:
+        worker_pool = LoadWorkerPool(CONFIG.mission_worker_processes, CONFIG.mission_worker_split_rps)
+        worker_pool.start()
+        if RUNTIME_CONFIG["overrides"]:
+            worker_pool.configure(RUNTIME_CONFIG["overrides"])
     if mission_dispatch_task is None and CONFIG.planet_identifier:
         mission_dispatch_task = asyncio.create_task(mission_dispatch_loop())
+        mission_telemetry_task = asyncio.create_task(mission_telemetry_loop())
+        if RUN_RESULTS.enabled:
+            run_results_task = asyncio.create_task(run_results_loop())
     elif not CONFIG.planet_identifier:
         logger.info("PLANET_ID not set; mission dispatch loop disabled.")
 
 
 @app.on_event("shutdown")
 async def stop_mission_dispatcher() -> None:
-    global mission_dispatch_task
+    global mission_dispatch_task, mission_telemetry_task, run_results_task, worker_pool
+    for task in (mission_telemetry_task, run_results_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    mission_telemetry_task = run_results_task = None
     if mission_dispatch_task:
         mission_dispatch_task.cancel()
         try:
@@ -563,31 +1976,28 @@ async def stop_mission_dispatcher() -> None:
             pass
         mission_dispatch_task = None
     await stop_all_mission_streams()
+    if worker_pool:
+        # Stopping collects each worker's final snapshot; keep the pool until they are reported.
+        await worker_pool.stop()
+    if CONFIG.planet_identifier and RUN_RESULTS.enabled:
+        record_run_results()
+    if CONFIG.planet_identifier and CONFIG.mission_telemetry_interval_seconds > 0:
+        # Report the tail of every run before the pools close.
+        await push_mission_telemetry()
+    worker_pool = None
+    await POOL_REGISTRY.aclose()
 
 
-@app.middleware("http")
-async def nebula_and_chaos(request: Request, call_next):
-    """Apply latency and chaos experiments to all non-health traffic."""
+@app.on_event("startup")
+async def start_docking_queue() -> None:
+    DOCKING_QUEUE.start()
+    await DOCK_WORK.start()
 
-    normalized_path = request.url.path.rstrip("/") or "/"
-    if normalized_path not in PROTECTED_PATHS:
-        delay = CONFIG.nebula_delay_seconds()
-        if delay:
-            await asyncio.sleep(delay)
-        if CONFIG.chaos_experiments_enabled and random.random() < CONFIG.chaos_failure_rate:
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "Chaos experiments triggered a simulated failure.",
-                    "timestamp": iso_now(),
-                    "config": {
-                        "chaosExperimentsEnabled": CONFIG.chaos_experiments_enabled,
-                        "chaosFailureRate": CONFIG.chaos_failure_rate,
-                    },
-                },
-            )
-    response = await call_next(request)
-    return response
+
+@app.on_event("shutdown")
+async def stop_docking_queue() -> None:
+    await DOCKING_QUEUE.stop()
+    await DOCK_WORK.stop()
 
 
 @app.get("/healthz")
@@ -597,6 +2007,83 @@ async def healthcheck() -> Dict[str, Any]:
     return {"status": "ok", "timestamp": iso_now()}
 
 
+@app.get("/readyz")
+async def readiness() -> JSONResponse:
+    """Readiness endpoint: fails once the planet starts draining so traffic moves elsewhere."""
+
+    if DRAIN.draining:
+        return JSONResponse(status_code=503, content={"status": "draining", "timestamp": iso_now()})
+    return JSONResponse(content={"status": "ready", "timestamp": iso_now()})
+
+
+@app.post("/drain")
+async def drain() -> Dict[str, Any]:
+    """Drain the planet (e.g. from a preStop hook) and answer once it is done."""
+
+    await drain_planet()
+    return {"drain": DRAIN.describe(), "timestamp": iso_now()}
+
+
+@app.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    """Expose dispatch and docking metrics in the Prometheus text format."""
+
+    registry = METRICS.combined(worker_pool.snapshots()) if worker_pool else METRICS
+    body = (
+        registry.render()
+        + LIMITERS.render()
+        + BREAKERS.render()
+        + DOCKING_QUEUE.render()
+        + DOCK_ADMISSION.render()
+        + FAULTS.render()
+        + DOCK_DEADLINES.render()
+        + DRAIN.render()
+        + DOCK_WORK.render()
+        + (LOG_HANDLER.render() if LOG_HANDLER else "")
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@app.get("/cargo")
+async def cargo(request: Request, size: int = Query(default=65536, alias="bytes")) -> StreamingResponse:
+    """Stream ``bytes`` of filler: the large read used by ``cargo`` escort streams.
+
+    With ``CARGO_RESPONSE_COMPRESSION`` set, the body is compressed on the fly
+    for clients that accept that encoding.
+    """
+
+    size = max(0, min(size, CONFIG.cargo_max_bytes))
+    codec = CONFIG.cargo_response_compression
+    if codec == "none" or codec not in request.headers.get("accept-encoding", "").lower():
+        codec = "none"
+    if codec == "none":
+        headers = {"Content-Length": str(size)}
+    else:
+        headers = {"Content-Encoding": codec, "Vary": "Accept-Encoding"}
+    return StreamingResponse(
+        stream_body(size, CONFIG.mission_payload_chunk_bytes, codec, BodyCounters()),
+        media_type=CARGO_CONTENT_TYPE,
+        headers=headers,
+    )
+
+
+@app.get("/results")
+async def results(format: str = "csv", missionId: Optional[str] = None) -> Response:
+    """Download per-second run results as CSV, gzipped CSV or a NumPy ``.npz`` of columns."""
+
+    if format not in RESULT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(RESULT_FORMATS)}")
+    selected = RUN_RESULTS.selected(missionId)
+    name = f"spaceport-{CONFIG.planet_identifier or 'local'}-{missionId or 'all'}-results.{format}"
+    headers = {"Content-Disposition": f'attachment; filename="{name}"'}
+    if format == "npz":
+        body = await asyncio.get_running_loop().run_in_executor(None, build_npz, selected)
+        return Response(body, media_type="application/octet-stream", headers=headers)
+    if format == "csv.gz":
+        return StreamingResponse(iter_gzip(iter_csv(selected)), media_type="application/gzip", headers=headers)
+    return StreamingResponse(iter_csv(selected), media_type="text/csv", headers=headers)
+
+
 @app.get("/status")
 async def status() -> Dict[str, Any]:
     """Expose the current config values and fleet snapshot."""
@@ -605,6 +2092,17 @@ async def status() -> Dict[str, Any]:
         "service": "spaceport",
         "timestamp": iso_now(),
         "config": CONFIG.describe(),
+        "connectionPools": POOL_REGISTRY.describe(),
+        "loadWorkers": worker_pool.describe() if worker_pool else None,
+        "concurrencyLimits": LIMITERS.describe(),
+        "circuitBreakers": BREAKERS.describe(),
+        "dockingQueue": DOCKING_QUEUE.describe(),
+        "dockAdmission": DOCK_ADMISSION.describe(),
+        "dockDeadlines": DOCK_DEADLINES.describe(),
+        "drain": DRAIN.describe(),
+        "dockWork": DOCK_WORK.describe(),
+        "missionTelemetry": TELEMETRY.describe(),
+        "runResults": RUN_RESULTS.describe(),
         "fleet": snapshot,
     }
 
@@ -619,19 +2117,147 @@ async def missions_proxy() -> Mapping[str, Any]:
     raise HTTPException(status_code=502, detail=f"Fleet API unreachable: {result.get('error')}")
 
 
-@app.post("/dock")
-async def receive_cargo(payload: DockingRequest) -> Dict[str, Any]:
-    """Simulate cargo handling for missions targeting this planet."""
+CALL_GRAPH_TURNS = itertools.count()
+
+
+def inbound_hop_context(headers: Mapping[str, str], payload: DockingRequest, arrived_at: float) -> HopContext:
+    """Place an inbound dock in the call graph; the deadline clock starts on arrival."""
+
+    planet_id = get_endpoint_id(payload.destination) or CONFIG.planet_identifier or "unknown"
+    budget = CONFIG.cross_galaxy_deadline_ms / 1000
+    return hop_context(headers, planet_id, arrived_at, budget)
+
+
+async def call_downstream(planet_id: str, payload: DockingRequest, context: HopContext) -> Dict[str, Any]:
+    """Forward the convoy one hop down the call graph and summarise the outcome."""
+
+    stats = METRICS.hop_stats(planet_id)
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    remaining = context.remaining(started_at)
+    hop: Dict[str, Any] = {"planetId": planet_id, "depth": context.depth + 1}
+    if planet_id in context.path:
+        # A cycle in the graph: skip the edge rather than failing the convoy.
+        stats.record_failure("loop")
+        return {**hop, "status": "skipped", "error": "loop"}
+    if remaining <= 0:
+        stats.record_failure("deadline")
+        return {**hop, "status": "failed", "error": "deadline"}
+    body = payload.model_copy(
+        update={
+            "source": {"id": context.path[-1]},
+            "destination": {"id": planet_id},
+            "cargoBytes": 0,
+        }
+    ).model_dump_json(exclude_defaults=True)
+    client = POOL_REGISTRY.client(build_planet_service_base(planet_id), CONFIG.mission_dispatch_timeout_seconds)
+    stats.sent += 1
+    stats.in_flight += 1
+    try:
+        response = await client.post(
+            build_docking_url(planet_id),
+            content=body,
+            headers={**JSON_HEADERS, **context.headers(started_at)},
+            timeout=remaining,
+        )
+        response.raise_for_status()
+    except Exception as exc:
+        error_class = classify_dispatch_error(exc)
+        stats.record_failure(error_class)
+        DISPATCH_FAILURES.record(payload.missionId, f"hop/{planet_id}", error_class, exc)
+        hop.update(status="failed", error=error_class)
+    else:
+        stats.succeeded += 1
+        hop["status"] = "completed"
+        downstream = response.json().get("callGraph")
+        if downstream:
+            hop["hops"] = downstream["hops"]
+    finally:
+        stats.in_flight -= 1
+        elapsed = loop.time() - started_at
+        stats.latency.record(elapsed)
+        hop["latencyMs"] = round(elapsed * 1000, 3)
+    return hop
+
+
+async def run_call_graph(payload: DockingRequest, context: HopContext) -> Optional[Dict[str, Any]]:
+    """Call this planet's downstream planets; raises ``DownstreamFailed`` if a hop did not complete."""
+
+    if not CONFIG.cross_galaxy_enabled or not CONFIG.cross_galaxy_call_graph:
+        return None
+    downstreams = downstream_planets(parse_call_graph(CONFIG.cross_galaxy_call_graph), context.path[-1])
+    if not downstreams:
+        return None
+    summary: Dict[str, Any] = {"mode": CONFIG.cross_galaxy_mode, "depth": context.depth, "hops": []}
+    if context.depth >= CONFIG.cross_galaxy_max_depth:
+        # The graph is deeper than allowed: this planet acts as a leaf.
+        for planet_id in downstreams:
+            METRICS.hop_stats(planet_id).record_failure("depth")
+        summary["truncated"] = "depth"
+        return summary
+    for stage in plan_hops(CONFIG.cross_galaxy_mode, downstreams, next(CALL_GRAPH_TURNS)):
+        hops = await asyncio.gather(*(call_downstream(planet_id, payload, context) for planet_id in stage))
+        summary["hops"].extend(hops)
+        if any(hop["status"] == "failed" for hop in hops):
+            raise DownstreamFailed(summary["hops"])
+    return summary
+
+
+async def complete_docking(
+    payload: DockingRequest,
+    context: Optional[HopContext] = None,
+    guard: Optional[DockGuard] = None,
+) -> Dict[str, Any]:
+    """Run the docking sequence for one convoy, then its downstream hops, and build its receipt.
+
+    ``guard`` carries the caller's deadline for synchronous docks; with
+    ``DOCK_DEADLINE_ENFORCED`` the dock is abandoned (``DockAbandoned``) as
+    soon as the deadline passes or the client disconnects.
+    """
 
     destination_id = get_endpoint_id(payload.destination) or CONFIG.planet_identifier or "unknown"
     origin_id = get_endpoint_id(payload.source) or "unknown"
-    logger.info(
-        "Receiving convoy for mission %s from %s to %s",
-        payload.missionId,
-        origin_id,
-        destination_id,
-    )
-    operations = await perform_docking_operations(payload)
+    loop = asyncio.get_running_loop()
+    if context is None:
+        context = inbound_hop_context({}, payload, loop.time())
+    # Per-step docking logs are sampled per convoy so a sampled convoy keeps its full trace.
+    log_steps = random.random() < CONFIG.dock_log_sample_rate
+    if log_steps:
+        logger.info(
+            "Receiving convoy for mission %s from %s to %s",
+            payload.missionId,
+            origin_id,
+            destination_id,
+        )
+    stats = METRICS.dock_stats(origin_id)
+    started_at = loop.time()
+    # Wasted work counts from arrival, so it includes nebula and admission time.
+    arrived_at = guard.arrived_at if guard is not None else started_at
+    stats.in_flight += 1
+    outcome = "failed"
+    enforced = guard if guard is not None and DOCK_DEADLINES.enforced else None
+    try:
+        if enforced:
+            enforced.check("docking")
+        operations = await perform_docking_operations(payload, log_steps=log_steps, guard=enforced)
+        if enforced:
+            enforced.check("callGraph")
+        try:
+            call_graph = await run_call_graph(payload, context)
+        except DownstreamFailed:
+            outcome = "downstream_failed"
+            raise
+        outcome = "completed"
+    except DockAbandoned as exc:
+        outcome = f"abandoned_{exc.reason}"
+        DOCK_DEADLINES.abandon(exc.reason, exc.stage, loop.time() - arrived_at, exc.saved_seconds)
+        raise
+    finally:
+        stats.in_flight -= 1
+        stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+        stats.latency.record(loop.time() - started_at)
+    if guard is not None and guard.expired(loop.time()):
+        DOCK_DEADLINES.completed_late(loop.time() - arrived_at)
     cargo_quantity = sum(int(item.get("quantity", 0)) for item in payload.cargo)
     response = {
         "missionId": payload.missionId,
@@ -641,9 +2267,259 @@ async def receive_cargo(payload: DockingRequest) -> Dict[str, Any]:
         "operations": operations,
         "cargoProcessed": cargo_quantity,
     }
+    if payload.cargoBytes:
+        response["cargoBytes"] = payload.cargoBytes
+    if call_graph is not None:
+        response["callGraph"] = call_graph
     return response
 
 
+async def complete_queued_docking(job: Tuple[DockingRequest, HopContext]) -> Dict[str, Any]:
+    return await DRAIN.run(complete_docking(*job))
+
+
+DOCKING_QUEUE = DockingWorkQueue(
+    complete_queued_docking,
+    capacity=CONFIG.dock_queue_capacity,
+    workers=CONFIG.dock_queue_workers,
+    retention=CONFIG.dock_ticket_retention,
+)
+
+DOCK_ADMISSION = AdmissionController(
+    max_concurrent=CONFIG.dock_max_concurrent,
+    max_queue=CONFIG.dock_admission_max_waiters,
+    queue_timeout_seconds=CONFIG.dock_admission_wait_seconds,
+)
+
+
+def apply_config_overrides(overrides: Mapping[str, str], source: str) -> Dict[str, Any]:
+    """Rebuild ``CONFIG`` from the environment plus ``overrides`` and swap it in.
+
+    Handlers read ``CONFIG`` per request, so the swap is atomic from their
+    point of view; objects that cache settings are reconfigured in place.
+    """
+
+    global CONFIG
+    previous = CONFIG
+    updated = UniverseConfig.from_env({**os.environ, **overrides})
+    CONFIG = updated
+    FAULTS.configure(updated.fault_settings())
+    DOCK_DEADLINES.enforced = updated.dock_deadline_enforced
+    DOCK_WORK.configure(updated.work_settings())
+    LIMITERS.configure(updated.limiter_settings())
+    BREAKERS.configure(updated.breaker_settings())
+    DOCK_ADMISSION.configure(
+        updated.dock_max_concurrent, updated.dock_admission_max_waiters, updated.dock_admission_wait_seconds
+    )
+    FLEET_CACHE.max_stale_seconds = updated.fleet_stale_max_seconds
+    DISPATCH_FAILURES.interval_seconds = updated.dispatch_failure_log_interval_seconds
+    if worker_pool:
+        worker_pool.configure(dict(overrides))
+    before, after = previous.describe(), updated.describe()
+    changed = sorted(key for key in after if before.get(key) != after[key])
+    RUNTIME_CONFIG.update(
+        overrides=dict(overrides),
+        revision=RUNTIME_CONFIG["revision"] + 1,
+        source=source,
+        updatedAt=iso_now(),
+    )
+    restart_required = [key for key in changed if key in RESTART_REQUIRED_KEYS]
+    new_streams_only = [key for key in changed if key in NEW_STREAMS_ONLY_KEYS]
+    if changed:
+        logger.info("Applied config revision %s from %s: %s", RUNTIME_CONFIG["revision"], source, ", ".join(changed))
+    if restart_required:
+        logger.warning("Config keys need a restart to take effect: %s", ", ".join(restart_required))
+    if new_streams_only and MISSION_LOAD_STREAMS:
+        logger.warning("Config keys only apply to new mission streams: %s", ", ".join(new_streams_only))
+    return {"changed": changed, "restartRequired": restart_required, "newStreamsOnly": new_streams_only}
+
+
+@app.get("/config")
+async def get_config() -> Dict[str, Any]:
+    """Return the effective config and the runtime overrides applied on top of the environment."""
+
+    return {"config": CONFIG.describe(), **RUNTIME_CONFIG}
+
+
+@app.put("/config")
+async def put_config(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the runtime overrides (environment variable names to values) and apply them."""
+
+    try:
+        overrides = normalize_overrides(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    result = apply_config_overrides(overrides, source="api")
+    return {"config": CONFIG.describe(), **RUNTIME_CONFIG, **result}
+
+
+def parse_docking_request(raw: bytes) -> DockingRequest:
+    try:
+        return DockingRequest.model_validate_json(raw or b"{}")
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+
+
+async def read_docking_request(request: Request) -> DockingRequest:
+    """Parse the manifest from the JSON body, or from the manifest header of a bulk cargo upload."""
+
+    if not is_bulk_cargo(request):
+        return parse_docking_request(await request.body())
+    header = request.headers.get(MANIFEST_HEADER)
+    if not header:
+        raise HTTPException(status_code=400, detail=f"Bulk cargo requires the {MANIFEST_HEADER} header.")
+    try:
+        raw = decode_manifest_header(header)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Malformed {MANIFEST_HEADER} header.") from exc
+    return parse_docking_request(raw)
+
+
+def is_bulk_cargo(request: Request) -> bool:
+    return request.headers.get("content-type", "").split(";", 1)[0].strip().lower() == CARGO_CONTENT_TYPE
+
+
+async def unload_bulk_cargo(request: Request, payload: DockingRequest) -> Optional[JSONResponse]:
+    """Drain a streamed cargo body chunk by chunk; returns an error response if it cannot be unloaded."""
+
+    codec = request.headers.get("content-encoding", "identity").strip().lower()
+    if codec == "identity":
+        codec = "none"
+    if codec not in COMPRESSION_CODECS or available_codec(codec) != codec:
+        return JSONResponse(
+            status_code=415,
+            content={"error": f"Unsupported cargo encoding '{codec}'.", "timestamp": iso_now()},
+        )
+    counters = BodyCounters()
+    stats = METRICS.dock_stats(get_endpoint_id(payload.source) or "unknown")
+    try:
+        await consume_body(request.stream(), codec, counters, CONFIG.dock_max_body_bytes)
+    except BodyTooLarge as exc:
+        return JSONResponse(status_code=413, content={"error": str(exc), "timestamp": iso_now()})
+    except CorruptBody as exc:
+        return JSONResponse(status_code=400, content={"error": str(exc), "timestamp": iso_now()})
+    finally:
+        stats.payload_bytes += counters.payload_bytes
+        stats.wire_bytes += counters.wire_bytes
+        stats.decode_seconds += counters.codec_seconds
+    payload.cargoBytes = counters.payload_bytes
+    return None
+
+
+@app.post("/dock")
+async def receive_cargo(request: Request) -> Any:
+    """Simulate cargo handling for missions targeting this planet.
+
+    In async mode (``DOCK_MODE=async`` or ``Prefer: respond-async``) the job is
+    queued and a 202 with a ticket is returned instead of the receipt. Synchronous
+    docks pass through admission control and are shed with 429 when the planet
+    is at capacity. A bulk cargo upload (``application/octet-stream`` with the
+    manifest in a header) is admitted before its body is read, so a shed dock
+    never pays for the transfer. While the planet drains, new docks are
+    refused with 503 and in-flight ones are cancelled at the drain deadline.
+    """
+
+    if DRAIN.draining:
+        DRAIN.rejected += 1
+        return JSONResponse(
+            status_code=503,
+            content={"error": "Planet is draining.", "timestamp": iso_now()},
+            headers={"Retry-After": str(CONFIG.dock_retry_after_seconds), "Connection": "close"},
+        )
+    payload = await read_docking_request(request)
+    arrived_at = arrival_time(request.scope, asyncio.get_running_loop().time())
+    context = inbound_hop_context(request.headers, payload, arrived_at)
+    bulk = is_bulk_cargo(request)
+    wants_async = CONFIG.dock_mode == "async" or "respond-async" in request.headers.get("prefer", "").lower()
+    if not wants_async:
+        guard = DockGuard(parse_deadline(request.headers.get(DEADLINE_HEADER), arrived_at), arrived_at)
+        try:
+            await DOCK_ADMISSION.acquire()
+        except AdmissionRejected as exc:
+            return JSONResponse(
+                status_code=429,
+                content={"error": f"Docking capacity exhausted ({exc.reason}).", "timestamp": iso_now()},
+                headers={"Retry-After": str(CONFIG.dock_retry_after_seconds)},
+            )
+        try:
+            now = asyncio.get_running_loop().time()
+            if DOCK_DEADLINES.enforced and guard.expired(now):
+                # The caller gave up while we waited for a docking slot.
+                DOCK_DEADLINES.abandon("deadline", "admission", now - arrived_at, 0.0)
+                raise DockAbandoned("deadline", "admission")
+            if bulk:
+                rejected = await unload_bulk_cargo(request, payload)
+                if rejected is not None:
+                    return rejected
+            if DOCK_DEADLINES.enforced:
+                guard.watch(request.receive)
+            return await DRAIN.run(complete_docking(payload, context, guard))
+        except DownstreamFailed as exc:
+            return JSONResponse(
+                status_code=502,
+                content={"error": str(exc), "callGraph": {"hops": exc.hops}, "timestamp": iso_now()},
+            )
+        except DockAbandoned as exc:
+            return JSONResponse(
+                status_code=exc.status_code,
+                content={"error": str(exc), "stage": exc.stage, "timestamp": iso_now()},
+            )
+        except DockCancelled as exc:
+            return JSONResponse(
+                status_code=503,
+                content={"error": str(exc), "timestamp": iso_now()},
+                headers={"Connection": "close"},
+            )
+        finally:
+            guard.close()
+            DOCK_ADMISSION.release()
+    if bulk:
+        rejected = await unload_bulk_cargo(request, payload)
+        if rejected is not None:
+            return rejected
+    try:
+        job = DOCKING_QUEUE.submit((payload, context))
+    except DockingQueueFull as exc:
+        return JSONResponse(
+            status_code=503,
+            content={"error": str(exc), "timestamp": iso_now()},
+            headers={"Retry-After": "1"},
+        )
+    status_url = f"/dock/{job.ticket}"
+    return JSONResponse(
+        status_code=202,
+        content={
+            "missionId": payload.missionId,
+            "ticket": job.ticket,
+            "status": job.status,
+            "statusUrl": status_url,
+            "queueDepth": DOCKING_QUEUE.depth,
+        },
+        headers={"Location": status_url},
+    )
+
+
+@app.get("/dock/{ticket}")
+async def docking_status(ticket: str) -> Dict[str, Any]:
+    """Report the state of an asynchronous docking job."""
+
+    job = DOCKING_QUEUE.get(ticket)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Docking ticket '{ticket}' was not found.")
+    return job.describe()
+
+
+@app.post("/dock/status")
+async def docking_status_batch(body: DockingStatusRequest) -> Dict[str, Any]:
+    """Report the state of several asynchronous docking jobs at once."""
+
+    jobs: Dict[str, Any] = {}
+    for ticket in body.tickets:
+        job = DOCKING_QUEUE.get(ticket)
+        jobs[ticket] = job.describe() if job else {"ticket": ticket, "status": "unknown"}
+    return {"jobs": jobs, "queue": DOCKING_QUEUE.describe()}
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,105 @@
+"""Arrival processes used by the open-loop mission scheduler.
+
+Each schedule answers a single question: how long after the previous intended
+send time should the next request go out? The scheduler accumulates those gaps
+on a monotonic timeline, so the offered load never depends on how long earlier
+requests took to complete.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import random
+from typing import Any, Optional, Protocol
+
+ARRIVAL_PROCESSES = {"constant", "poisson", "profile"}
+
+
+class BurstShape(Protocol):
+    """Subset of ``SpeedProfile`` needed to turn a burst shape into a rate curve."""
+
+    key: str
+
+    def burst_size(self, rps: int, rng: Any = ...) -> int: ...
+
+    def cooldown(self, rng: Any = ...) -> float: ...
+
+
+class ArrivalSchedule(ABC):
+    """Base class for arrival schedules expressed as inter-arrival gaps."""
+
+    def __init__(self, rps: float) -> None:
+        self.rps = max(0.001, float(rps))
+
+    @abstractmethod
+    def next_interval(self) -> float:
+        """Seconds from the previous intended send time to the next one."""
+
+
+class ConstantArrivals(ArrivalSchedule):
+    """Evenly spaced requests at exactly ``rps``."""
+
+    def __init__(self, rps: float) -> None:
+        super().__init__(rps)
+        self._gap = 1.0 / self.rps
+
+    def next_interval(self) -> float:
+        return self._gap
+
+
+class PoissonArrivals(ArrivalSchedule):
+    """Memoryless arrivals with exponentially distributed gaps averaging ``rps``."""
+
+    def __init__(self, rps: float, rng: Optional[random.Random] = None) -> None:
+        super().__init__(rps)
+        self._rng = rng or random.Random()
+
+    def next_interval(self) -> float:
+        return self._rng.expovariate(self.rps)
+
+
+class ProfileRateArrivals(ArrivalSchedule):
+    """Piecewise-constant rate curve derived from a speed profile.
+
+    Every segment samples a burst size and cooldown from the profile and spreads
+    that many requests evenly across the cooldown window. The long-run average
+    therefore matches the burst-mode profile, but requests are paced on the
+    timeline instead of being fired all at once.
+    """
+
+    def __init__(self, rps: float, shape: BurstShape, rng: Optional[random.Random] = None) -> None:
+        super().__init__(rps)
+        self._shape = shape
+        self._rng = rng or random.Random()
+        self._remaining = 0
+        self._gap = 1.0 / self.rps
+
+    def _start_segment(self) -> None:
+        count = max(1, self._shape.burst_size(int(round(self.rps)), self._rng))
+        window = max(0.05, self._shape.cooldown(self._rng))
+        self._remaining = count
+        self._gap = window / count
+
+    def current_rate(self) -> float:
+        """Return the rate (requests/s) of the active segment."""
+
+        return 1.0 / self._gap if self._gap > 0 else 0.0
+
+    def next_interval(self) -> float:
+        if self._remaining <= 0:
+            self._start_segment()
+        self._remaining -= 1
+        return self._gap
+
+
+def build_arrival_schedule(
+    process: str, rps: float, shape: BurstShape, rng: Optional[random.Random] = None
+) -> ArrivalSchedule:
+    """Build the arrival schedule for a mission stream; ``rng`` makes random gaps reproducible."""
+
+    normalized = (process or "constant").strip().lower()
+    if normalized == "poisson":
+        return PoissonArrivals(rps, rng)
+    if normalized == "profile":
+        return ProfileRateArrivals(rps, shape, rng)
+    return ConstantArrivals(rps)
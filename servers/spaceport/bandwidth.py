@@ -0,0 +1,293 @@
+"""Bandwidth mode: large, optionally compressed cargo bodies sent as streams.
+
+With ``MISSION_PAYLOAD_SIZE`` set, every docking request carries a bulk cargo
+body next to its manifest. Sizes come from a profile (``64KB``,
+``uniform:16KB-1MB``, ``lognormal:256KB:0.8``). Bodies are never built per
+request: they are ``memoryview`` slices of one shared, preallocated buffer,
+handed to httpx as an async stream of chunks. When compression is on, each
+chunk goes through a per-request streaming compressor. ``/dock`` reads the
+stream chunk by chunk and decompresses it incrementally, so neither side
+ever holds a whole body.
+
+zstd needs the optional ``zstandard`` package (``pip install zstandard``);
+without it ``zstd`` falls back to gzip.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Optional, Tuple
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore
+
+COMPRESSION_CODECS = ("none", "gzip", "zstd")
+SIZE_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+MANIFEST_HEADER = "x-docking-manifest"
+CARGO_CONTENT_TYPE = "application/octet-stream"
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?i?b?)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+_BUFFER_BLOCK_BYTES = 4 * 1024 * 1024
+# Largest piece of decoded output produced at once while checking the body limit.
+DECODE_PIECE_BYTES = 64 * 1024
+_WORDS = (
+    "fusion", "core", "quantum", "relay", "hydroponic", "seed", "survey", "drone", "vacuum", "rated",
+    "textile", "ration", "crate", "tube", "cell", "sealed", "manifest", "dock", "bay", "orbit",
+)
+
+
+class PayloadConfigError(ValueError):
+    """Raised for a payload size spec that cannot be parsed."""
+
+
+def parse_size(value: str) -> int:
+    """Parse ``512``, ``64KB``, ``1.5MiB`` or ``2m`` into bytes."""
+
+    match = _SIZE_PATTERN.match(value or "")
+    if not match:
+        raise PayloadConfigError(f"'{value}' is not a size")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[(unit or "")[:1].lower()])
+
+
+def available_codec(codec: str) -> str:
+    """Return ``codec`` if it can be used here, degrading zstd to gzip without ``zstandard``."""
+
+    codec = (codec or "none").strip().lower()
+    if codec not in COMPRESSION_CODECS:
+        return "none"
+    if codec == "zstd" and zstandard is None:
+        return "gzip"
+    return codec
+
+
+class PayloadSizer:
+    """Draw body sizes from a profile: ``[fixed:]<size>``, ``uniform:<min>-<max>``, ``lognormal:<median>[:sigma]``."""
+
+    def __init__(self, spec: str, max_bytes: int, rng: Any = random) -> None:
+        self.spec = (spec or "").strip().lower()
+        self.max_bytes = max_bytes
+        self.rng = rng
+        kind, _, args = self.spec.partition(":")
+        if kind not in SIZE_DISTRIBUTIONS:
+            kind, args = "fixed", self.spec
+        self.kind = kind
+        try:
+            if kind == "uniform":
+                lower, _, upper = args.partition("-")
+                self._bounds = (parse_size(lower), parse_size(upper or lower))
+            elif kind == "lognormal":
+                median, _, sigma = args.partition(":")
+                self._bounds = (parse_size(median), 0)
+                self._sigma = float(sigma) if sigma else 0.5
+            else:
+                self._bounds = (parse_size(args), 0)
+        except ValueError as exc:
+            raise PayloadConfigError(f"invalid payload size '{spec}': {exc}") from exc
+
+    @property
+    def ceiling(self) -> int:
+        if self.kind == "uniform":
+            return min(self.max_bytes, max(self._bounds))
+        if self.kind == "lognormal":
+            return self.max_bytes
+        return min(self.max_bytes, self._bounds[0])
+
+    def next_size(self) -> int:
+        if self.kind == "uniform":
+            lower, upper = sorted(self._bounds)
+            size = self.rng.randint(lower, upper)
+        elif self.kind == "lognormal":
+            size = int(self.rng.lognormvariate(math.log(max(1, self._bounds[0])), self._sigma))
+        else:
+            size = self._bounds[0]
+        return max(0, min(self.max_bytes, size))
+
+
+_shared_buffer = bytearray()
+
+
+def shared_cargo_buffer(size: int) -> memoryview:
+    """Return a read-only view of at least ``size`` filler bytes, growing the shared buffer once if needed.
+
+    The filler is word soup tiled in 4 MiB blocks: compressible like real
+    text, but without repeats inside a gzip or default zstd window.
+    """
+
+    global _shared_buffer
+    if len(_shared_buffer) < size:
+        rng = random.Random(0)
+        block = bytearray()
+        while len(block) < _BUFFER_BLOCK_BYTES:
+            block += (" ".join(rng.choices(_WORDS, k=12)) + f" {rng.randint(0, 99999)}\n").encode("ascii")
+        block = block[:_BUFFER_BLOCK_BYTES]
+        repeats = -(-size // len(block))
+        _shared_buffer = block * max(1, repeats)
+    return memoryview(_shared_buffer).toreadonly()
+
+
+def _compressor(codec: str) -> Optional[Tuple[Callable[[bytes], bytes], Callable[[], bytes]]]:
+    if codec == "gzip":
+        gzip_stream = zlib.compressobj(6, zlib.DEFLATED, 31)
+        return gzip_stream.compress, gzip_stream.flush
+    if codec == "zstd" and zstandard is not None:
+        zstd_stream = zstandard.ZstdCompressor(level=3).compressobj()
+        return zstd_stream.compress, zstd_stream.flush
+    return None
+
+
+class BodyTooLarge(Exception):
+    """Raised when a streamed body decodes past the configured limit."""
+
+
+class CorruptBody(Exception):
+    """Raised when a compressed body cannot be decoded."""
+
+
+class _CountingSink:
+    """zstd stream-writer target: counts decoded bytes, discards them and stops at the limit."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.decoded = 0
+
+    def write(self, data: bytes) -> int:
+        self.decoded += len(data)
+        if self.decoded > self.max_bytes:
+            raise BodyTooLarge(f"cargo body exceeds {self.max_bytes} bytes")
+        return len(data)
+
+
+def _decoder(codec: str, max_bytes: int) -> Optional[Callable[[bytes], int]]:
+    """Return ``feed(chunk) -> decoded bytes`` for ``codec``, or None for identity.
+
+    Output is produced at most ``DECODE_PIECE_BYTES`` at a time and counted
+    against ``max_bytes`` as it appears, so a decompression bomb is stopped
+    after one piece past the limit instead of being inflated whole.
+    """
+
+    if codec == "gzip":
+        inflater = zlib.decompressobj(31)
+        total = 0
+
+        def feed_gzip(chunk: bytes) -> int:
+            nonlocal total
+            decoded = 0
+            data = chunk
+            while True:
+                piece = inflater.decompress(data, DECODE_PIECE_BYTES)
+                decoded += len(piece)
+                if total + decoded > max_bytes:
+                    raise BodyTooLarge(f"cargo body exceeds {max_bytes} bytes")
+                data = inflater.unconsumed_tail
+                # A full piece may leave output buffered in zlib even with no input left.
+                if not data and len(piece) < DECODE_PIECE_BYTES:
+                    break
+            total += decoded
+            return decoded
+
+        return feed_gzip
+    if codec == "zstd" and zstandard is not None:
+        sink = _CountingSink(max_bytes)
+        writer = zstandard.ZstdDecompressor().stream_writer(sink, write_size=DECODE_PIECE_BYTES)
+
+        def feed_zstd(chunk: bytes) -> int:
+            before = sink.decoded
+            writer.write(chunk)
+            return sink.decoded - before
+
+        return feed_zstd
+    return None
+
+
+class BodyCounters:
+    """Byte and codec-time counters filled in while a body streams."""
+
+    __slots__ = ("payload_bytes", "wire_bytes", "codec_seconds")
+
+    def __init__(self) -> None:
+        self.payload_bytes = 0
+        self.wire_bytes = 0
+        self.codec_seconds = 0.0
+
+
+async def stream_body(
+    size: int,
+    chunk_bytes: int,
+    codec: str,
+    counters: BodyCounters,
+    rng: Any = random,
+) -> AsyncIterator[bytes]:
+    """Yield ``size`` bytes from the shared buffer in ``chunk_bytes`` pieces, compressed with ``codec``."""
+
+    buffer = shared_cargo_buffer(size + _BUFFER_BLOCK_BYTES)
+    # A random starting offset keeps consecutive bodies from being identical.
+    offset = rng.randrange(_BUFFER_BLOCK_BYTES)
+    compressor = _compressor(codec)
+    end = offset + size
+    while offset < end:
+        chunk = buffer[offset:min(end, offset + chunk_bytes)]
+        offset += len(chunk)
+        counters.payload_bytes += len(chunk)
+        if compressor is None:
+            counters.wire_bytes += len(chunk)
+            yield chunk  # type: ignore[misc]
+            continue
+        started = time.perf_counter()
+        compressed = compressor[0](chunk)
+        counters.codec_seconds += time.perf_counter() - started
+        if compressed:
+            counters.wire_bytes += len(compressed)
+            yield compressed
+    if compressor is not None:
+        started = time.perf_counter()
+        tail = compressor[1]()
+        counters.codec_seconds += time.perf_counter() - started
+        if tail:
+            counters.wire_bytes += len(tail)
+            yield tail
+
+
+async def consume_body(
+    chunks: AsyncIterator[bytes],
+    codec: str,
+    counters: BodyCounters,
+    max_bytes: int,
+) -> None:
+    """Drain a (possibly compressed) request stream, counting bytes without keeping them.
+
+    ``max_bytes`` is enforced while decoding, not after each chunk is inflated.
+    """
+
+    feed = _decoder(codec, max_bytes - counters.payload_bytes)
+    async for chunk in chunks:
+        counters.wire_bytes += len(chunk)
+        if feed is None:
+            counters.payload_bytes += len(chunk)
+        else:
+            started = time.perf_counter()
+            try:
+                counters.payload_bytes += feed(chunk)
+            except BodyTooLarge:
+                raise
+            except Exception as exc:
+                raise CorruptBody(f"corrupt {codec} cargo body: {exc}") from exc
+            finally:
+                counters.codec_seconds += time.perf_counter() - started
+        if counters.payload_bytes > max_bytes:
+            raise BodyTooLarge(f"cargo body exceeds {max_bytes} bytes")
+
+
+def encode_manifest_header(body: bytes) -> str:
+    return base64.urlsafe_b64encode(body).decode("ascii")
+
+
+def decode_manifest_header(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value.encode("ascii"))
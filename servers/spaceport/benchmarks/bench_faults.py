@@ -0,0 +1,99 @@
+"""Microbenchmark: per-request overhead of the fault layer with every fault disabled.
+
+Drives a trivial Starlette route directly over ASGI (no sockets) and compares
+no middleware, the old ``@app.middleware("http")`` wrapper and the pure ASGI
+``FaultInjectionMiddleware``. Run from ``servers/spaceport``::
+
+    python benchmarks/bench_faults.py [iterations]
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from faults import FaultInjectionMiddleware, FaultPlan, FaultSettings  # noqa: E402
+
+PROTECTED_PATHS = {"/healthz", "/readyz", "/livez", "/metrics"}
+
+
+async def dock(request):
+    return PlainTextResponse("docked")
+
+
+def build_app() -> Starlette:
+    return Starlette(routes=[Route("/dock", dock, methods=["POST"])])
+
+
+async def legacy_dispatch(request, call_next):
+    # Same shape as the old nebula_and_chaos middleware with faults disabled.
+    normalized_path = request.url.path.rstrip("/") or "/"
+    if normalized_path not in PROTECTED_PATHS:
+        pass
+    return await call_next(request)
+
+
+def make_scope() -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/dock",
+        "raw_path": b"/dock",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"planet-b-service"), (b"content-length", b"0")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 80),
+    }
+
+
+async def run(app, iterations: int) -> float:
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        return None
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await app(make_scope(), receive, send)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    bare = build_app()
+    legacy = BaseHTTPMiddleware(build_app(), dispatch=legacy_dispatch)
+    plan = FaultPlan(FaultSettings())
+    asgi = FaultInjectionMiddleware(build_app(), plan=plan, protected_paths=PROTECTED_PATHS)
+    cases = (
+        ("no middleware", bare),
+        ("BaseHTTPMiddleware", legacy),
+        ("pure ASGI", asgi),
+    )
+    baseline = None
+    for label, app in cases:
+        asyncio.run(run(app, min(iterations, 1_000)))  # warm up
+        elapsed = asyncio.run(run(app, iterations))
+        per_request = elapsed / iterations * 1e6
+        baseline = per_request if baseline is None else baseline
+        print(
+            f"{label:<20} {iterations / elapsed:>10,.0f} req/s  "
+            f"({per_request:.2f} us/req, {per_request - baseline:+.2f} us vs bare)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Microbenchmark: docking bodies/sec, per-request encoding vs the pre-encoded ring.
+
+Run from ``servers/spaceport``::
+
+    python benchmarks/bench_payloads.py [iterations]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import build_cargo_manifest, iso_now  # noqa: E402
+from payloads import JSON_HEADERS, DockingPayloadFactory, encode_json  # noqa: E402
+
+MISSION = {
+    "id": "bench-mission",
+    "source": {"id": "planet-a"},
+    "destination": {"id": "planet-b"},
+    "rps": 500,
+    "speed": "cruise",
+    "escortEnabled": True,
+}
+URL = "http://planet-b-service/dock"
+
+
+def legacy_payload() -> dict:
+    return {
+        "missionId": MISSION["id"],
+        "source": MISSION["source"],
+        "destination": MISSION["destination"],
+        "rps": MISSION["rps"],
+        "speed": MISSION["speed"],
+        "escortEnabled": MISSION["escortEnabled"],
+        "cargo": build_cargo_manifest(),
+        "sentAt": iso_now(),
+    }
+
+
+def legacy_body() -> bytes:
+    return encode_json(legacy_payload())
+
+
+def legacy_request() -> httpx.Request:
+    return httpx.Request("POST", URL, json=legacy_payload())
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    base = {key: MISSION[key] for key in ("source", "destination", "rps", "speed", "escortEnabled")}
+    factory = DockingPayloadFactory({"missionId": MISSION["id"], **base}, build_cargo_manifest, iso_now)
+
+    def ring_request() -> httpx.Request:
+        return httpx.Request("POST", URL, content=factory.next_body(), headers=JSON_HEADERS)
+
+    cases = (
+        ("body: per-request", legacy_body),
+        ("body: ring", factory.next_body),
+        ("request: json=", legacy_request),
+        ("request: content=", ring_request),
+    )
+    for label, build in cases:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            build()
+        elapsed = time.perf_counter() - started
+        print(f"{label:<20} {iterations / elapsed:>12,.0f} bodies/s  ({elapsed / iterations * 1e6:.2f} us/body)")
+
+
+if __name__ == "__main__":
+    main()
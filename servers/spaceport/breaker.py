@@ -0,0 +1,187 @@
+"""Per-destination circuit breakers for mission dispatch.
+
+A breaker watches every docking attempt toward one destination. It opens
+when the error rate over a sliding window crosses a threshold (once the
+window holds enough requests) or after a run of consecutive timeouts. While
+open, requests fail fast locally: no socket, no coroutine waiting on a dead
+planet, no failure log line. After ``open_seconds`` the breaker goes
+half-open and admits a small share of the traffic; each
+``half_open_step`` successes double that share until it reaches 100 % and
+the breaker closes. Any failure while half-open opens it again.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+import httpx
+
+BREAKER_STATES = ("closed", "half_open", "open")
+
+
+class CircuitOpen(Exception):
+    """Raised when a request is failed fast because the destination's circuit is open."""
+
+
+@dataclass(frozen=True)
+class BreakerSettings:
+    """Thresholds shared by every destination breaker."""
+
+    error_rate: float = 0.5
+    min_requests: int = 20
+    window_seconds: int = 10
+    consecutive_timeouts: int = 5
+    open_seconds: float = 5.0
+    half_open_percent: float = 10.0
+    half_open_step: int = 10
+
+
+def is_breaker_failure(exc: BaseException) -> bool:
+    """Failures that say the destination is unhealthy: transport errors, timeouts, 429 and 5xx."""
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker with a per-second sliding error window."""
+
+    def __init__(self, settings: BreakerSettings) -> None:
+        self.settings = settings
+        self.state = "closed"
+        self.consecutive_timeouts = 0
+        self.opened = 0
+        self.rejected = 0
+        self._window: Deque[List[int]] = deque()  # [second, requests, failures]
+        self._opened_at = 0.0
+        self._admit_share = 0.0
+        self._admit_credit = 0.0
+        self._step_successes = 0
+
+    def allow(self, now: float) -> None:
+        """Admit a request or raise ``CircuitOpen``."""
+
+        if self.state == "open":
+            if now - self._opened_at < self.settings.open_seconds:
+                self.rejected += 1
+                raise CircuitOpen("circuit open")
+            self.state = "half_open"
+            self._admit_share = max(0.01, min(1.0, self.settings.half_open_percent / 100.0))
+            self._admit_credit = 1.0
+            self._step_successes = 0
+        if self.state == "half_open":
+            # Spread the admitted share evenly rather than admitting bursts.
+            self._admit_credit = min(1.0, self._admit_credit + self._admit_share)
+            if self._admit_credit < 1.0:
+                self.rejected += 1
+                raise CircuitOpen("circuit half-open")
+            self._admit_credit -= 1.0
+
+    def record(self, now: float, exc: Optional[BaseException] = None) -> None:
+        """Feed the outcome of one attempt (``exc`` is None on success)."""
+
+        failed = exc is not None and is_breaker_failure(exc)
+        if isinstance(exc, httpx.TimeoutException):
+            self.consecutive_timeouts += 1
+        elif not failed:
+            self.consecutive_timeouts = 0
+        if self.state == "open":
+            return
+        if self.state == "half_open":
+            if failed:
+                self._open(now)
+                return
+            self._step_successes += 1
+            if self._step_successes >= self.settings.half_open_step:
+                self._step_successes = 0
+                self._admit_share *= 2
+                if self._admit_share >= 1.0:
+                    self.state = "closed"
+                    self._window.clear()
+            return
+        second = int(now)
+        window = self._window
+        if not window or window[-1][0] != second:
+            window.append([second, 0, 0])
+        window[-1][1] += 1
+        window[-1][2] += int(failed)
+        while window and window[0][0] <= second - self.settings.window_seconds:
+            window.popleft()
+        if self.settings.consecutive_timeouts and self.consecutive_timeouts >= self.settings.consecutive_timeouts:
+            self._open(now)
+            return
+        requests = sum(bucket[1] for bucket in window)
+        if requests >= self.settings.min_requests:
+            failures = sum(bucket[2] for bucket in window)
+            if failures / requests >= self.settings.error_rate:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = "open"
+        self.opened += 1
+        self._opened_at = now
+        self._window.clear()
+        self.consecutive_timeouts = 0
+
+    def error_rate(self) -> float:
+        requests = sum(bucket[1] for bucket in self._window)
+        return sum(bucket[2] for bucket in self._window) / requests if requests else 0.0
+
+    def describe(self) -> Dict[str, float]:
+        return {
+            "state": BREAKER_STATES.index(self.state),
+            "errorRate": round(self.error_rate(), 4),
+            "consecutiveTimeouts": self.consecutive_timeouts,
+            "halfOpenShare": round(self._admit_share, 4) if self.state == "half_open" else 0.0,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class BreakerRegistry:
+    """One breaker per destination planet."""
+
+    def __init__(self, settings: BreakerSettings) -> None:
+        self.settings = settings
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, destination_id: str) -> CircuitBreaker:
+        breaker = self._breakers.get(destination_id)
+        if breaker is None:
+            breaker = self._breakers[destination_id] = CircuitBreaker(self.settings)
+        return breaker
+
+    def configure(self, settings: BreakerSettings) -> None:
+        """Apply new thresholds to future and existing breakers without resetting their state."""
+
+        self.settings = settings
+        for breaker in self._breakers.values():
+            breaker.settings = settings
+
+    def describe(self) -> Dict[str, Dict[str, float]]:
+        return {destination: breaker.describe() for destination, breaker in sorted(self._breakers.items())}
+
+    def render(self) -> str:
+        """Render breaker gauges in the Prometheus text format."""
+
+        lines: List[str] = []
+        families = (
+            ("state", "gauge", "Circuit state per destination (0 closed, 1 half-open, 2 open)."),
+            ("errorRate", "gauge", "Failure ratio in the breaker's sliding window."),
+            ("halfOpenShare", "gauge", "Share of traffic admitted while half-open."),
+            ("opened", "counter", "Times the circuit opened."),
+            ("rejected", "counter", "Requests failed fast by an open or half-open circuit."),
+        )
+        snapshots = self.describe()
+        for field, kind, help_text in families:
+            snake = "".join(f"_{char.lower()}" if char.isupper() else char for char in field)
+            name = f"spaceport_breaker_{snake}" + ("_total" if kind == "counter" else "")
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for destination, snapshot in snapshots.items():
+                lines.append(f'{name}{{destination="{destination}"}} {snapshot[field]}')
+        return "\n".join(lines) + "\n"
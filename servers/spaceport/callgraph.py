@@ -0,0 +1,125 @@
+"""Downstream call graph for cross-galaxy docking.
+
+With ``CROSS_GALAXY_CALL_GRAPH`` set, a planet handling ``/dock`` calls its
+downstream planets before it returns the receipt, the way a service calls
+its dependencies. ``CROSS_GALAXY_MODE`` picks the shape of each fan-out:
+
+``gateway``
+    forward to one downstream, rotating between them. With a single
+    downstream per planet this builds a sequential chain of gateway hops.
+``federated``
+    call every downstream in turn; a failed hop ends the chain.
+``mirrored``
+    call every downstream at once and wait for all of them (fan-out/fan-in).
+
+Every hop carries the caller's remaining deadline, its depth and the planets
+already on the path, so a graph with a cycle, or one deeper than
+``CROSS_GALAXY_MAX_DEPTH``, stops instead of looping. The slowest of N
+parallel hops, or the sum of a chain, is what turns a modest per-planet p99
+into a large end-to-end one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from deadlines import DEADLINE_HEADER
+
+GRAPH_MODES = ("gateway", "mirrored", "federated")
+DEPTH_HEADER = "x-galaxy-depth"
+PATH_HEADER = "x-galaxy-path"
+WILDCARD = "*"
+
+
+class DownstreamFailed(Exception):
+    """Raised when a required downstream hop did not complete."""
+
+    def __init__(self, hops: List[Dict[str, Any]]) -> None:
+        failed = [hop["planetId"] for hop in hops if hop.get("status") == "failed"]
+        super().__init__(f"downstream hop(s) failed: {', '.join(failed)}")
+        self.hops = hops
+
+
+@lru_cache(maxsize=8)
+def parse_call_graph(spec: str) -> Dict[str, Tuple[str, ...]]:
+    """Parse ``"a:b,c;b:d;*:e"`` into ``{"a": ("b", "c"), "b": ("d",), "*": ("e",)}``.
+
+    ``*`` applies to planets without an entry of their own. Self-edges and
+    duplicates are dropped; malformed entries are skipped.
+    """
+
+    graph: Dict[str, Tuple[str, ...]] = {}
+    for entry in (spec or "").split(";"):
+        source, sep, targets = entry.partition(":")
+        source = source.strip()
+        if not sep or not source:
+            continue
+        downstreams: List[str] = []
+        for target in targets.split(","):
+            target = target.strip()
+            if target and target != source and target != WILDCARD and target not in downstreams:
+                downstreams.append(target)
+        if downstreams:
+            graph[source] = tuple(downstreams)
+    return graph
+
+
+def describe_call_graph(graph: Mapping[str, Sequence[str]]) -> str:
+    return ";".join(f"{source}:{','.join(targets)}" for source, targets in graph.items())
+
+
+def downstream_planets(graph: Mapping[str, Tuple[str, ...]], planet_id: str) -> Tuple[str, ...]:
+    return graph.get(planet_id) or graph.get(WILDCARD) or ()
+
+
+def plan_hops(mode: str, downstreams: Sequence[str], turn: int) -> List[Tuple[str, ...]]:
+    """Split the downstream calls into stages: stages run in order, the hops of a stage in parallel."""
+
+    if not downstreams:
+        return []
+    if mode == "mirrored":
+        return [tuple(downstreams)]
+    if mode == "federated":
+        return [(planet_id,) for planet_id in downstreams]
+    return [(downstreams[turn % len(downstreams)],)]
+
+
+@dataclass(frozen=True)
+class HopContext:
+    """Where a dock sits in the call graph: depth, visited planets and its absolute deadline (loop time)."""
+
+    depth: int
+    path: Tuple[str, ...]
+    deadline: float
+
+    def remaining(self, now: float) -> float:
+        return self.deadline - now
+
+    def headers(self, now: float) -> Dict[str, str]:
+        """Headers for a call one hop further down."""
+
+        return {
+            DEADLINE_HEADER: str(max(0, int(self.remaining(now) * 1000))),
+            DEPTH_HEADER: str(self.depth + 1),
+            PATH_HEADER: ",".join(self.path),
+        }
+
+
+def hop_context(headers: Mapping[str, str], planet_id: str, now: float, budget_seconds: float) -> HopContext:
+    """Build the context of an inbound dock; requests without hop headers start a new graph."""
+
+    try:
+        depth = max(0, int(headers.get(DEPTH_HEADER, "0")))
+    except ValueError:
+        depth = 0
+    path = tuple(planet for planet in headers.get(PATH_HEADER, "").split(",") if planet)
+    budget = budget_seconds
+    raw_deadline = headers.get(DEADLINE_HEADER)
+    if raw_deadline is not None:
+        try:
+            budget = min(budget, max(0.0, int(raw_deadline) / 1000))
+        except ValueError:
+            pass
+    return HopContext(depth=depth, path=(*path, planet_id), deadline=now + budget)
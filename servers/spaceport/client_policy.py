@@ -0,0 +1,140 @@
+"""Per-mission client policies: retries under a budget, and hedged requests.
+
+A docking request normally gets one attempt. A client policy adds:
+
+* retries with full-jitter exponential backoff, each one paid for from a
+  token bucket refilled at ``retryBudgetPercent`` of the mission's base rps,
+  so retries can never multiply the offered load during an outage;
+* hedging: if the first attempt is still pending after the
+  ``hedgePercentile`` latency of recent first attempts, a second copy is
+  sent and whichever answers first wins; the loser is cancelled. Hedges
+  draw on the same budget.
+
+Defaults come from ``MISSION_RETRY_*`` / ``MISSION_HEDGE_*``; a mission's
+``clientPolicy`` object overrides them field by field.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+import random
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from metrics import LatencyHistogram
+
+ATTEMPT_KINDS = ("first", "retry", "hedge")
+# Recompute the hedge delay at most this often; a quantile walks every bucket.
+HEDGE_REFRESH_SECONDS = 1.0
+# First attempts needed before the observed percentile is trusted.
+HEDGE_MIN_SAMPLES = 20
+
+
+@dataclass(frozen=True)
+class ClientPolicySettings:
+    max_retries: int = 0
+    backoff_seconds: float = 0.05
+    backoff_max_seconds: float = 1.0
+    retry_budget_percent: float = 10.0
+    hedge_percentile: float = 0.0
+    hedge_min_delay_seconds: float = 0.01
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_retries > 0 or self.hedge_percentile > 0
+
+    def for_mission(self, overrides: Optional[Mapping[str, Any]]) -> "ClientPolicySettings":
+        """Apply a mission's ``clientPolicy`` (``maxRetries``, ``retryBudgetPercent``, ``hedgePercentile``)."""
+
+        if not overrides:
+            return self
+        changes: Dict[str, Any] = {}
+        for key, field_name, cast, upper in (
+            ("maxRetries", "max_retries", int, 10),
+            ("retryBudgetPercent", "retry_budget_percent", float, 100.0),
+            ("hedgePercentile", "hedge_percentile", float, 99.9),
+        ):
+            value = overrides.get(key)
+            if value is None:
+                continue
+            try:
+                changes[field_name] = min(max(cast(value), 0), upper)
+            except (TypeError, ValueError):
+                continue
+        return replace(self, **changes)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "maxRetries": self.max_retries,
+            "backoffMs": round(self.backoff_seconds * 1000, 3),
+            "backoffMaxMs": round(self.backoff_max_seconds * 1000, 3),
+            "retryBudgetPercent": self.retry_budget_percent,
+            "hedgePercentile": self.hedge_percentile,
+            "hedgeMinDelayMs": round(self.hedge_min_delay_seconds * 1000, 3),
+        }
+
+
+class RetryBudget:
+    """Token bucket holding at most one second of retry budget."""
+
+    def __init__(self, rate_per_second: float, now: float) -> None:
+        self.rate = max(0.0, rate_per_second)
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated_at = now
+
+    def try_spend(self, now: float) -> bool:
+        if self.rate <= 0:
+            return False
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class ClientPolicy:
+    """Retry/hedge state for one mission stream."""
+
+    def __init__(self, settings: ClientPolicySettings, rps: int, now: float, rng: Any = random) -> None:
+        self.settings = settings
+        self.rng = rng
+        self.budget = RetryBudget(rps * settings.retry_budget_percent / 100.0, now)
+        self._latency = LatencyHistogram()
+        self._hedge_delay: Optional[float] = None
+        self._hedge_refreshed_at = now
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter exponential backoff before retry number ``retry`` (0-based)."""
+
+        ceiling = min(self.settings.backoff_max_seconds, self.settings.backoff_seconds * (2 ** retry))
+        return self.rng.uniform(0.0, ceiling)
+
+    def observe(self, seconds: float) -> None:
+        """Record a successful first attempt's latency for the hedge percentile."""
+
+        if self.settings.hedge_percentile > 0:
+            self._latency.record(seconds)
+
+    def hedge_delay(self, now: float) -> Optional[float]:
+        """Seconds to wait before hedging, or None when hedging is off or still warming up."""
+
+        if self.settings.hedge_percentile <= 0:
+            return None
+        if self._hedge_delay is None or now - self._hedge_refreshed_at >= HEDGE_REFRESH_SECONDS:
+            self._hedge_refreshed_at = now
+            if self._latency.count >= HEDGE_MIN_SAMPLES:
+                quantile = self._latency.quantile(self.settings.hedge_percentile / 100.0)
+                self._hedge_delay = max(self.settings.hedge_min_delay_seconds, quantile)
+        return self._hedge_delay
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Transport failures, timeouts, 429 and 5xx are retried; other 4xx are the caller's fault."""
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
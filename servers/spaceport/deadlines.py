@@ -0,0 +1,173 @@
+"""Caller deadlines and disconnects for inbound docks.
+
+Every docking request carries ``X-Galaxy-Deadline-Ms``: how long its caller
+is prepared to wait (the dispatcher's client timeout, or what is left of a
+call graph's budget). Without it a planet keeps sleeping through nebula
+latency and docking steps for callers that gave up long ago, so under
+overload it spends its capacity on answers nobody reads.
+
+With ``DOCK_DEADLINE_ENFORCED`` on, the nebula layer, admission, the docking
+steps and the call graph check the deadline (and whether the client is still
+connected) before and between steps, and abandon the dock with 504 (deadline)
+or 499 (client gone). Work done for nothing is counted as *wasted* seconds,
+docking time skipped by abandoning early as *saved* seconds. With
+enforcement off, late completions are still counted, which gives the
+baseline to compare against.
+
+The deadline is relative, so it is anchored to the moment the request
+reached the planet: the fault middleware stamps that arrival time into the
+ASGI scope before any nebula delay, and everything downstream measures the
+budget (and wasted work) from there.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, MutableMapping, Optional, Tuple
+
+DEADLINE_HEADER = "x-galaxy-deadline-ms"
+DEADLINE_STATUS = 504
+DISCONNECT_STATUS = 499
+ABANDON_REASONS = ("deadline", "disconnect")
+# Key in the ASGI ``scope["state"]`` holding the loop time the request arrived.
+ARRIVAL_STATE_KEY = "galaxy_arrived_at"
+
+Receive = Callable[[], Awaitable[dict]]
+
+
+def parse_deadline(value: Optional[str], now: float) -> Optional[float]:
+    """Turn a relative ``X-Galaxy-Deadline-Ms`` value into an absolute loop time."""
+
+    if value is None:
+        return None
+    try:
+        return now + max(0, int(value)) / 1000
+    except ValueError:
+        return None
+
+
+def mark_arrival(scope: MutableMapping[str, Any], now: float) -> None:
+    """Record when a request reached the planet; the outermost layer wins."""
+
+    scope.setdefault("state", {}).setdefault(ARRIVAL_STATE_KEY, now)
+
+
+def arrival_time(scope: Mapping[str, Any], now: float) -> float:
+    """Loop time the request arrived, or ``now`` when nothing stamped it."""
+
+    return (scope.get("state") or {}).get(ARRIVAL_STATE_KEY, now)
+
+
+class DockAbandoned(Exception):
+    """Raised when a dock is given up because its caller's deadline passed or it disconnected."""
+
+    def __init__(self, reason: str, stage: str) -> None:
+        super().__init__(f"{'deadline exceeded' if reason == 'deadline' else 'client disconnected'} at {stage}")
+        self.reason = reason
+        self.stage = stage
+        self.saved_seconds = 0.0
+
+    @property
+    def status_code(self) -> int:
+        return DEADLINE_STATUS if self.reason == "deadline" else DISCONNECT_STATUS
+
+
+class DeadlineStats:
+    """Abandoned docks by reason and stage, plus wasted and saved work."""
+
+    def __init__(self, enforced: bool = True) -> None:
+        self.enforced = enforced
+        self.abandoned: Dict[Tuple[str, str], int] = {}
+        self.late = 0
+        self.wasted_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def abandon(self, reason: str, stage: str, wasted_seconds: float, saved_seconds: float) -> None:
+        key = (reason, stage)
+        self.abandoned[key] = self.abandoned.get(key, 0) + 1
+        self.wasted_seconds += max(0.0, wasted_seconds)
+        self.saved_seconds += max(0.0, saved_seconds)
+
+    def completed_late(self, wasted_seconds: float) -> None:
+        """A dock finished after its caller's deadline: all of its work was wasted."""
+
+        self.late += 1
+        self.wasted_seconds += max(0.0, wasted_seconds)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "enforced": self.enforced,
+            "abandoned": {f"{reason}:{stage}": count for (reason, stage), count in sorted(self.abandoned.items())},
+            "late": self.late,
+            "wastedSeconds": round(self.wasted_seconds, 3),
+            "savedSeconds": round(self.saved_seconds, 3),
+        }
+
+    def render(self) -> str:
+        lines: List[str] = [
+            "# HELP spaceport_dock_abandoned_total Docks given up early, by reason (deadline, disconnect) and stage.",
+            "# TYPE spaceport_dock_abandoned_total counter",
+        ]
+        for (reason, stage), count in sorted(self.abandoned.items()):
+            lines.append(f'spaceport_dock_abandoned_total{{reason="{reason}",stage="{stage}"}} {count}')
+        lines.extend([
+            "# HELP spaceport_dock_late_total Docks completed after their caller's deadline.",
+            "# TYPE spaceport_dock_late_total counter",
+            f"spaceport_dock_late_total {self.late}",
+            "# HELP spaceport_dock_wasted_seconds_total Docking time spent on callers that had already given up.",
+            "# TYPE spaceport_dock_wasted_seconds_total counter",
+            f"spaceport_dock_wasted_seconds_total {self.wasted_seconds:.6f}",
+            "# HELP spaceport_dock_saved_seconds_total Planned docking time skipped by abandoning early.",
+            "# TYPE spaceport_dock_saved_seconds_total counter",
+            f"spaceport_dock_saved_seconds_total {self.saved_seconds:.6f}",
+        ])
+        return "\n".join(lines) + "\n"
+
+
+class DockGuard:
+    """Deadline and disconnect watch for one synchronous dock.
+
+    ``watch`` must only be called once the request body has been read: from
+    then on the next ASGI message can only be ``http.disconnect``.
+    """
+
+    def __init__(self, deadline: Optional[float], arrived_at: float) -> None:
+        self.deadline = deadline
+        self.arrived_at = arrived_at
+        self._disconnect: Optional[asyncio.Task] = None
+
+    def watch(self, receive: Receive) -> None:
+        async def wait_for_disconnect() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+
+        self._disconnect = asyncio.create_task(wait_for_disconnect())
+
+    def expired(self, now: float) -> bool:
+        return self.deadline is not None and now >= self.deadline
+
+    def check(self, stage: str) -> None:
+        """Raise ``DockAbandoned`` if the client left or the deadline passed."""
+
+        if self._disconnect is not None and self._disconnect.done():
+            raise DockAbandoned("disconnect", stage)
+        if self.expired(asyncio.get_running_loop().time()):
+            raise DockAbandoned("deadline", stage)
+
+    async def sleep(self, seconds: float, stage: str) -> None:
+        """Sleep like ``asyncio.sleep``, but wake and abandon at the deadline or on disconnect."""
+
+        timeout = seconds
+        if self.deadline is not None:
+            timeout = min(seconds, max(0.0, self.deadline - asyncio.get_running_loop().time()))
+        if self._disconnect is not None:
+            await asyncio.wait({self._disconnect}, timeout=timeout)
+        else:
+            await asyncio.sleep(timeout)
+        if timeout < seconds or (self._disconnect is not None and self._disconnect.done()):
+            self.check(stage)
+            raise DockAbandoned("deadline", stage)
+
+    def close(self) -> None:
+        if self._disconnect is not None and not self._disconnect.done():
+            self._disconnect.cancel()
@@ -0,0 +1,192 @@
+"""Bounded in-process work queue for asynchronous docking.
+
+In async mode ``/dock`` only enqueues the job and answers 202 with a ticket,
+so the caller's connection is released immediately. A fixed number of worker
+tasks drain the queue; each job records when it was enqueued, started and
+finished so queueing delay and service time can be observed separately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import uuid
+
+from metrics import LatencyHistogram, render_histogram
+
+logger = logging.getLogger("spaceport")
+
+
+class DockingQueueFull(Exception):
+    """Raised when the bounded docking queue cannot accept another job."""
+
+
+@dataclass
+class DockingJob:
+    ticket: str
+    payload: Any
+    enqueued_at: float
+    status: str = "queued"
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def describe(self) -> Dict[str, Any]:
+        queue_delay = (self.started_at - self.enqueued_at) if self.started_at is not None else None
+        service_time = (
+            (self.completed_at - self.started_at)
+            if self.completed_at is not None and self.started_at is not None
+            else None
+        )
+        return {
+            "ticket": self.ticket,
+            "status": self.status,
+            "queueDelaySeconds": round(queue_delay, 6) if queue_delay is not None else None,
+            "serviceSeconds": round(service_time, 6) if service_time is not None else None,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+@dataclass
+class DockingQueueStats:
+    enqueued: int = 0
+    rejected: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_delay: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class DockingWorkQueue:
+    """Fixed-capacity queue drained by ``workers`` concurrent tasks."""
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Dict[str, Any]]],
+        capacity: int,
+        workers: int,
+        retention: int,
+    ) -> None:
+        self._handler = handler
+        self.capacity = capacity
+        self.workers = workers
+        # Keep at least every job that can still be pending.
+        self.retention = max(retention, capacity + workers)
+        self.stats = DockingQueueStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._jobs: "OrderedDict[str, DockingJob]" = OrderedDict()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.capacity)
+        self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def submit(self, payload: Any) -> DockingJob:
+        """Enqueue a docking job or raise ``DockingQueueFull``."""
+
+        if self._queue is None:
+            raise DockingQueueFull("docking queue is not running")
+        job = DockingJob(
+            ticket=uuid.uuid4().hex,
+            payload=payload,
+            enqueued_at=asyncio.get_running_loop().time(),
+        )
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            raise DockingQueueFull(f"docking queue is full ({self.capacity} jobs)") from None
+        self.stats.enqueued += 1
+        self._jobs[job.ticket] = job
+        while len(self._jobs) > self.retention:
+            self._jobs.popitem(last=False)
+        return job
+
+    def get(self, ticket: str) -> Optional[DockingJob]:
+        return self._jobs.get(ticket)
+
+    async def _worker(self, index: int) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            job: DockingJob = await self._queue.get()
+            job.status = "running"
+            job.started_at = loop.time()
+            self.stats.queue_delay.record(job.started_at - job.enqueued_at)
+            try:
+                job.result = await self._handler(job.payload)
+                job.status = "completed"
+                self.stats.completed += 1
+            except asyncio.CancelledError:
+                job.status = "cancelled"
+                raise
+            except Exception as exc:  # pragma: no cover - defensive logging for worker
+                job.status = "failed"
+                job.error = str(exc)
+                self.stats.failed += 1
+                logger.warning("Docking job %s failed in worker %s: %s", job.ticket, index, exc)
+            finally:
+                job.completed_at = loop.time()
+                self.stats.service_time.record(job.completed_at - job.started_at)
+                job.payload = None
+                self._queue.task_done()
+
+    def describe(self) -> Dict[str, Any]:
+        stats = self.stats
+        return {
+            "capacity": self.capacity,
+            "workers": self.workers,
+            "depth": self.depth,
+            "enqueued": stats.enqueued,
+            "rejected": stats.rejected,
+            "completed": stats.completed,
+            "failed": stats.failed,
+            "queueDelayP50Seconds": stats.queue_delay.quantile(0.5),
+            "queueDelayP99Seconds": stats.queue_delay.quantile(0.99),
+            "serviceP50Seconds": stats.service_time.quantile(0.5),
+            "serviceP99Seconds": stats.service_time.quantile(0.99),
+        }
+
+    def render(self) -> str:
+        """Render queue gauges, counters and histograms in the Prometheus text format."""
+
+        stats = self.stats
+        lines = [
+            "# HELP spaceport_dock_queue_depth Async docking jobs waiting for a worker.",
+            "# TYPE spaceport_dock_queue_depth gauge",
+            f"spaceport_dock_queue_depth {self.depth}",
+            "# HELP spaceport_dock_queue_jobs_total Async docking jobs by outcome.",
+            "# TYPE spaceport_dock_queue_jobs_total counter",
+            f'spaceport_dock_queue_jobs_total{{outcome="enqueued"}} {stats.enqueued}',
+            f'spaceport_dock_queue_jobs_total{{outcome="rejected"}} {stats.rejected}',
+            f'spaceport_dock_queue_jobs_total{{outcome="completed"}} {stats.completed}',
+            f'spaceport_dock_queue_jobs_total{{outcome="failed"}} {stats.failed}',
+            "# HELP spaceport_dock_queue_delay_seconds Time async docking jobs spent waiting in the queue.",
+            "# TYPE spaceport_dock_queue_delay_seconds histogram",
+        ]
+        render_histogram(lines, "spaceport_dock_queue_delay_seconds", stats.queue_delay)
+        lines.append("# HELP spaceport_dock_queue_service_seconds Time async docking jobs spent being processed.")
+        lines.append("# TYPE spaceport_dock_queue_service_seconds histogram")
+        render_histogram(lines, "spaceport_dock_queue_service_seconds", stats.service_time)
+        return "\n".join(lines) + "\n"
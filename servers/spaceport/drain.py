@@ -0,0 +1,137 @@
+"""Graceful drain for planet rollouts.
+
+Before a pod is replaced it should stop taking work rather than have its
+in-flight docks killed at the end of the termination grace period. Once a
+drain begins, ``/readyz`` fails so the Service stops routing to the planet,
+new ``/dock`` requests are refused with 503, and the docks already running
+(sync and queued) get up to ``DRAIN_TIMEOUT_SECONDS`` to finish. Whatever is
+still running at the deadline is cancelled and answered with 503. The drain
+records how long it took and how many docks completed or were cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+# How often the drain checks whether the in-flight docks have finished.
+DRAIN_POLL_SECONDS = 0.05
+
+
+class DockCancelled(Exception):
+    """Raised when an in-flight dock is cancelled because the drain deadline passed."""
+
+
+class DrainController:
+    """Tracks in-flight docks and the state of the planet's drain."""
+
+    def __init__(self) -> None:
+        self.draining = False
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self._docks: Set[asyncio.Task] = set()
+        self._drained: Optional[asyncio.Event] = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._docks)
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    async def run(self, dock: Awaitable[Any]) -> Any:
+        """Run one dock as a tracked task so a drain can wait for it or cancel it."""
+
+        task = asyncio.ensure_future(dock)
+        self._docks.add(task)
+        task.add_done_callback(self._dock_done)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if task.cancelled() and current is not None and not current.cancelling():
+                # Cancelled by the drain, not by our own caller.
+                raise DockCancelled("docking cancelled: planet is draining") from None
+            raise
+
+    def _dock_done(self, task: asyncio.Task) -> None:
+        self._docks.discard(task)
+        if not self.draining:
+            return
+        if task.cancelled():
+            self.cancelled += 1
+        else:
+            self.completed += 1
+
+    def begin(self, now: float) -> bool:
+        """Enter drain mode; returns False if a drain is already under way or done."""
+
+        if self.draining:
+            return False
+        self.draining = True
+        self.started_at = now
+        self._drained = asyncio.Event()
+        return True
+
+    async def settle(self, timeout_seconds: float, queue_idle: Callable[[], bool]) -> None:
+        """Wait for in-flight docks and the queue to empty, then cancel whatever is left."""
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        while (self._docks or not queue_idle()) and loop.time() < deadline:
+            await asyncio.sleep(DRAIN_POLL_SECONDS)
+        leftovers = list(self._docks)
+        for task in leftovers:
+            task.cancel()
+        await asyncio.gather(*leftovers, return_exceptions=True)
+
+    def finish(self, now: float) -> None:
+        self.finished_at = now
+        if self._drained is not None:
+            self._drained.set()
+
+    async def wait_drained(self) -> None:
+        if self._drained is not None:
+            await self._drained.wait()
+
+    def describe(self) -> Dict[str, Any]:
+        duration = self.duration_seconds
+        return {
+            "draining": self.draining,
+            "drained": self.finished_at is not None,
+            "inFlight": self.in_flight,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "durationSeconds": round(duration, 3) if duration is not None else None,
+        }
+
+    def render(self) -> str:
+        """Render the drain state in the Prometheus text format."""
+
+        duration = self.duration_seconds
+        lines: List[str] = [
+            "# HELP spaceport_draining Whether the planet is draining (1) or serving (0).",
+            "# TYPE spaceport_draining gauge",
+            f"spaceport_draining {int(self.draining)}",
+            "# HELP spaceport_drain_docks_in_flight Docks currently running (sync and queued).",
+            "# TYPE spaceport_drain_docks_in_flight gauge",
+            f"spaceport_drain_docks_in_flight {self.in_flight}",
+            "# HELP spaceport_drain_docks_total In-flight docks at drain time, by how they ended.",
+            "# TYPE spaceport_drain_docks_total counter",
+            f'spaceport_drain_docks_total{{outcome="completed"}} {self.completed}',
+            f'spaceport_drain_docks_total{{outcome="cancelled"}} {self.cancelled}',
+            "# HELP spaceport_drain_rejected_total Docking requests refused with 503 while draining.",
+            "# TYPE spaceport_drain_rejected_total counter",
+            f"spaceport_drain_rejected_total {self.rejected}",
+            "# HELP spaceport_drain_duration_seconds How long the last drain took (0 until it finished).",
+            "# TYPE spaceport_drain_duration_seconds gauge",
+            f"spaceport_drain_duration_seconds {duration or 0.0:.6f}",
+        ]
+        return "\n".join(lines) + "\n"
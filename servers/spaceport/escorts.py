@@ -0,0 +1,50 @@
+"""Escort companion streams that ride alongside a mission's docking traffic.
+
+A mission with ``escortEnabled`` runs one extra open-loop stream per entry
+in ``MISSION_ESCORT_STREAMS``, each at a fixed ratio of the mission rps and
+through the same connection pool as the docking requests. The mix of cheap
+pings, fleet-backed ``/status`` reads and large ``/cargo`` downloads next to
+the ``POST /dock`` writes makes head-of-line blocking in the destination's
+event loop and in shared connections visible, stream by stream.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+# kind -> (method, path on the destination planet)
+ESCORT_KINDS: Dict[str, Tuple[str, str]] = {
+    "ping": ("GET", "/healthz"),
+    "status": ("GET", "/status"),
+    "cargo": ("GET", "/cargo"),
+}
+
+
+@dataclass(frozen=True)
+class EscortStream:
+    kind: str
+    ratio: float
+
+
+def parse_escort_streams(spec: str) -> Tuple[EscortStream, ...]:
+    """Parse ``kind:ratio`` pairs (``"ping:0.1,cargo:0.05"``); unknown kinds and bad ratios are skipped."""
+
+    streams: Dict[str, EscortStream] = {}
+    for entry in (spec or "").split(","):
+        kind, _, ratio = entry.strip().partition(":")
+        kind = kind.strip().lower()
+        if kind not in ESCORT_KINDS:
+            continue
+        try:
+            value = float(ratio) if ratio.strip() else 0.1
+        except ValueError:
+            continue
+        if value > 0:
+            streams[kind] = EscortStream(kind, min(value, 100.0))
+    return tuple(streams.values())
+
+
+def describe_escort_streams(streams: Tuple[EscortStream, ...]) -> str:
+    return ",".join(f"{stream.kind}:{stream.ratio:g}" for stream in streams)
+
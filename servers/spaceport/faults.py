@@ -0,0 +1,391 @@
+"""Nebula latency and chaos failures as a pure ASGI middleware.
+
+``@app.middleware("http")`` goes through Starlette's ``BaseHTTPMiddleware``,
+which wraps every request in an extra task and memory streams. On the path we
+load-test that overhead is paid even when no fault is configured, so this
+layer talks ASGI directly, resolves protected paths with one set lookup and
+returns straight to the app when every fault is switched off.
+
+Latency is drawn per request from a configurable distribution so a planet can
+be given a realistic tail instead of a constant delay:
+
+``fixed``      always ``base_ms``
+``uniform``    ``base_ms`` +/- ``spread_ms``
+``lognormal``  median ``base_ms`` with shape ``sigma``
+``pareto``     minimum ``base_ms`` with tail index ``pareto_alpha``
+``bimodal``    ``base_ms``, or ``slow_ms`` for a ``slow_fraction`` of requests
+
+Chaos picks at most one failure shape per request, each with its own rate:
+
+``error``        JSON 500 (the original chaos experiment)
+``unavailable``  503 with ``Retry-After``
+``reset``        connection aborted with a TCP RST before any response bytes
+``hang``         no response until the client gives up (or ``hang_seconds``)
+``trickle``      a small body sent one byte every ``trickle_byte_delay_ms``
+``truncated``    ``Content-Length`` promises more than is sent, then the
+                 connection is closed
+``large``        a 200 with a ``large_bytes`` JSON body
+
+A nebula delay longer than the caller's ``X-Galaxy-Deadline-Ms`` is cut short
+at the deadline and answered with 504 when deadlines are enforced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import math
+import random
+import socket
+import struct
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from deadlines import DEADLINE_HEADER, DEADLINE_STATUS, DeadlineStats, mark_arrival
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "pareto", "bimodal")
+FAULT_MODES = ("error", "unavailable", "reset", "hang", "trickle", "truncated", "large")
+LARGE_CHUNK_BYTES = 64 * 1024
+
+Scope = dict
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class FaultSettings:
+    """Fault-injection knobs, built from ``UniverseConfig``."""
+
+    latency_enabled: bool = False
+    distribution: str = "fixed"
+    base_ms: float = 0.0
+    spread_ms: float = 0.0
+    sigma: float = 0.5
+    pareto_alpha: float = 1.5
+    slow_ms: float = 0.0
+    slow_fraction: float = 0.05
+    max_ms: float = 60000.0
+    chaos_enabled: bool = False
+    chaos_failure_rate: float = 0.18
+    unavailable_rate: float = 0.0
+    reset_rate: float = 0.0
+    hang_rate: float = 0.0
+    trickle_rate: float = 0.0
+    truncated_rate: float = 0.0
+    large_rate: float = 0.0
+    retry_after_seconds: int = 1
+    hang_seconds: float = 300.0
+    trickle_byte_delay_ms: float = 50.0
+    large_bytes: int = 1024 * 1024
+
+    def fault_rates(self) -> Dict[str, float]:
+        return {
+            "error": self.chaos_failure_rate,
+            "unavailable": self.unavailable_rate,
+            "reset": self.reset_rate,
+            "hang": self.hang_rate,
+            "trickle": self.trickle_rate,
+            "truncated": self.truncated_rate,
+            "large": self.large_rate,
+        }
+
+
+def build_latency_sampler(settings: FaultSettings) -> Optional[Callable[[], float]]:
+    """Return a callable drawing one delay in seconds, or None when latency is off."""
+
+    if not settings.latency_enabled:
+        return None
+    base = max(0.0, settings.base_ms)
+    cap = settings.max_ms if settings.max_ms > 0 else math.inf
+    distribution = settings.distribution
+    if distribution == "uniform":
+        low = max(0.0, base - settings.spread_ms)
+        high = base + settings.spread_ms
+        if high <= 0:
+            return None
+        draw = lambda: random.uniform(low, high)  # noqa: E731
+    elif distribution == "lognormal" and base > 0:
+        mu = math.log(base)
+        sigma = max(0.0, settings.sigma)
+        draw = lambda: random.lognormvariate(mu, sigma)  # noqa: E731
+    elif distribution == "pareto" and base > 0:
+        alpha = max(0.01, settings.pareto_alpha)
+        draw = lambda: base * random.paretovariate(alpha)  # noqa: E731
+    elif distribution == "bimodal":
+        slow = max(0.0, settings.slow_ms)
+        fraction = min(1.0, max(0.0, settings.slow_fraction))
+        if base <= 0 and (slow <= 0 or fraction <= 0):
+            return None
+        draw = lambda: slow if random.random() < fraction else base  # noqa: E731
+    else:
+        if base <= 0:
+            return None
+        return lambda: min(base, cap) / 1000.0
+    return lambda: min(draw(), cap) / 1000.0
+
+
+class FaultPlan:
+    """Precomputed fault behaviour; ``configure`` swaps it in place.
+
+    Fault rates are laid out as cumulative thresholds so one ``random()`` draw
+    picks the failure shape. Rates summing past 1.0 starve the later modes.
+    """
+
+    def __init__(self, settings: FaultSettings) -> None:
+        self.injected: Dict[str, int] = {mode: 0 for mode in FAULT_MODES}
+        self.configure(settings)
+
+    def configure(self, settings: FaultSettings) -> None:
+        self.settings = settings
+        self.sample_delay = build_latency_sampler(settings)
+        thresholds: List[Tuple[float, str]] = []
+        total = 0.0
+        if settings.chaos_enabled:
+            for mode, rate in settings.fault_rates().items():
+                if rate > 0:
+                    total = min(1.0, total + rate)
+                    thresholds.append((total, mode))
+        self.thresholds = tuple(thresholds)
+        self.failure_rate = total
+        self.large_chunk = _large_chunk(min(settings.large_bytes, LARGE_CHUNK_BYTES))
+        self.active = self.sample_delay is not None or self.failure_rate > 0
+
+    def pick(self, roll: float) -> Optional[str]:
+        for threshold, mode in self.thresholds:
+            if roll < threshold:
+                return mode
+        return None
+
+    def render(self) -> str:
+        """Render injected fault counters in the Prometheus text format."""
+
+        lines = [
+            "# HELP spaceport_faults_injected_total Requests answered by the chaos layer, by failure shape.",
+            "# TYPE spaceport_faults_injected_total counter",
+        ]
+        for mode in FAULT_MODES:
+            lines.append(f'spaceport_faults_injected_total{{mode="{mode}"}} {self.injected[mode]}')
+        return "\n".join(lines) + "\n"
+
+
+def _large_chunk(size: int) -> bytes:
+    return b"x" * max(0, size)
+
+
+def _json_body(payload: dict) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
+
+def _headers(content_type: bytes, length: int, *extra: Tuple[bytes, bytes]) -> List[Tuple[bytes, bytes]]:
+    return [(b"content-type", content_type), (b"content-length", str(length).encode("ascii")), *extra]
+
+
+def _server_transport(send: Send):
+    """Best-effort lookup of the server transport behind ``send``.
+
+    uvicorn's ``send`` is a method of an object holding the asyncio transport;
+    Starlette middleware wraps it in closures, so unwrap a few levels of those.
+    """
+
+    candidates = [send]
+    for _ in range(8):
+        if not candidates:
+            break
+        candidate = candidates.pop()
+        transport = getattr(getattr(candidate, "__self__", None), "transport", None)
+        if transport is not None:
+            return transport
+        for cell in getattr(candidate, "__closure__", None) or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                continue
+            if callable(value):
+                candidates.append(value)
+    return None
+
+
+async def _drop_connection(send: Send, reset: bool) -> bool:
+    """Close the client connection mid-exchange; with ``reset`` send a TCP RST.
+
+    Returns False when the server does not expose its transport.
+    """
+
+    transport = _server_transport(send)
+    if transport is None:
+        return False
+    if reset:
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            except OSError:  # pragma: no cover - platform specific
+                pass
+        transport.abort()
+    else:
+        transport.close()
+    # Let connection_lost run so the server does not try to answer for us.
+    await asyncio.sleep(0)
+    return True
+
+
+async def _fault_error(plan: FaultPlan, receive: Receive, send: Send) -> None:
+    body = _json_body(
+        {
+            "error": "Chaos experiments triggered a simulated failure.",
+            "timestamp": datetime.utcnow().isoformat(),
+            "config": {
+                "chaosExperimentsEnabled": plan.settings.chaos_enabled,
+                "chaosFailureRate": plan.settings.chaos_failure_rate,
+            },
+        }
+    )
+    await send({"type": "http.response.start", "status": 500, "headers": _headers(b"application/json", len(body))})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _fault_unavailable(plan: FaultPlan, receive: Receive, send: Send) -> None:
+    retry_after = str(plan.settings.retry_after_seconds).encode("ascii")
+    body = _json_body(
+        {"error": "Chaos experiments simulated an unavailable planet.", "timestamp": datetime.utcnow().isoformat()}
+    )
+    headers = _headers(b"application/json", len(body), (b"retry-after", retry_after))
+    await send({"type": "http.response.start", "status": 503, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _fault_reset(plan: FaultPlan, receive: Receive, send: Send) -> None:
+    if not await _drop_connection(send, reset=True):
+        # No transport handle: fail after the headers so the server drops the connection.
+        await send({"type": "http.response.start", "status": 200, "headers": _headers(b"application/json", 1)})
+        raise ConnectionResetError("chaos: simulated connection reset")
+
+
+async def _fault_hang(plan: FaultPlan, receive: Receive, send: Send) -> None:
+    async def wait_for_disconnect() -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    try:
+        await asyncio.wait_for(wait_for_disconnect(), timeout=plan.settings.hang_seconds)
+    except asyncio.TimeoutError:
+        await _fault_reset(plan, receive, send)
+
+
+async def _fault_trickle(plan: FaultPlan, receive: Receive, send: Send) -> None:
+    body = _json_body({"status": "trickling", "timestamp": datetime.utcnow().isoformat()})
+    delay = plan.settings.trickle_byte_delay_ms / 1000.0
+    await send({"type": "http.response.start", "status": 200, "headers": _headers(b"application/json", len(body))})
+    for index in range(len(body)):
+        await send({"type": "http.response.body", "body": body[index : index + 1], "more_body": True})
+        await asyncio.sleep(delay)
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _fault_truncated(plan: FaultPlan, receive: Receive, send: Send) -> None:
+    body = _json_body({"status": "truncated", "timestamp": datetime.utcnow().isoformat()})
+    await send({"type": "http.response.start", "status": 200, "headers": _headers(b"application/json", len(body))})
+    await send({"type": "http.response.body", "body": body[: len(body) // 2], "more_body": True})
+    if not await _drop_connection(send, reset=False):
+        raise ConnectionAbortedError("chaos: simulated truncated response")
+
+
+async def _fault_large(plan: FaultPlan, receive: Receive, send: Send) -> None:
+    prefix, suffix = b'{"padding":"', b'"}'
+    padding = max(0, plan.settings.large_bytes - len(prefix) - len(suffix))
+    chunk = plan.large_chunk or b"x"
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": _headers(b"application/json", len(prefix) + padding + len(suffix)),
+        }
+    )
+    await send({"type": "http.response.body", "body": prefix, "more_body": True})
+    while padding > 0:
+        piece = chunk[:padding]
+        padding -= len(piece)
+        await send({"type": "http.response.body", "body": piece, "more_body": True})
+    await send({"type": "http.response.body", "body": suffix})
+
+
+async def _deadline_exceeded(send: Send) -> None:
+    body = _json_body(
+        {
+            "error": "Deadline exceeded while crossing the nebula.",
+            "stage": "nebula",
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    )
+    headers = _headers(b"application/json", len(body))
+    await send({"type": "http.response.start", "status": DEADLINE_STATUS, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _deadline_seconds(scope: Scope) -> Optional[float]:
+    name = DEADLINE_HEADER.encode("latin-1")
+    for key, value in scope.get("headers") or ():
+        if key == name:
+            try:
+                return max(0, int(value)) / 1000
+            except ValueError:
+                return None
+    return None
+
+
+FAULT_HANDLERS: Dict[str, Callable[[FaultPlan, Receive, Send], Awaitable[None]]] = {
+    "error": _fault_error,
+    "unavailable": _fault_unavailable,
+    "reset": _fault_reset,
+    "hang": _fault_hang,
+    "trickle": _fault_trickle,
+    "truncated": _fault_truncated,
+    "large": _fault_large,
+}
+
+
+class FaultInjectionMiddleware:
+    """Raw ASGI middleware applying a ``FaultPlan`` to unprotected HTTP paths."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        plan: FaultPlan,
+        protected_paths: Iterable[str] = (),
+        deadlines: Optional[DeadlineStats] = None,
+    ) -> None:
+        self.app = app
+        self.plan = plan
+        self.deadlines = deadlines
+        self.protected = frozenset(
+            variant for path in protected_paths for variant in (path.rstrip("/") or "/", path.rstrip("/") + "/")
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            # Deadlines are relative to arrival, not to the end of the nebula delay.
+            mark_arrival(scope, asyncio.get_running_loop().time())
+        plan = self.plan
+        if not plan.active or scope["type"] != "http" or scope["path"] in self.protected:
+            await self.app(scope, receive, send)
+            return
+        if plan.sample_delay is not None:
+            delay = plan.sample_delay()
+            if delay > 0:
+                deadlines = self.deadlines
+                remaining = _deadline_seconds(scope) if deadlines is not None and deadlines.enforced else None
+                if remaining is not None and delay >= remaining:
+                    await asyncio.sleep(remaining)
+                    deadlines.abandon("deadline", "nebula", wasted_seconds=remaining, saved_seconds=delay - remaining)
+                    await _deadline_exceeded(send)
+                    return
+                await asyncio.sleep(delay)
+        if plan.failure_rate:
+            mode = plan.pick(random.random())
+            if mode is not None:
+                plan.injected[mode] += 1
+                await FAULT_HANDLERS[mode](plan, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -0,0 +1,69 @@
+"""Client-side helpers for talking to the Fleet API.
+
+``FleetResponseCache`` remembers the last good body and ``ETag`` per request so
+polls can revalidate with ``If-None-Match`` (a 304 costs the fleet almost
+nothing) and so a fleet outage can be bridged by serving the last good orders.
+``poll_delay`` spreads planets out after failures with capped exponential
+backoff and jitter, which avoids a thundering herd when the fleet restarts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+# Long-poll parameters change on every call but do not change the resource.
+VOLATILE_PARAMS = {"sinceRevision", "waitSeconds"}
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    data: Any
+    fetched_at: float
+
+
+class FleetResponseCache:
+    """Last-good-response cache keyed by path and (stable) query params."""
+
+    def __init__(self, max_stale_seconds: float) -> None:
+        self.max_stale_seconds = max_stale_seconds
+        self._entries: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], CachedResponse] = {}
+
+    @staticmethod
+    def key(
+        path: str, params: Optional[Mapping[str, Union[str, int, float]]]
+    ) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        stable = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if k not in VOLATILE_PARAMS))
+        return path, stable
+
+    def get(self, key: Tuple[str, Tuple[Tuple[str, str], ...]]) -> Optional[CachedResponse]:
+        return self._entries.get(key)
+
+    def store(self, key: Tuple[str, Tuple[Tuple[str, str], ...]], etag: Optional[str], data: Any) -> None:
+        self._entries[key] = CachedResponse(etag=etag, data=data, fetched_at=time.monotonic())
+
+    def touch(self, key: Tuple[str, Tuple[Tuple[str, str], ...]]) -> None:
+        entry = self._entries.get(key)
+        if entry:
+            entry.fetched_at = time.monotonic()
+
+    def servable_when_stale(self, entry: CachedResponse) -> bool:
+        return time.monotonic() - entry.fetched_at <= self.max_stale_seconds
+
+
+def poll_delay(interval: float, failures: int, max_backoff: float, jitter: float) -> float:
+    """Return the next poll delay.
+
+    Healthy polls wait ``interval`` +/- ``jitter`` (a ratio). After failures the
+    ceiling doubles per consecutive failure up to ``max_backoff`` and the delay
+    is drawn uniformly below it ("full jitter").
+    """
+
+    if failures <= 0:
+        spread = interval * jitter
+        return max(0.0, random.uniform(interval - spread, interval + spread))
+    ceiling = min(max_backoff, interval * (2 ** min(failures, 16)))
+    return random.uniform(min(interval, ceiling) * 0.1, ceiling)
@@ -0,0 +1,166 @@
+"""Adaptive (AIMD) concurrency limiting for mission dispatch.
+
+One limiter exists per destination base URL. Requests acquire a slot before
+they are sent; when the in-flight count is at the current limit they wait in a
+bounded queue, and once that queue is full (or the wait times out) they are
+shed locally instead of piling up sockets and coroutines. The limit grows
+additively while responses come back fast and shrinks multiplicatively on
+overload signals (timeouts, transport errors, 429/503, slow responses).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Dict, List
+
+import httpx
+
+from slots import SlotQueue
+
+
+# With no explicit latency target, a response counts as slow once it has used
+# this share of the dispatch timeout.
+TARGET_TIMEOUT_FRACTION = 0.8
+
+
+class LoadShed(Exception):
+    """Raised when a request is dropped locally because the limiter is saturated."""
+
+
+@dataclass(frozen=True)
+class LimiterSettings:
+    """Tuning knobs shared by every destination limiter."""
+
+    initial_limit: int = 20
+    min_limit: int = 1
+    max_limit: int = 100
+    latency_target_seconds: float = 4.0
+    backoff_ratio: float = 0.7
+    max_queue: int = 100
+    queue_timeout_seconds: float = 1.0
+
+
+def is_overload_signal(exc: BaseException) -> bool:
+    """Return True when a failure suggests the destination is saturated."""
+
+    if isinstance(exc, (httpx.TimeoutException, httpx.TransportError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in {429, 503}
+    return False
+
+
+class AdaptiveConcurrencyLimiter(SlotQueue):
+    """AIMD limiter with a bounded FIFO wait queue."""
+
+    def __init__(self, settings: LimiterSettings) -> None:
+        super().__init__()
+        self.settings = settings
+        self.limit = float(max(settings.min_limit, min(settings.max_limit, settings.initial_limit)))
+        self.delayed = 0
+        self.shed = 0
+        self.increases = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return int(self.limit)
+
+    def saturated(self) -> bool:
+        """True when a new request could neither run nor queue right now."""
+
+        return self.in_flight >= self.capacity and self.queued >= self.settings.max_queue
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting if necessary. Returns True when the caller was delayed.
+
+        Raises ``LoadShed`` if the wait queue is full or the wait times out.
+        """
+
+        if self.try_take():
+            return False
+        if self.queued >= self.settings.max_queue:
+            self.shed += 1
+            raise LoadShed("concurrency limit reached and wait queue full")
+        if not await self.wait_for_slot(self.settings.queue_timeout_seconds):
+            self.shed += 1
+            raise LoadShed("timed out waiting for a concurrency slot")
+        self.delayed += 1
+        return True
+
+    def release(self, service_seconds: float, overloaded: bool) -> None:
+        """Return a slot and adapt the limit from the observed outcome."""
+
+        settings = self.settings
+        if overloaded or service_seconds > settings.latency_target_seconds:
+            now = time.monotonic()
+            # At most one multiplicative decrease per latency window.
+            if now - self._last_decrease >= settings.latency_target_seconds:
+                self.limit = max(float(settings.min_limit), self.limit * settings.backoff_ratio)
+                self._last_decrease = now
+                self.decreases += 1
+        elif self.in_flight >= self.capacity:
+            # Only grow while the current limit is actually being used.
+            self.limit = min(float(settings.max_limit), self.limit + 1.0 / self.limit)
+            self.increases += 1
+        self.release_slot()
+
+    def describe(self) -> Dict[str, float]:
+        return {
+            "limit": round(self.limit, 2),
+            "inFlight": self.in_flight,
+            "queued": self.queued,
+            "delayed": self.delayed,
+            "shed": self.shed,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+class LimiterRegistry:
+    """One limiter per destination base URL."""
+
+    def __init__(self, settings: LimiterSettings) -> None:
+        self.settings = settings
+        self._limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def limiter(self, base_url: str) -> AdaptiveConcurrencyLimiter:
+        key = base_url.rstrip("/")
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = AdaptiveConcurrencyLimiter(self.settings)
+        return limiter
+
+    def configure(self, settings: LimiterSettings) -> None:
+        """Apply new tuning to future and existing limiters, keeping their learned limits in range."""
+
+        self.settings = settings
+        for limiter in self._limiters.values():
+            limiter.settings = settings
+            limiter.limit = float(max(settings.min_limit, min(settings.max_limit, limiter.limit)))
+            limiter.wake()
+
+    def describe(self) -> Dict[str, Dict[str, float]]:
+        return {key: limiter.describe() for key, limiter in sorted(self._limiters.items())}
+
+    def render(self) -> str:
+        """Render limiter gauges in the Prometheus text format."""
+
+        lines: List[str] = []
+        families = (
+            ("limit", "gauge", "Current adaptive concurrency limit per destination."),
+            ("inFlight", "gauge", "Requests holding a concurrency slot per destination."),
+            ("queued", "gauge", "Requests waiting for a concurrency slot per destination."),
+            ("delayed", "counter", "Requests that waited for a concurrency slot."),
+            ("shed", "counter", "Requests dropped locally because the limiter was saturated."),
+        )
+        snapshots = self.describe()
+        for field, kind, help_text in families:
+            name = f"spaceport_limiter_{field.lower()}" + ("_total" if kind == "counter" else "")
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for destination, snapshot in snapshots.items():
+                lines.append(f'{name}{{destination="{destination}"}} {snapshot[field]}')
+        return "\n".join(lines) + "\n"
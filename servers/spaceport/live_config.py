@@ -0,0 +1,133 @@
+"""Runtime configuration overrides for a running planet.
+
+``UniverseConfig`` is parsed from environment variables at import. Overrides
+use the same variable names and are layered on top, either from a mounted
+file or from ``PUT /config``. Whichever source wrote last replaces the whole
+override set; removing the mounted file withdraws what it applied. A ConfigMap mounted as a volume projects one
+file per key, so a directory is read as ``{file name: contents}``; a single
+file may hold a JSON object or ``KEY=VALUE`` lines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+import re
+from typing import Any, Callable, Dict, Mapping, Optional
+
+logger = logging.getLogger("spaceport")
+
+ENV_NAME_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+
+def normalize_overrides(values: Mapping[str, Any]) -> Dict[str, str]:
+    """Validate override names and render values the way the environment holds them."""
+
+    overrides: Dict[str, str] = {}
+    for name, value in values.items():
+        if not isinstance(name, str) or not ENV_NAME_PATTERN.match(name):
+            raise ValueError(f"'{name}' is not an environment variable name")
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            overrides[name] = "true" if value else "false"
+        elif isinstance(value, (str, int, float)):
+            overrides[name] = str(value).strip()
+        else:
+            raise ValueError(f"'{name}' must be a string, number or boolean")
+    return overrides
+
+
+def _parse_file(text: str) -> Dict[str, Any]:
+    stripped = text.strip()
+    if not stripped:
+        return {}
+    if stripped.startswith("{"):
+        payload = json.loads(stripped)
+        if not isinstance(payload, dict):
+            raise ValueError("config file must hold a JSON object")
+        return payload
+    values: Dict[str, Any] = {}
+    for line in stripped.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, separator, value = line.partition("=")
+        if not separator:
+            raise ValueError(f"expected KEY=VALUE, got '{line}'")
+        values[name.strip()] = value.strip()
+    return values
+
+
+def read_config_source(path: Path) -> Dict[str, str]:
+    """Read overrides from a ConfigMap-style directory or a single file."""
+
+    if path.is_dir():
+        values = {
+            entry.name: entry.read_text(encoding="utf-8").strip()
+            for entry in sorted(path.iterdir())
+            if not entry.name.startswith(".") and entry.is_file()
+        }
+    else:
+        values = _parse_file(path.read_text(encoding="utf-8"))
+    return normalize_overrides(values)
+
+
+class ConfigFileWatcher:
+    """Poll a config path and call ``on_change`` whenever its overrides change."""
+
+    def __init__(self, path: str, interval_seconds: float, on_change: Callable[[Dict[str, str]], Any]) -> None:
+        self.path = Path(path)
+        self.interval_seconds = interval_seconds
+        self._on_change = on_change
+        self._last: Optional[Dict[str, str]] = None
+        self._task: Optional[asyncio.Task] = None
+        self.errors = 0
+
+    def poll(self) -> bool:
+        """Read the source once; returns True when new overrides were applied."""
+
+        if not self.path.exists():
+            if not self._last:
+                return False
+            # The source was removed: withdraw the overrides it applied.
+            overrides: Dict[str, str] = {}
+        else:
+            try:
+                overrides = read_config_source(self.path)
+            except (OSError, ValueError) as exc:
+                self.errors += 1
+                logger.warning("Ignoring unreadable config at %s: %s", self.path, exc)
+                return False
+        if overrides == self._last:
+            return False
+        try:
+            self._on_change(overrides)
+        except Exception as exc:
+            # Keep watching; the same overrides are retried on the next poll.
+            self.errors += 1
+            logger.warning("Failed to apply config from %s: %s", self.path, exc)
+            return False
+        self._last = overrides
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            self.poll()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
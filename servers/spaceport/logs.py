@@ -0,0 +1,125 @@
+"""Keep logging off the event loop and out of the hot path.
+
+``install_queue_logging`` swaps the ``spaceport`` logger's handlers for a
+bounded ``QueueHandler``; a ``QueueListener`` thread does the actual stream
+writes. When the queue is full records are dropped and counted instead of
+blocking the loop.
+
+``DispatchFailureLog`` folds failed dispatches into one line per mission and
+destination per interval (counts by error class plus the last message), so a
+chaos planet at thousands of rps produces a handful of lines instead of
+thousands. Windows close when a later failure arrives after the interval or
+when ``flush_expired`` runs from a periodic task, so one failure or a burst
+that then stops is still logged within about one interval.
+"""
+
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass, field
+import logging
+import logging.handlers
+import queue
+import time
+from typing import Dict, Optional, Tuple
+
+LOG_FORMAT = logging.BASIC_FORMAT
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """``QueueHandler`` that drops (and counts) records when the queue is full."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def render(self) -> str:
+        """Render the drop counter in the Prometheus text format."""
+
+        return (
+            "# HELP spaceport_log_records_dropped_total Log records dropped because the log queue was full.\n"
+            "# TYPE spaceport_log_records_dropped_total counter\n"
+            f"spaceport_log_records_dropped_total {self.dropped}\n"
+        )
+
+
+def install_queue_logging(logger: logging.Logger, size: int) -> DroppingQueueHandler:
+    """Route ``logger`` through a bounded queue drained by a listener thread."""
+
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=size)
+    handler = DroppingQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    logger.handlers = [handler]
+    logger.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
+    return handler
+
+
+@dataclass
+class _FailureWindow:
+    started_at: float
+    counts: Dict[str, int] = field(default_factory=dict)
+    last_error: str = ""
+
+
+class DispatchFailureLog:
+    """Aggregate dispatch failures per (mission, destination) and log them per interval.
+
+    An interval of 0 logs every failure as it happens.
+    """
+
+    def __init__(self, logger: logging.Logger, interval_seconds: float) -> None:
+        self.logger = logger
+        self.interval_seconds = interval_seconds
+        self._windows: Dict[Tuple[str, str], _FailureWindow] = {}
+
+    def record(self, mission_id: str, destination_id: str, error_class: str, error: BaseException) -> None:
+        if self.interval_seconds <= 0:
+            self.logger.warning("Mission %s dispatch to %s failed: %s", mission_id, destination_id, error)
+            return
+        now = time.monotonic()
+        key = (mission_id, destination_id)
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = _FailureWindow(started_at=now)
+        window.counts[error_class] = window.counts.get(error_class, 0) + 1
+        window.last_error = str(error)
+        if now - window.started_at >= self.interval_seconds:
+            self._emit(key, window, now)
+            del self._windows[key]
+
+    def flush_expired(self) -> None:
+        """Log every window older than the interval, even if no failure followed it."""
+
+        now = time.monotonic()
+        for key in [key for key, window in self._windows.items() if now - window.started_at >= self.interval_seconds]:
+            self._emit(key, self._windows.pop(key), now)
+
+    def flush(self, mission_id: Optional[str] = None) -> None:
+        """Log pending windows (all of them, or just one mission's) immediately."""
+
+        now = time.monotonic()
+        for key in [key for key in self._windows if mission_id is None or key[0] == mission_id]:
+            self._emit(key, self._windows.pop(key), now)
+
+    def _emit(self, key: Tuple[str, str], window: _FailureWindow, now: float) -> None:
+        total = sum(window.counts.values())
+        breakdown = ", ".join(f"{name}={count}" for name, count in sorted(window.counts.items()))
+        self.logger.warning(
+            "Mission %s dispatch to %s failed %d times in %.1fs (%s); last error: %s",
+            key[0],
+            key[1],
+            total,
+            now - window.started_at,
+            breakdown,
+            window.last_error,
+        )
@@ -0,0 +1,495 @@
+"""Prometheus metrics for mission dispatch and inbound docking.
+
+Everything here is recorded from the event loop thread, so the counters and
+histograms are plain Python objects updated without locks. Histograms use an
+HDR-style log-linear bucket layout: recording a sample is one ``bit_length``,
+a shift and a list increment, which keeps the per-request cost flat even at
+thousands of requests per second while still resolving percentiles to ~3 %.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+# Microsecond resolution, clamped at ~67 s (2**26 us).
+MAX_TRACKABLE_US = (1 << 26) - 1
+EXPORT_BUCKETS_SECONDS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+EXPORT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def _bucket_index(value_us: int) -> int:
+    if value_us < 2 * SUB_BUCKET_COUNT:
+        return value_us
+    shift = value_us.bit_length() - (SUB_BUCKET_BITS + 1)
+    return (shift + 1) * SUB_BUCKET_COUNT + (value_us >> shift) - SUB_BUCKET_COUNT
+
+
+def _bucket_upper_us(index: int) -> int:
+    if index < 2 * SUB_BUCKET_COUNT:
+        return index + 1
+    shift = index // SUB_BUCKET_COUNT - 1
+    mantissa = index % SUB_BUCKET_COUNT + SUB_BUCKET_COUNT
+    return (mantissa + 1) << shift
+
+
+BUCKET_TOTAL = _bucket_index(MAX_TRACKABLE_US) + 1
+
+
+class LatencyHistogram:
+    """Fixed-memory, log-linear latency histogram (HDR-style)."""
+
+    __slots__ = ("counts", "count", "sum_seconds", "max_us")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * BUCKET_TOTAL
+        self.count = 0
+        self.sum_seconds = 0.0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        value_us = int(seconds * 1_000_000)
+        if value_us < 0:
+            value_us = 0
+        elif value_us > MAX_TRACKABLE_US:
+            value_us = MAX_TRACKABLE_US
+        self.counts[_bucket_index(value_us)] += 1
+        self.count += 1
+        self.sum_seconds += seconds
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        counts = self.counts
+        for index, value in enumerate(other.counts):
+            if value:
+                counts[index] += value
+        self.count += other.count
+        self.sum_seconds += other.sum_seconds
+        self.max_us = max(self.max_us, other.max_us)
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram()
+        clone.counts = list(self.counts)
+        clone.count = self.count
+        clone.sum_seconds = self.sum_seconds
+        clone.max_us = self.max_us
+        return clone
+
+    def delta(self, previous: Optional["LatencyHistogram"]) -> "LatencyHistogram":
+        """Return the samples recorded since ``previous`` (an earlier ``copy()``) as a histogram."""
+
+        if previous is None:
+            return self.copy()
+        window = LatencyHistogram()
+        top = -1
+        for index, (now, before) in enumerate(zip(self.counts, previous.counts)):
+            if now != before:
+                window.counts[index] = now - before
+                top = index
+        window.count = self.count - previous.count
+        window.sum_seconds = self.sum_seconds - previous.sum_seconds
+        window.max_us = min(_bucket_upper_us(top), self.max_us) if top >= 0 else 0
+        return window
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound (seconds) of the bucket holding quantile ``q``."""
+
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(q * self.count)))
+        seen = 0
+        for index, value in enumerate(self.counts):
+            if not value:
+                continue
+            seen += value
+            if seen >= target:
+                return min(_bucket_upper_us(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def cumulative(self, bounds_seconds: Iterable[float]) -> List[Tuple[float, int]]:
+        """Return ``(le, count)`` pairs for Prometheus-style bucket export."""
+
+        pairs: List[Tuple[float, int]] = []
+        index = 0
+        running = 0
+        for bound in bounds_seconds:
+            bound_us = bound * 1_000_000
+            while index < BUCKET_TOTAL and _bucket_upper_us(index) <= bound_us:
+                running += self.counts[index]
+                index += 1
+            pairs.append((bound, running))
+        return pairs
+
+
+class DispatchStats:
+    """Outbound counters for one (mission, destination) pair."""
+
+    __slots__ = (
+        "sent", "succeeded", "failures", "in_flight", "shed", "delayed", "latency",
+        "payload_bytes", "wire_bytes", "encode_seconds", "attempts", "budget_denied", "short_circuited",
+    )
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.succeeded = 0
+        self.failures: Dict[str, int] = {}
+        self.in_flight = 0
+        self.shed = 0
+        self.delayed = 0
+        self.latency = LatencyHistogram()
+        self.payload_bytes = 0
+        self.wire_bytes = 0
+        self.encode_seconds = 0.0
+        # (attempt kind, outcome) -> count; only populated under a client policy.
+        self.attempts: Dict[Tuple[str, str], int] = {}
+        self.budget_denied: Dict[str, int] = {}
+        self.short_circuited = 0
+
+    def record_attempt(self, kind: str, outcome: str) -> None:
+        key = (kind, outcome)
+        self.attempts[key] = self.attempts.get(key, 0) + 1
+
+    def record_failure(self, error_class: str) -> None:
+        self.failures[error_class] = self.failures.get(error_class, 0) + 1
+
+    def merge(self, other: "DispatchStats") -> None:
+        self.sent += other.sent
+        self.succeeded += other.succeeded
+        for error_class, count in other.failures.items():
+            self.failures[error_class] = self.failures.get(error_class, 0) + count
+        self.in_flight += other.in_flight
+        self.shed += other.shed
+        self.delayed += other.delayed
+        self.latency.merge(other.latency)
+        self.payload_bytes += other.payload_bytes
+        self.wire_bytes += other.wire_bytes
+        self.encode_seconds += other.encode_seconds
+        for key, count in other.attempts.items():
+            self.attempts[key] = self.attempts.get(key, 0) + count
+        for kind, count in other.budget_denied.items():
+            self.budget_denied[kind] = self.budget_denied.get(kind, 0) + count
+        self.short_circuited += other.short_circuited
+
+    def copy(self) -> "DispatchStats":
+        clone = DispatchStats()
+        clone.merge(self)
+        return clone
+
+
+class DockStats:
+    """Inbound ``/dock`` counters for one source planet."""
+
+    __slots__ = ("outcomes", "in_flight", "latency", "payload_bytes", "wire_bytes", "decode_seconds")
+
+    def __init__(self) -> None:
+        self.outcomes: Dict[str, int] = {}
+        self.in_flight = 0
+        self.latency = LatencyHistogram()
+        self.payload_bytes = 0
+        self.wire_bytes = 0
+        self.decode_seconds = 0.0
+
+    def merge(self, other: "DockStats") -> None:
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+        self.in_flight += other.in_flight
+        self.latency.merge(other.latency)
+        self.payload_bytes += other.payload_bytes
+        self.wire_bytes += other.wire_bytes
+        self.decode_seconds += other.decode_seconds
+
+
+def classify_dispatch_error(exc: BaseException) -> str:
+    """Map a dispatch exception to a short, low-cardinality error class."""
+
+    if isinstance(exc, httpx.PoolTimeout):
+        return "pool_timeout"
+    if isinstance(exc, httpx.ConnectTimeout):
+        return "connect_timeout"
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(exc, httpx.ConnectError):
+        return "connect_error"
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"http_{exc.response.status_code}"
+    if isinstance(exc, httpx.TransportError):
+        return "transport_error"
+    return type(exc).__name__.lower()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: Optional[str]) -> str:
+    parts = [f'{key}="{_escape(str(value))}"' for key, value in labels.items() if value is not None]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def render_histogram(lines: List[str], name: str, histogram: LatencyHistogram, **labels: Optional[str]) -> None:
+    """Append Prometheus ``_bucket``/``_sum``/``_count`` lines for ``histogram``."""
+
+    for bound, count in histogram.cumulative(EXPORT_BUCKETS_SECONDS):
+        lines.append(f"{name}_bucket{_labels(**labels, le=repr(bound))} {count}")
+    lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum_seconds:.6f}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+
+class MetricsRegistry:
+    """Holds all spaceport metrics and renders the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self.dispatch: Dict[Tuple[str, str], DispatchStats] = {}
+        self.escort: Dict[Tuple[str, str, str], DispatchStats] = {}
+        self.hop: Dict[str, DispatchStats] = {}
+        self.dock: Dict[str, DockStats] = {}
+
+    def dispatch_stats(self, mission_id: str, destination_id: str) -> DispatchStats:
+        key = (mission_id, destination_id)
+        stats = self.dispatch.get(key)
+        if stats is None:
+            stats = self.dispatch[key] = DispatchStats()
+        return stats
+
+    def escort_stats(self, mission_id: str, destination_id: str, stream: str) -> DispatchStats:
+        key = (mission_id, destination_id, stream)
+        stats = self.escort.get(key)
+        if stats is None:
+            stats = self.escort[key] = DispatchStats()
+        return stats
+
+    def hop_stats(self, downstream_id: str) -> DispatchStats:
+        stats = self.hop.get(downstream_id)
+        if stats is None:
+            stats = self.hop[downstream_id] = DispatchStats()
+        return stats
+
+    def dock_stats(self, source_id: str) -> DockStats:
+        stats = self.dock.get(source_id)
+        if stats is None:
+            stats = self.dock[source_id] = DockStats()
+        return stats
+
+    def combined(self, others: Iterable["MetricsRegistry"]) -> "MetricsRegistry":
+        """Return a new registry summing this one with ``others`` (e.g. worker snapshots)."""
+
+        merged = MetricsRegistry()
+        for registry in (self, *others):
+            for key, stats in registry.dispatch.items():
+                merged.dispatch_stats(*key).merge(stats)
+            for escort_key, stats in registry.escort.items():
+                merged.escort_stats(*escort_key).merge(stats)
+            for downstream_id, stats in registry.hop.items():
+                merged.hop_stats(downstream_id).merge(stats)
+            for source_id, stats in registry.dock.items():
+                merged.dock_stats(source_id).merge(stats)
+        return merged
+
+    def render(self) -> str:
+        lines: List[str] = []
+        dispatch = sorted(self.dispatch.items())
+        escort = sorted(self.escort.items())
+        hop = sorted(self.hop.items())
+        dock = sorted(self.dock.items())
+
+        lines.append("# HELP spaceport_dispatch_sent_total Docking requests sent per mission and destination.")
+        lines.append("# TYPE spaceport_dispatch_sent_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            lines.append(
+                f"spaceport_dispatch_sent_total{_labels(mission=mission_id, destination=destination_id)} {stats.sent}"
+            )
+        lines.append("# HELP spaceport_dispatch_succeeded_total Docking requests that completed with a 2xx.")
+        lines.append("# TYPE spaceport_dispatch_succeeded_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            lines.append(
+                f"spaceport_dispatch_succeeded_total{_labels(mission=mission_id, destination=destination_id)} "
+                f"{stats.succeeded}"
+            )
+        lines.append("# HELP spaceport_dispatch_failed_total Docking requests that failed, by error class.")
+        lines.append("# TYPE spaceport_dispatch_failed_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            for error_class, count in sorted(stats.failures.items()):
+                labels = _labels(mission=mission_id, destination=destination_id, error=error_class)
+                lines.append(f"spaceport_dispatch_failed_total{labels} {count}")
+        lines.append("# HELP spaceport_dispatch_in_flight Docking requests currently awaiting a response.")
+        lines.append("# TYPE spaceport_dispatch_in_flight gauge")
+        for (mission_id, destination_id), stats in dispatch:
+            lines.append(
+                f"spaceport_dispatch_in_flight{_labels(mission=mission_id, destination=destination_id)} "
+                f"{stats.in_flight}"
+            )
+        lines.append("# HELP spaceport_dispatch_shed_total Intended requests dropped by the concurrency limiter.")
+        lines.append("# TYPE spaceport_dispatch_shed_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            lines.append(
+                f"spaceport_dispatch_shed_total{_labels(mission=mission_id, destination=destination_id)} {stats.shed}"
+            )
+        lines.append("# HELP spaceport_dispatch_short_circuited_total Requests not sent because the circuit was open.")
+        lines.append("# TYPE spaceport_dispatch_short_circuited_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            labels = _labels(mission=mission_id, destination=destination_id)
+            lines.append(f"spaceport_dispatch_short_circuited_total{labels} {stats.short_circuited}")
+        lines.append("# HELP spaceport_dispatch_delayed_total Requests that waited for a concurrency slot.")
+        lines.append("# TYPE spaceport_dispatch_delayed_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            lines.append(
+                f"spaceport_dispatch_delayed_total{_labels(mission=mission_id, destination=destination_id)} "
+                f"{stats.delayed}"
+            )
+        lines.append("# HELP spaceport_dispatch_attempts_total Docking attempts by kind (first/retry/hedge), outcome.")
+        lines.append("# TYPE spaceport_dispatch_attempts_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            for (kind, outcome), count in sorted(stats.attempts.items()):
+                labels = _labels(mission=mission_id, destination=destination_id, attempt=kind, outcome=outcome)
+                lines.append(f"spaceport_dispatch_attempts_total{labels} {count}")
+        lines.append("# HELP spaceport_dispatch_budget_denied_total Retries and hedges skipped for lack of budget.")
+        lines.append("# TYPE spaceport_dispatch_budget_denied_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            for kind, count in sorted(stats.budget_denied.items()):
+                labels = _labels(mission=mission_id, destination=destination_id, attempt=kind)
+                lines.append(f"spaceport_dispatch_budget_denied_total{labels} {count}")
+        lines.append("# HELP spaceport_dispatch_payload_bytes_total Cargo body bytes sent before compression.")
+        lines.append("# TYPE spaceport_dispatch_payload_bytes_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            labels = _labels(mission=mission_id, destination=destination_id)
+            lines.append(f"spaceport_dispatch_payload_bytes_total{labels} {stats.payload_bytes}")
+        lines.append("# HELP spaceport_dispatch_wire_bytes_total Cargo body bytes put on the wire (after compression).")
+        lines.append("# TYPE spaceport_dispatch_wire_bytes_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            labels = _labels(mission=mission_id, destination=destination_id)
+            lines.append(f"spaceport_dispatch_wire_bytes_total{labels} {stats.wire_bytes}")
+        lines.append("# HELP spaceport_dispatch_compress_seconds_total CPU time spent compressing cargo bodies.")
+        lines.append("# TYPE spaceport_dispatch_compress_seconds_total counter")
+        for (mission_id, destination_id), stats in dispatch:
+            labels = _labels(mission=mission_id, destination=destination_id)
+            lines.append(f"spaceport_dispatch_compress_seconds_total{labels} {stats.encode_seconds:.6f}")
+        lines.append("# HELP spaceport_dispatch_latency_seconds Outbound docking latency from intended send time.")
+        lines.append("# TYPE spaceport_dispatch_latency_seconds histogram")
+        for (mission_id, destination_id), stats in dispatch:
+            render_histogram(
+                lines,
+                "spaceport_dispatch_latency_seconds",
+                stats.latency,
+                mission=mission_id,
+                destination=destination_id,
+            )
+        lines.append("# HELP spaceport_dispatch_latency_quantile_seconds HDR percentiles of outbound latency.")
+        lines.append("# TYPE spaceport_dispatch_latency_quantile_seconds gauge")
+        for (mission_id, destination_id), stats in dispatch:
+            for q in EXPORT_QUANTILES:
+                labels = _labels(mission=mission_id, destination=destination_id, quantile=repr(q))
+                lines.append(f"spaceport_dispatch_latency_quantile_seconds{labels} {stats.latency.quantile(q):.6f}")
+
+        lines.append("# HELP spaceport_escort_sent_total Escort companion requests sent per stream.")
+        lines.append("# TYPE spaceport_escort_sent_total counter")
+        for (mission_id, destination_id, stream), stats in escort:
+            labels = _labels(mission=mission_id, destination=destination_id, stream=stream)
+            lines.append(f"spaceport_escort_sent_total{labels} {stats.sent}")
+        lines.append("# HELP spaceport_escort_succeeded_total Escort requests that completed with a 2xx.")
+        lines.append("# TYPE spaceport_escort_succeeded_total counter")
+        for (mission_id, destination_id, stream), stats in escort:
+            labels = _labels(mission=mission_id, destination=destination_id, stream=stream)
+            lines.append(f"spaceport_escort_succeeded_total{labels} {stats.succeeded}")
+        lines.append("# HELP spaceport_escort_failed_total Escort requests that failed, by error class.")
+        lines.append("# TYPE spaceport_escort_failed_total counter")
+        for (mission_id, destination_id, stream), stats in escort:
+            for error_class, count in sorted(stats.failures.items()):
+                labels = _labels(mission=mission_id, destination=destination_id, stream=stream, error=error_class)
+                lines.append(f"spaceport_escort_failed_total{labels} {count}")
+        lines.append("# HELP spaceport_escort_short_circuited_total Escorts skipped while a circuit is open.")
+        lines.append("# TYPE spaceport_escort_short_circuited_total counter")
+        for (mission_id, destination_id, stream), stats in escort:
+            labels = _labels(mission=mission_id, destination=destination_id, stream=stream)
+            lines.append(f"spaceport_escort_short_circuited_total{labels} {stats.short_circuited}")
+        lines.append("# HELP spaceport_escort_in_flight Escort requests currently awaiting a response.")
+        lines.append("# TYPE spaceport_escort_in_flight gauge")
+        for (mission_id, destination_id, stream), stats in escort:
+            labels = _labels(mission=mission_id, destination=destination_id, stream=stream)
+            lines.append(f"spaceport_escort_in_flight{labels} {stats.in_flight}")
+        lines.append("# HELP spaceport_escort_latency_seconds Escort request latency from intended send time.")
+        lines.append("# TYPE spaceport_escort_latency_seconds histogram")
+        for (mission_id, destination_id, stream), stats in escort:
+            render_histogram(
+                lines,
+                "spaceport_escort_latency_seconds",
+                stats.latency,
+                mission=mission_id,
+                destination=destination_id,
+                stream=stream,
+            )
+        lines.append("# HELP spaceport_escort_latency_quantile_seconds HDR percentiles of escort latency.")
+        lines.append("# TYPE spaceport_escort_latency_quantile_seconds gauge")
+        for (mission_id, destination_id, stream), stats in escort:
+            for q in EXPORT_QUANTILES:
+                labels = _labels(mission=mission_id, destination=destination_id, stream=stream, quantile=repr(q))
+                lines.append(f"spaceport_escort_latency_quantile_seconds{labels} {stats.latency.quantile(q):.6f}")
+
+        lines.append("# HELP spaceport_hop_sent_total Call-graph requests sent from /dock to each downstream planet.")
+        lines.append("# TYPE spaceport_hop_sent_total counter")
+        for downstream_id, stats in hop:
+            lines.append(f"spaceport_hop_sent_total{_labels(downstream=downstream_id)} {stats.sent}")
+        lines.append("# HELP spaceport_hop_succeeded_total Call-graph hops that completed with a 2xx.")
+        lines.append("# TYPE spaceport_hop_succeeded_total counter")
+        for downstream_id, stats in hop:
+            lines.append(f"spaceport_hop_succeeded_total{_labels(downstream=downstream_id)} {stats.succeeded}")
+        lines.append("# HELP spaceport_hop_failed_total Call-graph hops that failed or were skipped, by error class.")
+        lines.append("# TYPE spaceport_hop_failed_total counter")
+        for downstream_id, stats in hop:
+            for error_class, count in sorted(stats.failures.items()):
+                labels = _labels(downstream=downstream_id, error=error_class)
+                lines.append(f"spaceport_hop_failed_total{labels} {count}")
+        lines.append("# HELP spaceport_hop_in_flight Call-graph hops currently awaiting a response.")
+        lines.append("# TYPE spaceport_hop_in_flight gauge")
+        for downstream_id, stats in hop:
+            lines.append(f"spaceport_hop_in_flight{_labels(downstream=downstream_id)} {stats.in_flight}")
+        lines.append("# HELP spaceport_hop_latency_seconds Call-graph hop latency, downstream hops included.")
+        lines.append("# TYPE spaceport_hop_latency_seconds histogram")
+        for downstream_id, stats in hop:
+            render_histogram(lines, "spaceport_hop_latency_seconds", stats.latency, downstream=downstream_id)
+        lines.append("# HELP spaceport_hop_latency_quantile_seconds HDR percentiles of call-graph hop latency.")
+        lines.append("# TYPE spaceport_hop_latency_quantile_seconds gauge")
+        for downstream_id, stats in hop:
+            for q in EXPORT_QUANTILES:
+                labels = _labels(downstream=downstream_id, quantile=repr(q))
+                lines.append(f"spaceport_hop_latency_quantile_seconds{labels} {stats.latency.quantile(q):.6f}")
+
+        lines.append("# HELP spaceport_dock_requests_total Inbound /dock requests by source and outcome.")
+        lines.append("# TYPE spaceport_dock_requests_total counter")
+        for source_id, stats in dock:
+            for outcome, count in sorted(stats.outcomes.items()):
+                lines.append(f"spaceport_dock_requests_total{_labels(source=source_id, outcome=outcome)} {count}")
+        lines.append("# HELP spaceport_dock_in_flight Inbound /dock requests currently being handled.")
+        lines.append("# TYPE spaceport_dock_in_flight gauge")
+        for source_id, stats in dock:
+            lines.append(f"spaceport_dock_in_flight{_labels(source=source_id)} {stats.in_flight}")
+        lines.append("# HELP spaceport_dock_payload_bytes_total Inbound cargo body bytes after decompression.")
+        lines.append("# TYPE spaceport_dock_payload_bytes_total counter")
+        for source_id, stats in dock:
+            lines.append(f"spaceport_dock_payload_bytes_total{_labels(source=source_id)} {stats.payload_bytes}")
+        lines.append("# HELP spaceport_dock_wire_bytes_total Inbound cargo body bytes as received on the wire.")
+        lines.append("# TYPE spaceport_dock_wire_bytes_total counter")
+        for source_id, stats in dock:
+            lines.append(f"spaceport_dock_wire_bytes_total{_labels(source=source_id)} {stats.wire_bytes}")
+        lines.append("# HELP spaceport_dock_decompress_seconds_total CPU time spent decompressing cargo bodies.")
+        lines.append("# TYPE spaceport_dock_decompress_seconds_total counter")
+        for source_id, stats in dock:
+            labels = _labels(source=source_id)
+            lines.append(f"spaceport_dock_decompress_seconds_total{labels} {stats.decode_seconds:.6f}")
+        lines.append("# HELP spaceport_dock_latency_seconds Inbound /dock handling latency.")
+        lines.append("# TYPE spaceport_dock_latency_seconds histogram")
+        for source_id, stats in dock:
+            render_histogram(lines, "spaceport_dock_latency_seconds", stats.latency, source=source_id)
+        lines.append("# HELP spaceport_dock_latency_quantile_seconds HDR percentiles of /dock latency.")
+        lines.append("# TYPE spaceport_dock_latency_quantile_seconds gauge")
+        for source_id, stats in dock:
+            for q in EXPORT_QUANTILES:
+                labels = _labels(source=source_id, quantile=repr(q))
+                lines.append(f"spaceport_dock_latency_quantile_seconds{labels} {stats.latency.quantile(q):.6f}")
+        return "\n".join(lines) + "\n"
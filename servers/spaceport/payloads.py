@@ -0,0 +1,56 @@
+"""Pre-encoded docking payloads for mission streams.
+
+Building a fresh dict, sampling a cargo manifest and JSON-encoding it on every
+request is a large share of the generator's CPU at high rps. The factory here
+renders a ring of encoded bodies once per mission stream and, per request,
+only splices the current ``sentAt`` timestamp between two pre-encoded byte
+slices before handing the result to httpx as raw ``content=``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+_SENT_AT_MARKER = "__SENT_AT__"
+
+
+def encode_json(payload: Mapping[str, Any]) -> bytes:
+    """Encode a payload the same way httpx does for ``json=``."""
+
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class DockingPayloadFactory:
+    """Ring of pre-encoded docking bodies with a patchable timestamp."""
+
+    def __init__(
+        self,
+        base: Mapping[str, Any],
+        manifest_builder: Callable[[], List[Dict[str, Any]]],
+        clock: Callable[[], str],
+        ring_size: int = 64,
+        seed_builder: Optional[Callable[[], int]] = None,
+    ) -> None:
+        self._clock = clock
+        self._ring: List[Tuple[bytes, bytes]] = []
+        marker = _SENT_AT_MARKER.encode("utf-8")
+        for _ in range(max(1, ring_size)):
+            body = {**base, "cargo": manifest_builder(), "sentAt": _SENT_AT_MARKER}
+            if seed_builder is not None:
+                body["dockingSeed"] = seed_builder()
+            encoded = encode_json(body)
+            head, tail = encoded.split(marker, 1)
+            self._ring.append((head, tail))
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def next_body(self) -> bytes:
+        """Return the next encoded body stamped with the current time."""
+
+        head, tail = self._ring[self._position]
+        self._position = (self._position + 1) % len(self._ring)
+        return head + self._clock().encode("ascii") + tail
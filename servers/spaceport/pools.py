@@ -0,0 +1,91 @@
+"""Process-wide registry of shared ``httpx.AsyncClient`` pools.
+
+Mission streams and the fleet poller used to build a fresh client per stream
+(or per poll), which meant every stream got its own 100-connection cap and
+every poll paid a new TCP/TLS handshake. The registry hands out one client per
+destination base URL so all streams toward the same planet share a bounded,
+explicitly configured pool.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+CONNECTION_POLICIES = {"keep-alive", "fresh"}
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Limits applied to every pool created by the registry."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 5.0
+    pool_timeout_seconds: float = 5.0
+    connection_policy: str = "keep-alive"
+
+    def limits(self, policy: str) -> httpx.Limits:
+        keepalive = self.max_keepalive_connections if policy == "keep-alive" else 0
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=min(keepalive, self.max_connections),
+            keepalive_expiry=self.keepalive_expiry_seconds,
+        )
+
+
+class ConnectionPoolRegistry:
+    """Lazily create and cache one client per destination base URL."""
+
+    def __init__(self, settings: PoolSettings) -> None:
+        self.settings = settings
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def client(self, base_url: str, timeout: float, policy: Optional[str] = None) -> httpx.AsyncClient:
+        """Return the shared client for ``base_url``, creating it on first use.
+
+        ``policy`` overrides the registry-wide connection policy; ``fresh``
+        disables keep-alive and asks the server to close every connection so
+        each request pays the full connect (and mesh mTLS) handshake. A
+        changed ``timeout`` is applied to the cached client in place, so its
+        pooled connections survive a runtime config change.
+        """
+
+        resolved = policy if policy in CONNECTION_POLICIES else self.settings.connection_policy
+        key = f"{resolved}|{base_url.rstrip('/')}"
+        client = self._clients.get(key)
+        timeouts = httpx.Timeout(timeout, pool=self.settings.pool_timeout_seconds)
+        if client is not None and not client.is_closed:
+            if client.timeout != timeouts:
+                client.timeout = timeouts
+        else:
+            headers = {"Connection": "close"} if resolved == "fresh" else None
+            client = httpx.AsyncClient(
+                timeout=timeouts,
+                limits=self.settings.limits(resolved),
+                headers=headers,
+            )
+            self._clients[key] = client
+        return client
+
+    def describe(self) -> Dict[str, object]:
+        """Summarise the registry configuration and open pools."""
+
+        return {
+            "maxConnections": self.settings.max_connections,
+            "maxKeepaliveConnections": self.settings.max_keepalive_connections,
+            "keepaliveExpirySeconds": self.settings.keepalive_expiry_seconds,
+            "poolTimeoutSeconds": self.settings.pool_timeout_seconds,
+            "connectionPolicy": self.settings.connection_policy,
+            "pools": sorted(self._clients.keys()),
+        }
+
+    async def aclose(self) -> None:
+        """Close every pooled client (used on shutdown)."""
+
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
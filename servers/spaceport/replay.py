@@ -0,0 +1,96 @@
+"""Seeded randomness and schedule record/replay for mission streams.
+
+A mission seed (set on the mission, or derived from ``MISSION_SEED`` and the
+mission id) feeds separate ``random.Random`` streams for pacing and cargo, so
+burst sizes, cooldowns, arrival gaps, cargo manifests and the destination's
+docking step timings repeat exactly from run to run.
+
+Seeds cannot make the *timeline* repeat, since closed-loop bursts wait on the
+destination. When ``MISSION_RECORD_DIR`` is set every stream also writes what
+it actually emitted to ``<dir>/<mission id>.schedule.gz``: a JSON header line
+followed by one ``<delta us> <count> <destination>`` line per send event.
+A mission with ``replayOf`` set re-emits that file open-loop, on the
+recorded offsets, so two builds can be compared against identical traffic.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+import random
+import re
+from typing import Any, Dict, List, Mapping, Optional, TextIO, Tuple
+import zlib
+
+SCHEDULE_FORMAT_VERSION = 1
+SCHEDULE_SUFFIX = ".schedule.gz"
+
+ScheduleEvent = Tuple[float, int, str]
+
+
+def mission_seed(mission: Mapping[str, Any], base_seed: Optional[int]) -> Optional[int]:
+    """Return the mission's own seed, one derived from ``base_seed``, or None for unseeded runs."""
+
+    seed = mission.get("seed")
+    if seed is not None:
+        try:
+            return int(seed)
+        except (TypeError, ValueError):
+            pass
+    if base_seed is None:
+        return None
+    return zlib.crc32(f"{base_seed}:{mission.get('id')}".encode("utf-8"))
+
+
+def seeded_rng(seed: Optional[int], purpose: str) -> random.Random:
+    """Independent generator per purpose, so drawing more cargo never shifts the pacing."""
+
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}:{purpose}")
+
+
+def schedule_path(directory: str, mission_id: str) -> Path:
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "-", mission_id).strip("-.") or "mission"
+    return Path(directory) / f"{safe}{SCHEDULE_SUFFIX}"
+
+
+class ScheduleRecorder:
+    """Append-only writer for one stream's emitted schedule."""
+
+    def __init__(self, path: Path, header: Mapping[str, Any], origin: float) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.origin = origin
+        self.events = 0
+        self._last_us = 0
+        self._file: TextIO = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+        self._file.write(json.dumps({"version": SCHEDULE_FORMAT_VERSION, **header}) + "\n")
+
+    def record(self, at: float, count: int, destination_id: str) -> None:
+        """Record ``count`` requests emitted at loop time ``at``."""
+
+        offset_us = max(self._last_us, int(round((at - self.origin) * 1_000_000)))
+        self._file.write(f"{offset_us - self._last_us} {count} {destination_id}\n")
+        self._last_us = offset_us
+        self.events += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def load_schedule(path: Path) -> Tuple[Dict[str, Any], List[ScheduleEvent]]:
+    """Read a recorded schedule as ``(header, [(offset seconds, count, destination), ...])``."""
+
+    events: List[ScheduleEvent] = []
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        header = json.loads(handle.readline() or "{}")
+        if header.get("version") != SCHEDULE_FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {SCHEDULE_FORMAT_VERSION} schedule")
+        offset_us = 0
+        for line in handle:
+            delta, count, destination_id = line.rstrip("\n").split(" ", 2)
+            offset_us += int(delta)
+            events.append((offset_us / 1_000_000, int(count), destination_id))
+    return header, events
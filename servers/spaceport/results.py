@@ -0,0 +1,271 @@
+"""Per-second run results kept in bounded, array-backed buffers.
+
+Once a second the recorder diffs the cumulative dispatch counters and turns
+the change into one row per mission and destination: offered (sent, shed
+and short-circuited), sent, ok, failed (total and by error class), shed,
+short-circuited and latency quantiles. Rows live in fixed-capacity ``array``
+ring buffers, so an hour of history for one route costs ~170 KB no matter the
+request rate, and nothing
+is recorded on the request path itself.
+
+Rows are exported as CSV (optionally gzipped, streamed) or as a NumPy
+``.npz`` archive of columns that loads with ``numpy.load`` or
+``pandas.DataFrame(dict(numpy.load(...)))`` without a NumPy dependency here.
+"""
+
+from __future__ import annotations
+
+from array import array
+import io
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import zipfile
+import zlib
+
+from metrics import DispatchStats, MetricsRegistry
+
+RESULT_FORMATS = ("csv", "csv.gz", "npz")
+# (column, array typecode, numpy dtype)
+RESULT_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("second", "q", "<i8"),
+    ("offered", "I", "<u4"),
+    ("sent", "I", "<u4"),
+    ("ok", "I", "<u4"),
+    ("failed", "I", "<u4"),
+    ("shed", "I", "<u4"),
+    ("short_circuited", "I", "<u4"),
+    ("p50_ms", "f", "<f4"),
+    ("p95_ms", "f", "<f4"),
+    ("p99_ms", "f", "<f4"),
+    ("max_ms", "f", "<f4"),
+)
+CSV_CHUNK_ROWS = 1000
+
+
+class ResultSeries:
+    """Ring buffer of per-second rows for one (mission, destination) pair."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.start = 0
+        self.length = 0
+        self.columns: Dict[str, array] = {
+            name: array(typecode, [0]) * capacity for name, typecode, _ in RESULT_COLUMNS
+        }
+        self.errors: Dict[str, array] = {}
+
+    def append(self, row: Dict[str, Any], errors: Dict[str, int]) -> None:
+        if self.length < self.capacity:
+            index = (self.start + self.length) % self.capacity
+            self.length += 1
+        else:
+            index = self.start
+            self.start = (self.start + 1) % self.capacity
+        for name, column in self.columns.items():
+            column[index] = row[name]
+        for error_class in errors:
+            if error_class not in self.errors:
+                self.errors[error_class] = array("I", [0]) * self.capacity
+        for error_class, column in self.errors.items():
+            column[index] = errors.get(error_class, 0)
+
+    def copy(self) -> "ResultSeries":
+        clone = ResultSeries.__new__(ResultSeries)
+        clone.capacity = self.capacity
+        clone.start = self.start
+        clone.length = self.length
+        clone.columns = {name: array(column.typecode, column) for name, column in self.columns.items()}
+        clone.errors = {name: array(column.typecode, column) for name, column in self.errors.items()}
+        return clone
+
+    def indices(self) -> Iterator[int]:
+        for offset in range(self.length):
+            yield (self.start + offset) % self.capacity
+
+    def last_second(self) -> Optional[int]:
+        if not self.length:
+            return None
+        return self.columns["second"][(self.start + self.length - 1) % self.capacity]
+
+
+def _row(
+    previous: Optional[DispatchStats], stats: DispatchStats, second: int
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    errors = {
+        error_class: count - (previous.failures.get(error_class, 0) if previous else 0)
+        for error_class, count in stats.failures.items()
+    }
+    errors = {error_class: count for error_class, count in errors.items() if count > 0}
+    sent = stats.sent - (previous.sent if previous else 0)
+    shed = stats.shed - (previous.shed if previous else 0)
+    short_circuited = stats.short_circuited - (previous.short_circuited if previous else 0)
+    latency = stats.latency.delta(previous.latency if previous else None)
+    row = {
+        "second": second,
+        "offered": sent + shed + short_circuited,
+        "sent": sent,
+        "ok": stats.succeeded - (previous.succeeded if previous else 0),
+        "failed": sum(errors.values()),
+        "shed": shed,
+        "short_circuited": short_circuited,
+        "p50_ms": latency.quantile(0.5) * 1000.0,
+        "p95_ms": latency.quantile(0.95) * 1000.0,
+        "p99_ms": latency.quantile(0.99) * 1000.0,
+        "max_ms": latency.max_us / 1000.0,
+    }
+    return row, errors
+
+
+class RunResults:
+    """Per-second result rows for every route this planet dispatches on.
+
+    ``retention_seconds`` rows are kept per route and at most ``max_series``
+    routes; the route that reported least recently is dropped first.
+    """
+
+    def __init__(self, retention_seconds: int, max_series: int) -> None:
+        self.retention_seconds = retention_seconds
+        self.max_series = max_series
+        self.series: Dict[Tuple[str, str], ResultSeries] = {}
+        self._baselines: Dict[Tuple[str, str], DispatchStats] = {}
+        self.evicted = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.retention_seconds > 0
+
+    def sample(self, registry: MetricsRegistry, second: int) -> int:
+        """Append a row for every route whose counters moved; returns the rows added."""
+
+        added = 0
+        for key, stats in registry.dispatch.items():
+            previous = self._baselines.get(key)
+            if previous is not None and (
+                stats.sent == previous.sent
+                and stats.shed == previous.shed
+                and stats.short_circuited == previous.short_circuited
+                and stats.latency.count == previous.latency.count
+            ):
+                continue
+            self._baselines[key] = stats.copy()
+            row, errors = _row(previous, stats, second)
+            series = self.series.get(key)
+            if series is None:
+                if len(self.series) >= self.max_series:
+                    self._evict()
+                series = self.series[key] = ResultSeries(self.retention_seconds)
+            series.append(row, errors)
+            added += 1
+        return added
+
+    def _evict(self) -> None:
+        oldest = min(self.series, key=lambda key: self.series[key].last_second() or 0)
+        del self.series[oldest]
+        self.evicted += 1
+
+    def selected(self, mission_id: Optional[str] = None) -> List[Tuple[Tuple[str, str], ResultSeries]]:
+        """Copy the matching series so an export is not torn by rows appended mid-stream."""
+
+        return [
+            (key, series.copy())
+            for key, series in sorted(self.series.items())
+            if mission_id is None or key[0] == mission_id
+        ]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "retentionSeconds": self.retention_seconds,
+            "maxSeries": self.max_series,
+            "series": len(self.series),
+            "rows": sum(series.length for series in self.series.values()),
+            "evicted": self.evicted,
+        }
+
+
+def _error_classes(selected: List[Tuple[Tuple[str, str], ResultSeries]]) -> List[str]:
+    return sorted({error_class for _, series in selected for error_class in series.errors})
+
+
+def iter_csv(selected: List[Tuple[Tuple[str, str], ResultSeries]]) -> Iterator[bytes]:
+    """Yield the rows as CSV, ``CSV_CHUNK_ROWS`` at a time."""
+
+    error_classes = _error_classes(selected)
+    header = ["mission_id", "destination_id", *(name for name, _, _ in RESULT_COLUMNS)]
+    header.extend(f"failed_{error_class}" for error_class in error_classes)
+    lines = [",".join(header)]
+    for (mission_id, destination_id), series in selected:
+        columns = [series.columns[name] for name, _, _ in RESULT_COLUMNS]
+        errors = [series.errors.get(error_class) for error_class in error_classes]
+        for index in series.indices():
+            values = [mission_id, destination_id]
+            for (name, typecode, _), column in zip(RESULT_COLUMNS, columns):
+                values.append(f"{column[index]:.3f}" if typecode == "f" else str(column[index]))
+            values.extend(str(column[index]) if column is not None else "0" for column in errors)
+            lines.append(",".join(values))
+            if len(lines) >= CSV_CHUNK_ROWS:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def iter_gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _npy(descr: str, data: bytes, rows: int) -> bytes:
+    header = repr({"descr": descr, "fortran_order": False, "shape": (rows,)}).encode("latin-1")
+    padding = 64 - (len(header) + 11) % 64
+    header += b" " * padding + b"\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header + data
+
+
+def _strings(values: List[str]) -> Tuple[str, bytes]:
+    width = max((len(value) for value in values), default=1) or 1
+    return f"<U{width}", b"".join(value.ljust(width, "\0").encode("utf-32-le") for value in values)
+
+
+def build_npz(selected: List[Tuple[Tuple[str, str], ResultSeries]]) -> bytes:
+    """Return a compressed ``.npz`` archive with one array per column."""
+
+    error_classes = _error_classes(selected)
+    rows = sum(series.length for _, series in selected)
+    mission_ids: List[str] = []
+    destination_ids: List[str] = []
+    columns: Dict[str, array] = {name: array(typecode) for name, typecode, _ in RESULT_COLUMNS}
+    errors: Dict[str, array] = {error_class: array("I") for error_class in error_classes}
+    for (mission_id, destination_id), series in selected:
+        indices = list(series.indices())
+        mission_ids.extend([mission_id] * len(indices))
+        destination_ids.extend([destination_id] * len(indices))
+        for name, column in columns.items():
+            source = series.columns[name]
+            column.extend(source[index] for index in indices)
+        for error_class, column in errors.items():
+            source = series.errors.get(error_class)
+            if source is None:
+                column.extend([0] * len(indices))
+            else:
+                column.extend(source[index] for index in indices)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("mission_id.npy", _npy(*_strings(mission_ids), rows))
+        archive.writestr("destination_id.npy", _npy(*_strings(destination_ids), rows))
+        for name, _, descr in RESULT_COLUMNS:
+            archive.writestr(f"{name}.npy", _npy(descr, _little_endian(columns[name]), rows))
+        for error_class, column in errors.items():
+            archive.writestr(f"failed_{error_class}.npy", _npy("<u4", _little_endian(column), rows))
+    return buffer.getvalue()
+
+
+def _little_endian(column: array) -> bytes:
+    if struct.pack("=H", 1) != struct.pack("<H", 1):
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
@@ -0,0 +1,79 @@
+"""Concurrency slots with a bounded FIFO hand-off, shared by the limiters.
+
+Both the outbound AIMD limiter and inbound ``/dock`` admission control cap
+how many requests run at once and park the overflow in a FIFO. A released
+slot is handed straight to the oldest waiter, so a newcomer can never
+overtake the queue; subclasses only decide the capacity and what to count.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import deque
+from typing import Deque
+
+
+class SlotQueue(ABC):
+    """In-flight counter plus the FIFO of callers waiting for a free slot."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    @abstractmethod
+    def capacity(self) -> int:
+        """Slots that may be held at once right now."""
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def try_take(self) -> bool:
+        """Take a slot without waiting, if one is free and nobody is queued ahead."""
+
+        if self.in_flight < self.capacity and not self._waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    async def wait_for_slot(self, timeout_seconds: float) -> bool:
+        """Queue for a slot; returns False if ``timeout_seconds`` passed first.
+
+        Cancellation propagates to the caller, after any slot handed over in
+        the meantime has been passed on.
+        """
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=timeout_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we gave up; pass it on.
+                self.release_slot()
+            else:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return False
+        return True
+
+    def release_slot(self) -> None:
+        self.in_flight -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        """Hand free slots to waiters in arrival order."""
+
+        while self._waiters and self.in_flight < self.capacity:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
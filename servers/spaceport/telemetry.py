@@ -0,0 +1,118 @@
+"""Per-mission run summaries pushed from a planet to the fleet.
+
+``/metrics`` exposes cumulative counters that only a scraper sees. The
+``MissionTelemetry`` reporter turns them into compact per-interval samples
+(achieved rps, error counts, latency percentiles) for each mission and
+destination, so the fleet can track how a run is going without scraping
+every planet. A batch that fails to post is not lost: the baseline only
+advances after the fleet accepted it, so the next sample covers the longer
+window.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from metrics import DispatchStats, LatencyHistogram, MetricsRegistry
+
+
+@dataclass
+class _Baseline:
+    sent: int
+    succeeded: int
+    failures: Dict[str, int]
+    shed: int
+    latency: LatencyHistogram
+    taken_at: float
+
+
+def _baseline(stats: DispatchStats, now: float) -> _Baseline:
+    return _Baseline(
+        sent=stats.sent,
+        succeeded=stats.succeeded,
+        failures=dict(stats.failures),
+        shed=stats.shed,
+        latency=stats.latency.copy(),
+        taken_at=now,
+    )
+
+
+def _milliseconds(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
+
+
+class MissionTelemetry:
+    """Diff dispatch counters between pushes and build per-mission samples."""
+
+    def __init__(self, started_at: float) -> None:
+        self._baselines: Dict[Tuple[str, str], _Baseline] = {}
+        self._pending: Dict[Tuple[str, str], _Baseline] = {}
+        self._committed_at = started_at
+        self._collected_at = started_at
+        self.sent_batches = 0
+        self.failed_batches = 0
+
+    def collect(self, registry: MetricsRegistry, now: float, active: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """Build one sample per (mission, destination) that moved since the last accepted push.
+
+        Missions listed in ``active`` are reported even when idle, so a stalled
+        stream shows up as 0 rps rather than going silent.
+        """
+
+        samples: List[Dict[str, Any]] = []
+        self._pending = {}
+        self._collected_at = now
+        for key, stats in sorted(registry.dispatch.items()):
+            previous = self._baselines.get(key)
+            failures = {
+                error_class: count - (previous.failures.get(error_class, 0) if previous else 0)
+                for error_class, count in stats.failures.items()
+            }
+            failures = {error_class: count for error_class, count in failures.items() if count > 0}
+            sent = stats.sent - (previous.sent if previous else 0)
+            shed = stats.shed - (previous.shed if previous else 0)
+            self._pending[key] = _baseline(stats, now)
+            if not sent and not shed and not failures and (active is None or key[0] not in active):
+                continue
+            # Pairs first seen in this batch started after the last accepted push.
+            window = max(now - (previous.taken_at if previous else self._committed_at), 1e-3)
+            latency = stats.latency.delta(previous.latency if previous else None)
+            samples.append({
+                "missionId": key[0],
+                "destinationId": key[1],
+                "windowSeconds": round(window, 3),
+                "sent": sent,
+                "succeeded": stats.succeeded - (previous.succeeded if previous else 0),
+                "failed": sum(failures.values()),
+                "errors": failures,
+                "shed": shed,
+                "achievedRps": round(sent / window, 3),
+                "latencyP50Ms": _milliseconds(latency.quantile(0.5)),
+                "latencyP95Ms": _milliseconds(latency.quantile(0.95)),
+                "latencyP99Ms": _milliseconds(latency.quantile(0.99)),
+                "latencyMaxMs": _milliseconds(latency.max_us / 1_000_000),
+            })
+        return samples
+
+    def commit(self, pushed: bool = True) -> None:
+        """Advance the baselines after the fleet accepted the batch from ``collect``."""
+
+        self._baselines.update(self._pending)
+        self._pending = {}
+        self._committed_at = self._collected_at
+        if pushed:
+            self.sent_batches += 1
+
+    def discard(self) -> None:
+        """Keep the old baselines so the next batch covers the failed window too."""
+
+        self._pending = {}
+        self.failed_batches += 1
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "tracked": len(self._baselines),
+            "sentBatches": self.sent_batches,
+            "failedBatches": self.failed_batches,
+        }
@@ -0,0 +1,277 @@
+"""CPU-bound docking work: real, calibrated compute per docking step.
+
+By default a docking step only sleeps, so a planet never uses CPU and
+autoscaling or CPU throttling cannot be studied. With ``DOCK_WORK_PROFILE``
+set, each step runs compute kernels instead:
+
+``hash``
+    SHA-256 over a 16 KiB block.
+``compress``
+    zlib (level 6) of a semi-compressible 16 KiB block.
+``json``
+    serialise, parse and reshape a cargo manifest.
+``mixed``
+    rotate through all three.
+
+Work is counted in units of roughly 1 ms of single-core CPU. At startup
+every kernel is timed to find how many iterations make one unit on this
+host, so ``DOCK_WORK_UNITS`` costs about the same CPU time on any node
+(calibrate on an unthrottled pod). A step can also hold
+``DOCK_WORK_MEMORY_BYTES`` of touched memory while it runs.
+
+Kernels run in a process pool (or a thread pool, where the JSON kernel
+holds the GIL), so the event loop stays responsive. The pool reports jobs
+in flight, queue wait and busy time. When ``spaceport_dock_work_queued``
+stays above zero, the planet is CPU-bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import zlib
+
+from metrics import LatencyHistogram, render_histogram
+
+WORK_PROFILES = ("sleep", "hash", "compress", "json", "mixed")
+WORK_EXECUTORS = ("process", "thread")
+KERNEL_NAMES = ("hash", "compress", "json")
+UNIT_SECONDS = 0.001
+BLOCK_BYTES = 16 * 1024
+PAGE_BYTES = 4096
+# Time each kernel for at least this long when calibrating.
+CALIBRATION_SECONDS = 0.05
+
+_rng = random.Random(0)
+# Half random, half zeros: compresses about 2:1, like real cargo manifests.
+BLOCK = _rng.randbytes(BLOCK_BYTES // 2) + bytes(BLOCK_BYTES // 2)
+MANIFEST = {
+    "items": [
+        {"sku": f"SKU-{index:05d}", "quantity": _rng.randint(1, 500), "mass": round(_rng.uniform(0.1, 90.0), 3)}
+        for index in range(64)
+    ],
+}
+
+
+def _hash_kernel(iterations: int) -> int:
+    digest = hashlib.sha256()
+    for _ in range(iterations):
+        digest.update(BLOCK)
+    return digest.digest()[0]
+
+
+def _compress_kernel(iterations: int) -> int:
+    size = 0
+    for _ in range(iterations):
+        size += len(zlib.compress(BLOCK, 6))
+    return size
+
+
+def _json_kernel(iterations: int) -> int:
+    document: Dict[str, Any] = MANIFEST
+    for _ in range(iterations):
+        document = json.loads(json.dumps(document))
+        items = sorted(document["items"], key=lambda item: (item["mass"], item["sku"]))
+        document = {"items": items, "totalMass": round(sum(item["mass"] for item in items), 3)}
+    return len(document["items"])
+
+
+KERNELS = {"hash": _hash_kernel, "compress": _compress_kernel, "json": _json_kernel}
+
+
+def calibrate() -> Dict[str, int]:
+    """Return, per kernel, the iterations that take about one work unit on this host."""
+
+    iterations: Dict[str, int] = {}
+    for name, kernel in KERNELS.items():
+        count = 1
+        while True:
+            started = time.perf_counter()
+            kernel(count)
+            elapsed = time.perf_counter() - started
+            if elapsed >= CALIBRATION_SECONDS:
+                break
+            count *= 2
+        iterations[name] = max(1, round(count * UNIT_SECONDS / elapsed))
+    return iterations
+
+
+def run_work(profile: str, iterations: Dict[str, int], units: int, memory_bytes: int) -> Tuple[float, float]:
+    """Run in the pool: spend ``units`` of CPU on ``profile``; returns wall-clock (started, finished)."""
+
+    started = time.time()
+    ballast = bytearray(memory_bytes)
+    for offset in range(0, memory_bytes, PAGE_BYTES):
+        ballast[offset] = 1
+    kernels = KERNEL_NAMES if profile == "mixed" else (profile,)
+    for unit in range(units):
+        name = kernels[unit % len(kernels)]
+        KERNELS[name](iterations[name])
+    del ballast
+    return started, time.time()
+
+
+def default_workers() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on every platform
+        return os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class WorkSettings:
+    profile: str = "sleep"
+    units: int = 50
+    memory_bytes: int = 0
+    executor: str = "process"
+    workers: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.profile != "sleep" and self.units > 0
+
+
+@dataclass
+class WorkStats:
+    completed: int = 0
+    units: int = 0
+    busy_seconds: float = 0.0
+    wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class DockWorkPool:
+    """Executor running docking compute off the event loop, with saturation stats.
+
+    The executor kind and size are fixed when the pool starts; the profile,
+    units and memory footprint can change at runtime.
+    """
+
+    def __init__(self, settings: WorkSettings) -> None:
+        self.settings = settings
+        self.workers = settings.workers or default_workers()
+        self.iterations: Dict[str, int] = {}
+        self.in_flight = 0
+        self.stats = WorkStats()
+        self._executor: Optional[Executor] = None
+        self._starting: Optional[asyncio.Lock] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.enabled
+
+    @property
+    def queued(self) -> int:
+        return max(0, self.in_flight - self.workers)
+
+    def configure(self, settings: WorkSettings) -> None:
+        self.settings = settings
+
+    async def start(self) -> None:
+        """Calibrate the kernels and start the executor, once, if a work profile is active."""
+
+        if self._executor is not None or not self.enabled:
+            return
+        if self._starting is None:
+            self._starting = asyncio.Lock()
+        async with self._starting:
+            if self._executor is not None:
+                return
+            loop = asyncio.get_running_loop()
+            self.iterations = await loop.run_in_executor(None, calibrate)
+            if self.settings.executor == "thread":
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="dock-work")
+            else:
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    async def run(self, units: int) -> float:
+        """Spend ``units`` of CPU in the pool and return the compute time in seconds.
+
+        Cancelling the caller drops a job that is still queued; one already
+        running finishes in the pool.
+        """
+
+        await self.start()
+        assert self._executor is not None
+        settings = self.settings
+        submitted = time.time()
+        self.in_flight += 1
+        try:
+            started, finished = await asyncio.get_running_loop().run_in_executor(
+                self._executor, run_work, settings.profile, self.iterations, units, settings.memory_bytes
+            )
+        finally:
+            self.in_flight -= 1
+        stats = self.stats
+        stats.completed += 1
+        stats.units += units
+        stats.busy_seconds += finished - started
+        stats.wait.record(max(0.0, started - submitted))
+        stats.service.record(finished - started)
+        return finished - started
+
+    async def stop(self) -> None:
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(executor.shutdown, wait=True, cancel_futures=True)
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        settings, stats = self.settings, self.stats
+        return {
+            "profile": settings.profile,
+            "units": settings.units,
+            "memoryBytes": settings.memory_bytes,
+            "executor": settings.executor,
+            "workers": self.workers,
+            "running": self._executor is not None,
+            "iterationsPerUnit": dict(self.iterations),
+            "inFlight": self.in_flight,
+            "queued": self.queued,
+            "saturation": round(min(1.0, self.in_flight / self.workers), 4),
+            "completed": stats.completed,
+            "busySeconds": round(stats.busy_seconds, 3),
+            "waitP99Seconds": stats.wait.quantile(0.99),
+            "serviceP50Seconds": stats.service.quantile(0.5),
+        }
+
+    def render(self) -> str:
+        """Render pool gauges, counters and the queue-wait histogram in the Prometheus text format."""
+
+        stats = self.stats
+        lines: List[str] = [
+            "# HELP spaceport_dock_work_workers Workers in the docking compute pool.",
+            "# TYPE spaceport_dock_work_workers gauge",
+            f"spaceport_dock_work_workers {self.workers}",
+            "# HELP spaceport_dock_work_in_flight Docking compute jobs submitted and not yet finished.",
+            "# TYPE spaceport_dock_work_in_flight gauge",
+            f"spaceport_dock_work_in_flight {self.in_flight}",
+            "# HELP spaceport_dock_work_queued Docking compute jobs waiting for a free worker.",
+            "# TYPE spaceport_dock_work_queued gauge",
+            f"spaceport_dock_work_queued {self.queued}",
+            "# HELP spaceport_dock_work_units_total Work units (about 1 ms of CPU each) computed.",
+            "# TYPE spaceport_dock_work_units_total counter",
+            f"spaceport_dock_work_units_total {stats.units}",
+            "# HELP spaceport_dock_work_busy_seconds_total Wall time workers spent computing; divide its rate "
+            "by the worker count for utilisation.",
+            "# TYPE spaceport_dock_work_busy_seconds_total counter",
+            f"spaceport_dock_work_busy_seconds_total {stats.busy_seconds:.6f}",
+            "# HELP spaceport_dock_work_wait_seconds Time docking compute jobs waited for a worker.",
+            "# TYPE spaceport_dock_work_wait_seconds histogram",
+        ]
+        render_histogram(lines, "spaceport_dock_work_wait_seconds", stats.wait)
+        lines.append("# HELP spaceport_dock_work_service_seconds Compute time per docking step.")
+        lines.append("# TYPE spaceport_dock_work_service_seconds histogram")
+        render_histogram(lines, "spaceport_dock_work_service_seconds", stats.service)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,186 @@
+"""Multi-process load-generation workers for a single spaceport pod.
+
+The parent process keeps serving HTTP and reconciling against ``/orders``; it
+only decides *which* mission streams each worker should run and forwards that
+plan over a queue. Each worker owns its own event loop, connection pools and
+metrics registry, and periodically ships a pickled metrics snapshot back so
+the parent can aggregate them on ``/metrics``. The parent drains those
+snapshots on a timer and keeps only the newest one per worker, so the stats
+queue stays short however rarely ``/metrics`` is scraped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import queue
+import zlib
+from typing import Any, Dict, List, Mapping, Optional
+
+logger = logging.getLogger("spaceport")
+
+STATS_INTERVAL_SECONDS = 1.0
+STOP_TIMEOUT_SECONDS = 10.0
+
+
+def plan_worker_assignments(
+    missions: List[Mapping[str, Any]], workers: int, split_rps: int
+) -> List[List[Dict[str, Any]]]:
+    """Shard missions across ``workers`` processes.
+
+    Missions below ``split_rps`` are pinned to one worker by a stable hash of
+    their id. Heavier missions are sliced so every worker emits a share of the
+    rps; each slice keeps the mission id so metrics merge back per mission.
+    """
+
+    plan: List[List[Dict[str, Any]]] = [[] for _ in range(workers)]
+    for mission in missions:
+        mission_id = mission.get("id")
+        if not mission_id:
+            continue
+        rps = max(1, int(mission.get("rps") or 1))
+        if workers > 1 and rps >= split_rps:
+            base, remainder = divmod(rps, workers)
+            for index in range(workers):
+                share = base + (1 if index < remainder else 0)
+                if share > 0:
+                    plan[index].append({**mission, "rps": share})
+        else:
+            index = zlib.crc32(str(mission_id).encode("utf-8")) % workers
+            plan[index].append(dict(mission))
+    return plan
+
+
+async def _worker_loop(index: int, commands: "multiprocessing.Queue", stats: "multiprocessing.Queue") -> None:
+    import app as runtime  # imported lazily: the child builds its own runtime state
+
+    loop = asyncio.get_running_loop()
+    logger.info("Load worker %s started", index)
+    try:
+        while True:
+            try:
+                message = await loop.run_in_executor(None, commands.get, True, STATS_INTERVAL_SECONDS)
+            except queue.Empty:
+                message = None
+            if message is not None:
+                kind = message.get("type")
+                if kind == "stop":
+                    break
+                if kind == "sync":
+                    await runtime.sync_mission_streams(message.get("missions") or [])
+                elif kind == "config":
+                    runtime.apply_config_overrides(message.get("overrides") or {}, source="parent")
+            runtime.DISPATCH_FAILURES.flush_expired()
+            stats.put((index, pickle.dumps(runtime.METRICS)))
+    finally:
+        await runtime.stop_all_mission_streams()
+        await runtime.POOL_REGISTRY.aclose()
+        stats.put((index, pickle.dumps(runtime.METRICS)))
+        logger.info("Load worker %s stopped", index)
+
+
+def worker_main(index: int, commands: "multiprocessing.Queue", stats: "multiprocessing.Queue") -> None:
+    """Process entrypoint for a load worker."""
+
+    try:
+        asyncio.run(_worker_loop(index, commands, stats))
+    except KeyboardInterrupt:  # pragma: no cover - parent terminated us
+        pass
+
+
+class LoadWorkerPool:
+    """Parent-side handle for the worker processes."""
+
+    def __init__(self, size: int, split_rps: int) -> None:
+        self.size = size
+        self.split_rps = split_rps
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        self._commands: List["multiprocessing.Queue"] = []
+        self._stats: Optional["multiprocessing.Queue"] = None
+        self._snapshots: Dict[int, bytes] = {}
+        self._collector: Optional[asyncio.Task] = None
+        self._assigned: List[int] = [0] * size
+
+    def start(self) -> None:
+        self._stats = self._context.Queue()
+        for index in range(self.size):
+            commands = self._context.Queue()
+            process = self._context.Process(
+                target=worker_main,
+                args=(index, commands, self._stats),
+                name=f"spaceport-worker-{index}",
+                daemon=True,
+            )
+            process.start()
+            self._commands.append(commands)
+            self._processes.append(process)
+        self._collector = asyncio.get_running_loop().create_task(self._collect_loop())
+        logger.info("Started %s load worker processes", self.size)
+
+    def sync(self, missions: List[Mapping[str, Any]]) -> None:
+        """Send every worker its share of the actionable missions."""
+
+        plan = plan_worker_assignments(missions, self.size, self.split_rps)
+        for index, assigned in enumerate(plan):
+            self._assigned[index] = len(assigned)
+            self._commands[index].put({"type": "sync", "missions": assigned})
+
+    def configure(self, overrides: Mapping[str, str]) -> None:
+        """Forward runtime config overrides to every worker."""
+
+        for commands in self._commands:
+            commands.put({"type": "config", "overrides": dict(overrides)})
+
+    def collect(self) -> None:
+        """Drain pending metrics snapshots without blocking, keeping the newest per worker."""
+
+        if self._stats is None:
+            return
+        while True:
+            try:
+                index, payload = self._stats.get_nowait()
+            except queue.Empty:
+                break
+            self._snapshots[index] = payload
+
+    async def _collect_loop(self) -> None:
+        while True:
+            await asyncio.sleep(STATS_INTERVAL_SECONDS)
+            self.collect()
+
+    def snapshots(self) -> List[Any]:
+        self.collect()
+        return [pickle.loads(payload) for payload in self._snapshots.values()]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "processes": self.size,
+            "splitRps": self.split_rps,
+            "workers": [
+                {
+                    "index": index,
+                    "pid": process.pid,
+                    "alive": process.is_alive(),
+                    "missions": self._assigned[index],
+                }
+                for index, process in enumerate(self._processes)
+            ],
+        }
+
+    async def stop(self) -> None:
+        for commands in self._commands:
+            commands.put({"type": "stop"})
+        loop = asyncio.get_running_loop()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join, STOP_TIMEOUT_SECONDS)
+            if process.is_alive():
+                process.terminate()
+        if self._collector is not None:
+            self._collector.cancel()
+            self._collector = None
+        self.collect()
+        self._processes.clear()
+        self._commands.clear()
@@ -1,9 +1,14 @@
 """Helpers for translating universe configuration into Kubernetes artifacts."""
 
 from __future__ import annotations
-from typing import Any, Dict, Iterable, List, Mapping, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Tuple
+import json
+import math
 import os
 import re
+import urllib.error
+import urllib.request
 import yaml
 
 import kubernetes.client as k8s_client
@@ -19,6 +24,25 @@ BLACK_HOLE_JOB_IMAGE = os.environ.get("UNIVERSE_BLACK_HOLE_IMAGE", "bitnami/kube
 APPLY_MODE = os.environ.get("UNIVERSE_APPLY_MODE", "kubectl").strip().lower()
 FLEET_API_URL = os.environ.get("UNIVERSE_FLEET_API_URL", f"http://vastaya-fleet.{NAMESPACE}:4006/api/fleet")
 _DRY_RUN_MODES = {"dry-run", "skip", "manifest", "noop"}
+# Planet config lives in a ConfigMap (env at start, mounted file for hot reload)
+# so changing it never touches the pod template and never rolls the planets.
+PLANET_CONFIG_MAP = os.environ.get("UNIVERSE_PLANET_CONFIG_MAP", "universe-planet-config")
+PLANET_CONFIG_MOUNT = "/etc/spaceport/config"
+CONFIG_PUSH_ENABLED = os.environ.get("UNIVERSE_CONFIG_PUSH", "true").strip().lower() in {"1", "true", "yes", "on"}
+CONFIG_PUSH_TIMEOUT = float(os.environ.get("UNIVERSE_CONFIG_PUSH_TIMEOUT", "2.0"))
+# Planet drain budget, set on the pod so the preStop hook and the grace period match it.
+PLANET_DRAIN_TIMEOUT = float(os.environ.get("UNIVERSE_PLANET_DRAIN_TIMEOUT", "20"))
+PLANET_STOP_TIMEOUT = float(os.environ.get("UNIVERSE_PLANET_STOP_TIMEOUT", "5"))
+# The /drain call may take the drain and stream-stop timeouts plus a round trip;
+# after it, SIGTERM still needs time for the planet's own shutdown.
+PLANET_PRESTOP_TIMEOUT = PLANET_DRAIN_TIMEOUT + PLANET_STOP_TIMEOUT + 5
+PLANET_TERMINATION_GRACE_SECONDS = math.ceil(PLANET_PRESTOP_TIMEOUT + 15)
+PLANET_DRAIN_COMMAND = [
+    "python",
+    "-c",
+    "import urllib.request; urllib.request.urlopen(urllib.request.Request("
+    f"'http://127.0.0.1:{CONTAINER_PORT}/drain', method='POST'), timeout={PLANET_PRESTOP_TIMEOUT:g})",
+]
 
 ENV_FIELD_MAP: Dict[str, str] = {
     "crossGalaxyEnabled": "CROSS_GALAXY_ENABLED",
@@ -30,6 +54,13 @@ ENV_FIELD_MAP: Dict[str, str] = {
     "shieldsEnabled": "SHIELDS_ENABLED",
     "blackHoleEnabled": "BLACK_HOLE_ENABLED",
     "chaosExperimentsEnabled": "CHAOS_EXPERIMENTS_ENABLED",
+    "chaosFailureRate": "CHAOS_FAILURE_RATE",
+    "chaosUnavailableRate": "CHAOS_UNAVAILABLE_RATE",
+    "chaosResetRate": "CHAOS_RESET_RATE",
+    "chaosHangRate": "CHAOS_HANG_RATE",
+    "chaosTrickleRate": "CHAOS_TRICKLE_RATE",
+    "chaosTruncatedRate": "CHAOS_TRUNCATED_RATE",
+    "chaosLargeRate": "CHAOS_LARGE_RATE",
 }
 
 
@@ -85,18 +116,30 @@ def base_labels(planet: Mapping[str, Any], variant: str | None = None) -> Dict[s
     return labels
 
 
+def build_config_map(env: List[Dict[str, str]]) -> Dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": PLANET_CONFIG_MAP, "namespace": NAMESPACE, "labels": {"app": "universe-planet"}},
+        "data": {item["name"]: item["value"] for item in env},
+    }
+
+
 def build_deployment(
     name: str,
     planet: Mapping[str, Any],
-    env: Iterable[Dict[str, str]],
     shields_enabled: bool,
     variant: str | None = None,
 ) -> Dict[str, Any]:
     labels = base_labels(planet, variant)
-    container_env = list(env)
     planet_identifier = str(planet.get("id") or planet.get("code") or "planet")
-    container_env.append({"name": "PLANET_ID", "value": planet_identifier})
-    container_env.append({"name": "FLEET_API_BASE_URL", "value": FLEET_API_URL})
+    container_env = [
+        {"name": "PLANET_ID", "value": planet_identifier},
+        {"name": "FLEET_API_BASE_URL", "value": FLEET_API_URL},
+        {"name": "SPACEPORT_CONFIG_PATH", "value": PLANET_CONFIG_MOUNT},
+        {"name": "DRAIN_TIMEOUT_SECONDS", "value": f"{PLANET_DRAIN_TIMEOUT:g}"},
+        {"name": "MISSION_STOP_TIMEOUT_SECONDS", "value": f"{PLANET_STOP_TIMEOUT:g}"},
+    ]
     pod_metadata = {"labels": labels}
     if shields_enabled:
         pod_metadata["annotations"] = {"linkerd.io/inject": "enabled"}
@@ -110,6 +153,8 @@ def build_deployment(
             "template": {
                 "metadata": pod_metadata,
                 "spec": {
+                    # Long enough for the preStop drain plus shutdown; the 30 s default would cut it off.
+                    "terminationGracePeriodSeconds": PLANET_TERMINATION_GRACE_SECONDS,
                     "containers": [
                         {
                             "name": "planet",
@@ -117,8 +162,22 @@ def build_deployment(
                             "imagePullPolicy": "IfNotPresent",
                             "ports": [{"containerPort": CONTAINER_PORT}],
                             "env": container_env,
+                            "envFrom": [{"configMapRef": {"name": PLANET_CONFIG_MAP, "optional": True}}],
+                            "volumeMounts": [
+                                {"name": "planet-config", "mountPath": PLANET_CONFIG_MOUNT, "readOnly": True}
+                            ],
+                            "readinessProbe": {
+                                "httpGet": {"path": "/readyz", "port": CONTAINER_PORT},
+                                "periodSeconds": 2,
+                                "failureThreshold": 1,
+                            },
+                            # Drain before SIGTERM so in-flight docks finish instead of being killed.
+                            "lifecycle": {"preStop": {"exec": {"command": PLANET_DRAIN_COMMAND}}},
                         }
-                    ]
+                    ],
+                    "volumes": [
+                        {"name": "planet-config", "configMap": {"name": PLANET_CONFIG_MAP, "optional": True}}
+                    ],
                 },
             },
         },
@@ -304,6 +363,30 @@ def _apply_resources(resources: List[Dict[str, Any]]) -> Tuple[str, str, bool]:
     return output, manifest, True
 
 
+def _push_one(service_name: str, body: bytes) -> str:
+    url = f"http://{service_name}.{NAMESPACE}:{SERVICE_PORT}/config"
+    request = urllib.request.Request(
+        url, data=body, method="PUT", headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=CONFIG_PUSH_TIMEOUT) as response:
+            payload = json.loads(response.read() or b"{}")
+    except (urllib.error.URLError, OSError, ValueError) as exc:
+        return f"{service_name} push failed ({exc}); the mounted ConfigMap will catch up"
+    restart = payload.get("restartRequired") or []
+    suffix = f"; restart needed for {', '.join(restart)}" if restart else ""
+    return f"{service_name} config revision {payload.get('revision')}{suffix}"
+
+
+def push_planet_config(env: List[Dict[str, str]], service_names: List[str]) -> List[str]:
+    """PUT the planet env to every planet's ``/config`` so changes apply within a second."""
+    if not service_names:
+        return []
+    body = json.dumps({item["name"]: item["value"] for item in env}).encode("utf-8")
+    with ThreadPoolExecutor(max_workers=min(16, len(service_names))) as pool:
+        return list(pool.map(lambda name: _push_one(name, body), service_names))
+
+
 def generate_apply_artifacts(config: Mapping[str, Any]) -> Dict[str, Any]:
     planets = normalize_planets(config.get("planets"))
     env = build_environment_variables(config, planets)
@@ -317,6 +400,7 @@ def generate_apply_artifacts(config: Mapping[str, Any]) -> Dict[str, Any]:
     services: List[Dict[str, Any]] = []
     jobs: List[Dict[str, Any]] = []
     httproutes: List[Dict[str, Any]] = []
+    push_targets: List[str] = []
     operation_msgs: List[str] = []
 
     if not planets:
@@ -331,9 +415,10 @@ def generate_apply_artifacts(config: Mapping[str, Any]) -> Dict[str, Any]:
                     deployment_name = f"{slug}-{variant}-deployment"
                     variant_service_name = f"{slug}-{variant}-service"
                     deployments.append(
-                        build_deployment(deployment_name, planet, env, shields_enabled, variant)
+                        build_deployment(deployment_name, planet, shields_enabled, variant)
                     )
                     services.append(build_variant_service(variant_service_name, planet, variant))
+                    push_targets.append(variant_service_name)
                 httproutes.append(
                     build_http_route(
                         f"{slug}-wormhole-route",
@@ -349,7 +434,8 @@ def generate_apply_artifacts(config: Mapping[str, Any]) -> Dict[str, Any]:
                 )
             else:
                 deployment_name = f"{slug}-deployment"
-                deployments.append(build_deployment(deployment_name, planet, env, shields_enabled))
+                deployments.append(build_deployment(deployment_name, planet, shields_enabled))
+                push_targets.append(service_name)
                 operation_msgs.append(f"Prepared deployment/service for planet '{planet.get('displayName', slug)}'.")
 
     if black_hole_enabled:
@@ -362,16 +448,21 @@ def generate_apply_artifacts(config: Mapping[str, Any]) -> Dict[str, Any]:
     manifest_yaml = ""
     workloads = deployments + services + jobs + httproutes
     resources: List[Dict[str, Any]] = []
+    config_push: List[str] = []
     if workloads:
-        resources = [build_namespace()] + workloads
+        resources = [build_namespace(), build_config_map(env)] + workloads
         kubectl_output, manifest_yaml, applied = _apply_resources(resources)
         operation_msgs.append(
             "Applied generated manifests." if applied else kubectl_output
         )
+        if applied and CONFIG_PUSH_ENABLED:
+            config_push = push_planet_config(env, push_targets)
+            operation_msgs.append(f"Pushed planet config to {len(config_push)} planet service(s).")
 
     return {
         "operations": operation_msgs,
         "environment": env,
         "kubectlOutput": kubectl_output,
         "manifestYaml": manifest_yaml,
+        "configPush": config_push,
     }